@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Compares services.html_text.html_to_text with markdownify on saved LinkedIn pages:
+time per job and the size of the text that would be sent to the LLM.
+
+Every job_<id>.html in the pages directory is converted together with its card from
+the search_*.html pages, the same pair build_listing converts. Any directory laid out
+for the replay backend works, e.g. pages saved from a real run.
+
+Before timing anything it checks that trim_job_text drops boilerplate sections and keeps
+job content under headings that only mention a boilerplate word (exits 1 if not).
+
+    python benchmarks/bench_html_text.py [--pages DIR] [--repeat N]
+"""
+import argparse
+import glob
+import os
+import statistics
+import sys
+import time
+from typing import List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from markdownify import markdownify as md
+
+from nav.backends.pages import parse_detail_page, parse_search_page
+from services.html_text import html_to_text
+from services.job_text import estimate_tokens, trim_job_text
+
+DEFAULT_PAGES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "pages")
+
+# (heading, whether its section is boilerplate that trim_job_text should drop) in a job at TRIM_COMPANY
+TRIM_COMPANY = "Acme"
+TRIM_CASES = [
+    ("## Benefits", True),
+    ("**Perks & Benefits**", True),
+    ("What's in it for you:", True),
+    ("**Why join Acme?**", True),
+    ("## About Acme", True),
+    ("About us:", True),
+    ("### Diversity & Inclusion", True),
+    ("Equal Opportunity Employer:", True),
+    ("Privacy Notice:", True),
+    ("How to apply:", True),
+    # job content whose heading mentions a boilerplate word
+    ("## About the Role", False),
+    ("About you:", False),
+    ("Requirements: experience with diversity and inclusion data pipelines:", False),
+    ("Privacy engineering experience:", False),
+    ("Inclusion criteria for clinical trials:", False),
+    ("Accommodation and hospitality sales:", False),
+    ("Benefits of the role to patients:", False),
+    ("**Benefits administration experience**", False),
+    ("How to apply machine learning to fraud detection:", False),
+    # "About ..." / "Why join ..." headings that introduce the job rather than the company
+    ("## About this role", False),
+    ("**About your role**", False),
+    ("About This Job:", False),
+    ("## About Our Team", False),
+    ("## About the Internship", False),
+    ("About the candidate:", False),
+    ("**Why join the engineering team?**", False),
+]
+
+
+def check_trimming() -> List[str]:
+    # headings whose section trim_job_text handles the wrong way
+    failures = []
+    for heading, boilerplate in TRIM_CASES:
+        text = f"Senior Data Engineer\n\n{heading}\nSECTION BODY\n\n## Responsibilities\nBuild pipelines"
+        trimmed = trim_job_text(text, max_tokens=0, company=TRIM_COMPANY)
+        if ("SECTION BODY" not in trimmed) != boilerplate or "Build pipelines" not in trimmed:
+            failures.append(f"{heading!r} should be {'dropped' if boilerplate else 'kept'}")
+    return failures
+
+
+def load_jobs(directory: str):
+    cards = {}
+    for path in glob.glob(os.path.join(directory, "search_*.html")):
+        with open(path, "r", encoding="utf-8") as f:
+            for card in parse_search_page(f.read(), "https://www.linkedin.com/"):
+                cards[card.job_id] = card.html
+
+    jobs = []
+    for path in sorted(glob.glob(os.path.join(directory, "job_*.html"))):
+        job_id = os.path.basename(path)[len("job_"):-len(".html")]
+        with open(path, "r", encoding="utf-8") as f:
+            jobs.append((cards.get(job_id, ""), parse_detail_page(f.read())))
+    return jobs
+
+
+def convert_markdownify(card_html: str, desc_html: str) -> str:
+    return f"{md(card_html, strip=['a'])}\n{md(desc_html, strip=['a'])}"
+
+
+def convert_html_text(card_html: str, desc_html: str) -> str:
+    return f"{html_to_text(card_html)}\n{html_to_text(desc_html)}"
+
+
+def bench(convert, jobs, repeat: int):
+    timings = []
+    for _ in range(repeat):
+        for card_html, desc_html in jobs:
+            start = time.perf_counter()
+            convert(card_html, desc_html)
+            timings.append(time.perf_counter() - start)
+
+    outputs = [convert(card_html, desc_html) for card_html, desc_html in jobs]
+    return {
+        "ms_per_job": statistics.mean(timings) * 1000,
+        "p95_ms": sorted(timings)[int(len(timings) * 0.95) - 1] * 1000,
+        "chars": statistics.mean(len(text) for text in outputs),
+        "tokens": statistics.mean(estimate_tokens(text) for text in outputs),
+        # what actually reaches the prompt after boilerplate stripping and the token budget
+        "prompt_tokens": statistics.mean(estimate_tokens(trim_job_text(text)) for text in outputs),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", default=DEFAULT_PAGES, help="directory of saved search_*.html / job_*.html pages")
+    parser.add_argument("--repeat", type=int, default=50, help="passes over the pages per converter")
+    args = parser.parse_args()
+
+    failures = check_trimming()
+    print(f"trimming check: {len(TRIM_CASES) - len(failures)}/{len(TRIM_CASES)} headings handled")
+    if failures:
+        print("\n".join(f"  {failure}" for failure in failures))
+        sys.exit(1)
+
+    jobs = load_jobs(args.pages)
+    if not jobs:
+        raise SystemExit(f"No job_*.html pages in {args.pages}")
+    print(f"{len(jobs)} jobs from {args.pages}, {args.repeat} passes")
+
+    results = {
+        "markdownify": bench(convert_markdownify, jobs, args.repeat),
+        "html_to_text": bench(convert_html_text, jobs, args.repeat),
+    }
+    print(f"{'converter':<14}{'ms/job':>10}{'p95 ms':>10}{'chars':>10}{'tokens':>10}{'prompt tok':>12}")
+    for name, r in results.items():
+        print(
+            f"{name:<14}{r['ms_per_job']:>10.2f}{r['p95_ms']:>10.2f}{r['chars']:>10.0f}"
+            f"{r['tokens']:>10.0f}{r['prompt_tokens']:>12.0f}"
+        )
+
+    base, new = results["markdownify"], results["html_to_text"]
+    print(
+        f"html_to_text is {base['ms_per_job'] / new['ms_per_job']:.1f}x faster and sends "
+        f"{1 - new['prompt_tokens'] / base['prompt_tokens']:.0%} fewer prompt tokens"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Times PDFExtractor serial vs process-pool page extraction on generated multi-page
+PDFs (dense text pages with compressed content streams, like exported CVs and
+portfolios) and checks both modes return the same text in the same order.
+
+    python benchmarks/bench_pdf_extract.py [--pages 2 16 64 200 --workers 4 --repeat 3]
+    python benchmarks/bench_pdf_extract.py --pdf portfolio.pdf
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pypdf import PdfWriter
+from pypdf.generic import DecodedStreamObject, DictionaryObject, NameObject
+
+from config import PDF_WORKERS
+from services.pdf_extractor import PDFExtractor
+
+WORDS = (
+    "python data pipeline cloud aws docker kubernetes analysis model training "
+    "stakeholder delivery project research university degree engineering software "
+    "team lead designed built improved reduced latency cost customers platform"
+).split()
+
+
+def make_pdf(path: str, pages: int, lines_per_page: int = 55, seed: int = 3) -> None:
+    rng = random.Random(seed)
+    writer = PdfWriter()
+    font = writer._add_object(DictionaryObject({
+        NameObject("/Type"): NameObject("/Font"),
+        NameObject("/Subtype"): NameObject("/Type1"),
+        NameObject("/BaseFont"): NameObject("/Helvetica"),
+    }))
+    for number in range(pages):
+        page = writer.add_blank_page(width=595, height=842)
+        ops = ["BT", "/F1 9 Tf", "11 TL", "40 800 Td", f"(Page {number + 1}) Tj"]
+        for _ in range(lines_per_page):
+            # one Tj per word, like most PDF exporters, so extraction has real layout work to do
+            ops.append("T*")
+            for word in rng.choices(WORDS, k=14):
+                ops.append(f"({word} ) Tj")
+        ops.append("ET")
+        stream = DecodedStreamObject()
+        stream.set_data("\n".join(ops).encode("latin-1"))
+        page[NameObject("/Contents")] = writer._add_object(stream.flate_encode())
+        page[NameObject("/Resources")] = DictionaryObject({
+            NameObject("/Font"): DictionaryObject({NameObject("/F1"): font}),
+        })
+    with open(path, "wb") as f:
+        writer.write(f)
+
+
+def bench(path: str, workers: int, repeat: int):
+    timings = []
+    text = ""
+    for _ in range(repeat):
+        start = time.perf_counter()
+        # parallel_min_pages=1 so the pool is used whatever the page count
+        extractor = PDFExtractor(path, workers=workers, parallel_min_pages=1)
+        extractor.load_pdf()
+        text = extractor.extract_text()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings), text
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, nargs="+", default=[2, 16, 64, 200], help="page counts to generate")
+    parser.add_argument("--pdf", help="benchmark this file instead of generated ones")
+    parser.add_argument("--workers", type=int, default=max(2, PDF_WORKERS))
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{os.cpu_count()} CPUs, {args.workers} workers, median of {args.repeat}")
+    print(f"{'document':<22}{'serial s':>10}{'pool s':>10}{'speedup':>9}  same text")
+    with tempfile.TemporaryDirectory(prefix="bench-pdf-") as workdir:
+        documents = [args.pdf] if args.pdf else []
+        for pages in [] if args.pdf else args.pages:
+            path = os.path.join(workdir, f"{pages}_pages.pdf")
+            make_pdf(path, pages)
+            documents.append(path)
+
+        for path in documents:
+            serial_s, serial_text = bench(path, 1, args.repeat)
+            pool_s, pool_text = bench(path, args.workers, args.repeat)
+            print(
+                f"{os.path.basename(path):<22}{serial_s:>10.3f}{pool_s:>10.3f}"
+                f"{serial_s / pool_s:>8.1f}x  {serial_text == pool_text}"
+            )
+
+
+if __name__ == "__main__":
+    main()
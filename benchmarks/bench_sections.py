@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Compares SectionProcessor.tokenise with the per-line heading detection it replaced
+(one fuzz.ratio call per short line and heading, regex rebuilt on every call) on a
+corpus of CV texts: time per CV and whether both produce the same sections.
+
+Every *.txt in the corpus directory is one CV, the text PDFExtractor would return;
+with --pdf the PDFs in a directory are extracted and added to the corpus.
+
+    python benchmarks/bench_sections.py [--cvs DIR] [--pdf DIR] [--repeat N]
+"""
+import argparse
+import glob
+import os
+import re
+import statistics
+import sys
+import time
+from typing import List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rapidfuzz import fuzz
+
+from services.pdf_extractor import PDFExtractor
+from services.text_processor import SectionProcessor
+
+DEFAULT_CVS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cvs")
+
+
+def baseline_tokenise(text: str) -> List[dict]:
+    # the previous implementation, with today's SEC_HEADINGS so only the algorithm differs
+    pattern = r"(" + r"|".join(SectionProcessor.SEC_HEADINGS) + r")"
+    headings = set(m.upper() for m in re.findall(pattern, text, flags=re.IGNORECASE))
+    if not headings:
+        return [{"heading": "MISC", "content": text.strip()}]
+
+    # computed and never used, as before
+    re.split(r"(" + r"|".join(re.escape(h) for h in headings) + r")", text, flags=re.IGNORECASE)
+
+    sections = []
+    current_heading, current_content = "MISC", []
+    for line in text.splitlines():
+        stripped_line = line.strip()
+        if not stripped_line:
+            current_content.append(line)
+            continue
+        line_upper = stripped_line.upper()
+        fuzzy = len(stripped_line.split()) <= 5 and any(
+            fuzz.ratio(stripped_line.lower(), h.lower()) > 80 for h in headings
+        )
+        if line_upper in headings or fuzzy:
+            if current_content:
+                sections.append({"heading": current_heading, "content": "\n".join(current_content).strip()})
+                current_content = []
+            current_heading = line_upper
+        else:
+            current_content.append(line)
+    if current_content:
+        sections.append({"heading": current_heading, "content": "\n".join(current_content).strip()})
+    return [sec for sec in sections if sec["content"]]
+
+
+def load_corpus(cv_dir: str, pdf_dir: str = None) -> List[tuple]:
+    corpus = []
+    for path in sorted(glob.glob(os.path.join(cv_dir, "*.txt"))):
+        with open(path, "r", encoding="utf-8") as f:
+            corpus.append((os.path.basename(path), f.read()))
+    for path in sorted(glob.glob(os.path.join(pdf_dir, "*.pdf"))) if pdf_dir else []:
+        extractor = PDFExtractor(path)
+        extractor.load_pdf()
+        corpus.append((os.path.basename(path), extractor.extract_text()))
+    return corpus
+
+
+def bench(tokenise, text: str, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        tokenise(text)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cvs", default=DEFAULT_CVS, help="directory of CV texts (*.txt)")
+    parser.add_argument("--pdf", help="directory of CV PDFs to extract and add")
+    parser.add_argument("--repeat", type=int, default=200, help="runs per CV and implementation")
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.cvs, args.pdf)
+    if not corpus:
+        raise SystemExit(f"No CVs in {args.cvs}")
+
+    processor = SectionProcessor()
+    print(f"{'cv':<36}{'lines':>7}{'sections':>10}{'before ms':>11}{'after ms':>10}{'speedup':>9}  same")
+    speedups = []
+    for name, text in corpus:
+        expected = baseline_tokenise(text)
+        sections = processor.tokenise(text)
+        before = bench(baseline_tokenise, text, args.repeat)
+        after = bench(processor.tokenise, text, args.repeat)
+        speedups.append(before / after)
+        print(
+            f"{name:<36}{len(text.splitlines()):>7}{len(sections):>10}{before:>11.3f}{after:>10.3f}"
+            f"{before / after:>8.1f}x  {sections == expected}"
+        )
+    print(f"median speedup {statistics.median(speedups):.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Cold start of main.py, each measured in a fresh interpreter:
+
+  help          `main.py --help`, interpreter start + module imports + argparse
+  first fetch   `main.py cv.pdf --backend http` with the CV profile already cached, until the
+                first request reaches the LinkedIn stand-in (time to first useful work)
+
+and which heavy libraries main.py imports before doing anything. A run with a timing over
+its target exits with status 1, so the script can gate a change that regresses startup.
+
+    python benchmarks/bench_startup.py [--repeat N] [--help-target S] [--fetch-target S]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, ROOT)
+sys.path.insert(0, BENCH_DIR)
+
+from pypdf import PdfWriter
+
+from fake_linkedin import FakeLinkedIn
+from fake_llm import FakeLLM
+from models.cv_profile import CVProfile
+from services.profile_cache import ProfileCache
+
+MAIN = os.path.join(ROOT, "main.py")
+
+# seconds, median over the repeats
+HELP_TARGET = 0.3
+FIRST_FETCH_TARGET = 0.8
+
+# libraries none of which main.py should import at startup, each is loaded by the stage using it
+HEAVY_MODULES = ["selenium", "chromedriver_autoinstaller", "httpx", "openai", "langchain", "nltk", "pypdf", "numpy", "rapidfuzz"]
+
+PROFILE = CVProfile(
+    name="Alex Bench",
+    level="entry",
+    location="London",
+    discipline="Software Engineer",
+    secondary_discipline="Data Engineer",
+    school="King's College London",
+    qual="BSc",
+    experience="1",
+    skills="Python, SQL, Java, Docker, AWS, Git, Linux",
+)
+
+
+def write_cv(workdir: str) -> str:
+    # only the content hash matters, the profile for it is seeded into the cache
+    pdf_path = os.path.join(workdir, "cv.pdf")
+    writer = PdfWriter()
+    writer.add_blank_page(width=595, height=842)
+    writer.add_metadata({"/Title": "bench_startup"})
+    with open(pdf_path, "wb") as f:
+        writer.write(f)
+
+    # main.py runs with workdir as its cwd, so this is the output/ cache it reads
+    cache = ProfileCache(path=os.path.join(workdir, "output", "profile_cache.sqlite3"))
+    sha = ProfileCache.hash_pdf(pdf_path)
+    cache.set(ProfileCache.make_key(sha), sha, [{"heading": "SKILLS", "content": PROFILE.skills}], PROFILE)
+    cache.close()
+    return pdf_path
+
+
+def time_help(env: dict) -> float:
+    started = time.perf_counter()
+    subprocess.run([sys.executable, MAIN, "--help"], env=env, stdout=subprocess.DEVNULL, check=True)
+    return time.perf_counter() - started
+
+
+def time_first_fetch(pdf_path: str, linkedin: FakeLinkedIn, workdir: str, env: dict) -> float:
+    linkedin.first_request_at = None
+    started = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, MAIN, pdf_path, "--backend", "http", "--base-url", linkedin.base_url,
+         "--recheck-seen", "--metrics", ""],
+        cwd=workdir,
+        env=env,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        while linkedin.first_request_at is None:
+            if proc.poll() is not None:
+                raise SystemExit(f"main.py exited with {proc.returncode} before fetching anything")
+            time.sleep(0.002)
+        return linkedin.first_request_at - started
+    finally:
+        # the rest of the run isn't measured
+        proc.kill()
+        proc.wait()
+
+
+def heavy_imports(env: dict) -> list:
+    code = (
+        "import sys; sys.argv = ['main.py']; sys.path.insert(0, %r); import main; "
+        "print(' '.join(m for m in %r if m in sys.modules))" % (ROOT, HEAVY_MODULES)
+    )
+    out = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True)
+    return out.stdout.split()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=7, help="fresh interpreters per measurement")
+    parser.add_argument("--help-target", type=float, default=HELP_TARGET, help="seconds, median")
+    parser.add_argument("--fetch-target", type=float, default=FIRST_FETCH_TARGET, help="seconds, median")
+    args = parser.parse_args()
+
+    linkedin = FakeLinkedIn(jobs=50).start()
+    llm = FakeLLM(latency_ms=0).start()
+    env = dict(os.environ, DEEPSEEK_API_KEY="bench", DEEPSEEK_BASE_URL=llm.base_url)
+    try:
+        with tempfile.TemporaryDirectory(prefix="bench_startup_") as workdir:
+            pdf_path = write_cv(workdir)
+            # one untimed run of each so the timings don't include a cold disk cache
+            time_help(env)
+            time_first_fetch(pdf_path, linkedin, workdir, env)
+
+            help_times = [time_help(env) for _ in range(args.repeat)]
+            fetch_times = [time_first_fetch(pdf_path, linkedin, workdir, env) for _ in range(args.repeat)]
+            loaded = heavy_imports(env)
+    finally:
+        linkedin.stop()
+        llm.stop()
+
+    ok = True
+    print(f"{'':<14}{'median s':>10}{'min s':>8}{'max s':>8}{'target s':>10}")
+    for label, timings, target in (
+        ("help", help_times, args.help_target),
+        ("first fetch", fetch_times, args.fetch_target),
+    ):
+        median = statistics.median(timings)
+        ok &= median <= target
+        print(
+            f"{label:<14}{median:>10.3f}{min(timings):>8.3f}{max(timings):>8.3f}{target:>10.2f}"
+            f"  {'ok' if median <= target else 'OVER TARGET'}"
+        )
+    print(f"heavy modules imported by main.py: {', '.join(loaded) or 'none'}")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
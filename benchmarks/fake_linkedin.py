@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the parts of LinkedIn the scraper touches, for offline benchmarks.
+
+Serves a generated corpus of jobs with the markup the backends rely on:
+  /login, /feed/                   login form (#username, #password) and a page with .artdeco-card
+  /jobs/search/?keywords=&start=   JOBS_PER_PAGE li[data-occludable-job-id] cards inside
+                                   .jobs-search-results-list, "No matching jobs found." past the end;
+                                   clicking a card loads its .jobs-description into the details pane
+  /jobs/view/<id>/                 job page with the .jobs-description panel
+
+Every query sees the same corpus, so a multi-query run exercises cross-query dedup.
+
+    python benchmarks/fake_linkedin.py --jobs 500 --port 8765 --latency-ms 50
+    python main.py cv.pdf --backend http --base-url http://127.0.0.1:8765/
+"""
+import argparse
+import html
+import os
+import random
+import re
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List
+from urllib.parse import parse_qs, urlparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import JOBS_PER_PAGE
+
+TITLES = [
+    "Graduate Software Engineer", "Junior Data Engineer", "Graduate Machine Learning Engineer",
+    "Backend Developer", "Junior Frontend Developer", "Data Analyst", "DevOps Engineer",
+    "Graduate Financial Analyst", "Marketing Executive", "Senior Platform Engineer",
+    "QA Automation Engineer", "Junior Cloud Engineer", "Research Scientist", "IT Support Analyst",
+]
+COMPANIES = [
+    "Acme Analytics", "Northwind Energy", "Helix Health", "Bluefin Bank", "Orbital Games",
+    "Quarry Logistics", "Lumen Retail", "Tidewater Insurance", "Kestrel Robotics", "Pioneer Media",
+]
+LOCATIONS = [
+    "London, England, United Kingdom", "Manchester, England, United Kingdom",
+    "Leeds, England, United Kingdom", "Bristol, England, United Kingdom", "Edinburgh, Scotland, United Kingdom",
+]
+WORKPLACES = ["Hybrid", "On-site", "Remote"]
+SKILLS = [
+    "Python", "SQL", "Java", "Go", "C++", "TypeScript", "React", "AWS", "Docker", "Kubernetes",
+    "Spark", "Airflow", "PyTorch", "Terraform", "Linux", "Git", "Excel", "Tableau",
+]
+
+CARD = """<li class="ember-view jobs-search-results__list-item occludable-update p0 relative scaffold-layout__list-item" data-occludable-job-id="{id}">
+<div><div class="job-card-container relative job-card-list job-card-container--clickable" data-job-id="{id}">
+<div class="job-card-list__entity-lockup artdeco-entity-lockup artdeco-entity-lockup--size-4 ember-view">
+<div class="job-card-list__logo artdeco-entity-lockup__image"><img width="56" height="56" src="/static/logo.png" alt="{company} logo"></div>
+<div class="artdeco-entity-lockup__content ember-view">
+<div class="full-width artdeco-entity-lockup__title ember-view"><a class="disabled ember-view job-card-container__link job-card-list__title--link" aria-label="{title}" href="/jobs/view/{id}/?refId=bench&amp;trk=flagship3_search_srp_jobs"><span aria-hidden="true"><strong><!---->{title}<!----></strong></span><span class="visually-hidden"><!---->{title}<!----></span></a></div>
+<div class="artdeco-entity-lockup__subtitle ember-view"><span class="job-card-container__primary-description">{company}</span></div>
+<div class="artdeco-entity-lockup__caption ember-view"><ul class="job-card-container__metadata-wrapper"><li class="job-card-container__metadata-item"><!---->{location} ({workplace})<!----></li></ul></div>
+</div></div>
+<ul class="job-card-list__footer-wrapper"><li class="job-card-container__footer-item">Promoted</li><li class="job-card-container__footer-item"><li-icon type="linkedin-bug" size="small"><svg viewBox="0 0 16 16" width="16" height="16"><path d="M14 0H2a2 2 0 00-2 2v12a2 2 0 002 2h12"></path></svg></li-icon>Easy Apply</li></ul>
+</div></div></li>"""
+
+DESCRIPTION = """<div class="jobs-box--fadein jobs-box--full-width jobs-description jobs-description--reformatted job-details-module">
+<div class="jobs-description__content jobs-description-content"><div class="jobs-box__html-content" id="job-details" tabindex="-1">
+<h2 class="text-heading-large">About the job</h2>
+<div class="mt4"><p dir="ltr"><span><!---->{company} is hiring a <strong>{title}</strong> to join the team in {city}.<!----></span></p><p><span><br></span></p>
+<p dir="ltr"><span><strong><!---->What you'll do<!----></strong></span></p>
+<ul>{duties}</ul>
+<p dir="ltr"><span><strong><!---->What we're looking for<!----></strong></span></p>
+<ul><li><span><!---->A degree in {degree} or a related subject<!----></span></li><li><span><!---->{years} experience<!----></span></li>{requirements}</ul>
+<p dir="ltr"><span><strong><!---->Benefits<!----></strong></span></p>
+<ul><li><span><!---->£{salary},000 base salary<!----></span></li><li><span><!---->25 days holiday plus bank holidays<!----></span></li><li><span><!---->{workplace} working<!----></span></li></ul>
+<p dir="ltr"><span><!---->{company} is an equal opportunity employer and does not discriminate on the basis of race, religion, gender, sexual orientation, age or disability. Reasonable accommodation is available on request.<!----></span></p>
+</div></div></div>
+<div class="jobs-description__details"><button class="jobs-description__footer-button artdeco-button artdeco-button--tertiary" aria-label="Click to see less description" type="button"><span class="artdeco-button__text">See less</span></button></div>
+</div>"""
+
+SEARCH_PAGE = """<!DOCTYPE html>
+<html lang="en"><head><meta charset="utf-8"><title>{query} jobs | LinkedIn</title></head>
+<body><div class="scaffold-layout__list">
+<div class="jobs-search-results-list"><ul class="scaffold-layout__list-container">
+{cards}
+</ul></div>
+<div class="jobs-search__job-details"></div>
+</div>
+<script>
+// clicking a card loads its job page and moves the description (and the job link) into the details pane
+document.addEventListener('click', async (event) => {{
+  const li = event.target.closest('li[data-occludable-job-id]');
+  if (!li) return;
+  const id = li.getAttribute('data-occludable-job-id');
+  const page = await (await fetch('/jobs/view/' + id + '/')).text();
+  const doc = new DOMParser().parseFromString(page, 'text/html');
+  const pane = document.querySelector('.jobs-search__job-details');
+  pane.innerHTML = '';
+  pane.appendChild(doc.querySelector('.job-details-top-card'));
+  pane.appendChild(doc.querySelector('.jobs-description'));
+}});
+</script></body></html>"""
+
+JOB_PAGE = """<!DOCTYPE html>
+<html lang="en"><head><meta charset="utf-8"><title>{title} | {company} | LinkedIn</title></head>
+<body><div class="jobs-search__job-details">
+<div class="job-details-top-card"><a href="/jobs/view/{id}/">{title}</a> <span>{company}</span> <span>{location}</span></div>
+{description}
+</div></body></html>"""
+
+NO_JOBS_PAGE = """<!DOCTYPE html><html><body><div class="jobs-search-no-results-banner">
+<h2>No matching jobs found.</h2></div></body></html>"""
+
+LOGIN_PAGE = """<!DOCTYPE html><html><body><form action="/feed/" method="get">
+<input id="username" name="session_key"><input id="password" name="session_password" type="password">
+<button type="submit">Sign in</button></form></body></html>"""
+
+FEED_PAGE = """<!DOCTYPE html><html><body><div class="artdeco-card">Feed</div></body></html>"""
+
+
+def make_corpus(jobs: int, seed: int = 7) -> List[Dict[str, str]]:
+    """
+    Deterministic fake jobs, each with its card and job page HTML.
+    """
+    rng = random.Random(seed)
+    corpus = []
+    for n in range(jobs):
+        job_id = str(3_900_000_000 + n)
+        title = rng.choice(TITLES)
+        company = rng.choice(COMPANIES)
+        location = rng.choice(LOCATIONS)
+        workplace = rng.choice(WORKPLACES)
+        skills = rng.sample(SKILLS, 6)
+        fields = {
+            "id": job_id,
+            "title": html.escape(title),
+            "company": html.escape(company),
+            "location": html.escape(location),
+            "workplace": workplace,
+        }
+        description = DESCRIPTION.format(
+            company=fields["company"],
+            title=fields["title"],
+            city=location.split(",")[0],
+            duties="".join(
+                f"<li><span><!---->Build and maintain {skill} services with the rest of the team<!----></span></li>"
+                for skill in skills[:3]
+            ),
+            requirements="".join(
+                f"<li><span><!---->Experience with {skill}<!----></span></li>" for skill in skills[3:]
+            ),
+            degree=rng.choice(["Computer Science", "Mathematics", "Physics", "Engineering", "Economics"]),
+            years=rng.choice(["No prior", "1+ years of", "2+ years of", "5+ years of"]),
+            salary=rng.randint(28, 90),
+            workplace=workplace,
+        )
+        corpus.append({
+            "id": job_id,
+            "card": CARD.format(**fields),
+            "page": JOB_PAGE.format(description=description, **fields),
+        })
+    return corpus
+
+
+class FakeLinkedIn:
+    """
+    Threaded HTTP server over a make_corpus() corpus, `latency_ms` is added to every response.
+    """
+
+    def __init__(self, jobs: int = 200, latency_ms: float = 0.0, host: str = "127.0.0.1", port: int = 0):
+        self.corpus = make_corpus(jobs)
+        self.by_id = {job["id"]: job for job in self.corpus}
+        self.latency = latency_ms / 1000
+        self.requests = 0
+        # time.perf_counter() of the first request served, for startup benchmarks (reset it between runs)
+        self.first_request_at = None
+        self._lock = threading.Lock()
+        self.server = ThreadingHTTPServer((host, port), self._handler())
+        self.server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def _handler(self):
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                with stand_in._lock:
+                    stand_in.requests += 1
+                    if stand_in.first_request_at is None:
+                        stand_in.first_request_at = time.perf_counter()
+                if stand_in.latency:
+                    time.sleep(stand_in.latency)
+                status, body = stand_in.route(self.path)
+                payload = body.encode("utf-8")
+                try:
+                    self.send_response(status)
+                    self.send_header("Content-Type", "text/html; charset=utf-8")
+                    self.send_header("Content-Length", str(len(payload)))
+                    self.end_headers()
+                    self.wfile.write(payload)
+                except (BrokenPipeError, ConnectionResetError):
+                    # the client went away mid-response, e.g. bench_startup.py killing main.py
+                    pass
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def route(self, path: str):
+        url = urlparse(path)
+        if url.path == "/login":
+            return 200, LOGIN_PAGE
+        if url.path.startswith("/feed"):
+            return 200, FEED_PAGE
+        if url.path.rstrip("/") == "/jobs/search":
+            params = parse_qs(url.query)
+            start = int(params.get("start", ["0"])[0])
+            jobs = self.corpus[start:start + JOBS_PER_PAGE]
+            if not jobs:
+                return 200, NO_JOBS_PAGE
+            query = html.escape(params.get("keywords", [""])[0])
+            return 200, SEARCH_PAGE.format(query=query, cards="\n".join(job["card"] for job in jobs))
+        match = re.match(r"^/jobs/view/(\d+)/?$", url.path)
+        if match and match.group(1) in self.by_id:
+            return 200, self.by_id[match.group(1)]["page"]
+        return 404, "<html><body>Not found</body></html>"
+
+    def start(self) -> "FakeLinkedIn":
+        self._thread = threading.Thread(target=self.server.serve_forever, name="fake-linkedin", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--jobs", type=int, default=200, help="number of jobs in the corpus")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="delay added to every response")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    stand_in = FakeLinkedIn(jobs=args.jobs, latency_ms=args.latency_ms, port=args.port)
+    print(f"Serving {args.jobs} jobs at {stand_in.base_url}")
+    try:
+        stand_in.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
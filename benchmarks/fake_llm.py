@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+Fake OpenAI-compatible chat completions endpoint for offline benchmarks.
+
+Answers the three prompts the app sends:
+  CVProfileFiller  a fixed CV profile as JSON
+  check_job        {"match": ..., "confidence": ...}
+  check_jobs       [{"id": n, "match": ..., "confidence": ...}, ...], one per "### JOB <n>" section
+
+Verdicts are a stable hash of the job text, so reruns agree and `match_rate` of jobs match.
+FAST_MODELS (the cascade's first tier) answer every job with a confidence from the same hash,
+and get the verdict wrong on the jobs they are least confident about; other models are always
+right and sure, and spend `reasoning_tokens` of output per job thinking.
+Every response waits `latency_ms` (`fast_latency_ms` for FAST_MODELS, + up to `jitter_ms`), is
+cut to the request's max_tokens, and reports token usage like DeepSeek,
+including its prefix cache: the part of a request that starts exactly like an earlier one
+(in CACHE_UNIT_CHARS steps) comes back as prompt_cache_hit_tokens, the rest as misses.
+Like a real API it can push back: over `rate_limit_rpm` requests in the last minute get a 429
+with Retry-After, and `error_rate` of the others a 503.
+
+    python benchmarks/fake_llm.py --port 8766 --latency-ms 800
+    DEEPSEEK_BASE_URL=http://127.0.0.1:8766 DEEPSEEK_API_KEY=x python main.py cv.pdf ...
+"""
+import argparse
+import collections
+import hashlib
+import json
+import math
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Optional
+
+PROFILE = {
+    "name": "Alex Bench",
+    "level": "entry",
+    "location": "London",
+    "discipline": "Computer Science",
+    "secondary_discipline": "Software Engineer",
+    "grade": "2:1",
+    "school": "King's College London",
+    "qual": "BSc",
+    "skills": "Python, SQL, Java, Docker, AWS, Git, Linux, PyTorch",
+    "experience": 1,
+    "s_info": "British citizen, no sponsorship required.",
+}
+
+JOB_HEADER = re.compile(r"^### JOB (\d+)\s*$", re.MULTILINE)
+SINGLE_JOB_MARKER = "And here is the job listing:"
+CV_PROMPT_MARKER = "Please return the JSON object with all required fields"
+# DeepSeek caches prompt prefixes in 64 token units, ~4 characters each
+CACHE_UNIT_CHARS = 256
+FAST_MODELS = {"deepseek-chat"}
+# a fast model's confidence is 0.55-1.0, it gets the verdict wrong below this one
+FAST_WRONG_BELOW = 0.72
+
+
+def _verdict(job_text: str, match_rate: float, model: str) -> dict:
+    # the same listing gets the same verdict whether it was sent alone or in a batch
+    digest = hashlib.sha256(" ".join(job_text.split()).encode("utf-8")).digest()
+    match = int.from_bytes(digest[:4], "big") / 2**32 < match_rate
+    if model not in FAST_MODELS:
+        return {"match": str(match), "confidence": 0.95}
+    confidence = round(0.55 + 0.45 * (int.from_bytes(digest[4:8], "big") / 2**32) ** 0.5, 2)
+    if confidence < FAST_WRONG_BELOW:
+        match = not match
+    return {"match": str(match), "confidence": confidence}
+
+
+def answer(prompt: str, match_rate: float, model: str = "deepseek-reasoner") -> str:
+    if CV_PROMPT_MARKER in prompt:
+        return json.dumps(PROFILE)
+
+    sections = JOB_HEADER.split(prompt)
+    if len(sections) > 1:
+        # [preamble, id, text, id, text, ...]
+        verdicts: List[dict] = [
+            {"id": int(job_id), **_verdict(text, match_rate, model)}
+            for job_id, text in zip(sections[1::2], sections[2::2])
+        ]
+        return "```json\n" + json.dumps(verdicts) + "\n```"
+
+    job_text = prompt.split(SINGLE_JOB_MARKER, 1)[-1]
+    return json.dumps(_verdict(job_text, match_rate, model))
+
+
+class PrefixCache:
+    """
+    Every request prefix seen so far, in CACHE_UNIT_CHARS steps; entries never expire.
+    """
+
+    def __init__(self):
+        self._seen = set()
+        self._lock = threading.Lock()
+
+    def lookup(self, request_text: str) -> int:
+        # how many leading characters an earlier request already had, then remembers this one's prefixes
+        data = request_text.encode("utf-8")
+        digest = hashlib.sha256()
+        keys = []
+        for end in range(CACHE_UNIT_CHARS, len(data) + 1, CACHE_UNIT_CHARS):
+            digest.update(data[end - CACHE_UNIT_CHARS:end])
+            keys.append(digest.digest())
+
+        hits = 0
+        with self._lock:
+            for key in keys:
+                if key not in self._seen:
+                    break
+                hits += CACHE_UNIT_CHARS
+            self._seen.update(keys)
+        return hits
+
+
+class FakeLLM:
+    """
+    Threaded HTTP server for POST /chat/completions (and /v1/chat/completions).
+    """
+
+    def __init__(
+        self,
+        latency_ms: float = 500.0,
+        jitter_ms: float = 0.0,
+        match_rate: float = 0.3,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        fast_latency_ms: Optional[float] = None,
+        reasoning_tokens: int = 0,
+        rate_limit_rpm: float = 0,
+        error_rate: float = 0.0,
+    ):
+        self.latency = latency_ms / 1000
+        self.fast_latency = self.latency if fast_latency_ms is None else fast_latency_ms / 1000
+        self.jitter = jitter_ms / 1000
+        self.match_rate = match_rate
+        self.reasoning_tokens = reasoning_tokens
+        self.rate_limit_rpm = rate_limit_rpm
+        self.error_rate = error_rate
+        self.requests = 0
+        # requests answered with a 429 / a 503
+        self.rate_limited = 0
+        self.errors = 0
+        self._accepted = collections.deque()
+        self.prefix_cache = PrefixCache()
+        self._lock = threading.Lock()
+        self.server = ThreadingHTTPServer((host, port), self._handler())
+        self.server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _handler(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                if self.path.rstrip("/") not in ("/chat/completions", "/v1/chat/completions"):
+                    self.send_error(404)
+                    return
+                request = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+                prompt = "\n".join(str(m.get("content", "")) for m in request.get("messages", []))
+
+                with fake._lock:
+                    fake.requests += 1
+                    retry_after = fake._over_limit()
+                    if retry_after is not None:
+                        fake.rate_limited += 1
+                    elif random.random() < fake.error_rate:
+                        fake.errors += 1
+                        retry_after = -1.0
+                if retry_after is not None:
+                    self._refuse(retry_after)
+                    return
+
+                model = request.get("model", "deepseek-chat")
+                latency = fake.fast_latency if model in FAST_MODELS else fake.latency
+                time.sleep(latency + random.uniform(0, fake.jitter))
+
+                content = answer(prompt, fake.match_rate, model)
+                completion_tokens = len(content) // 4 + 1
+                if model not in FAST_MODELS and CV_PROMPT_MARKER not in prompt:
+                    completion_tokens += fake.reasoning_tokens * max(1, len(JOB_HEADER.findall(prompt)))
+                if request.get("max_tokens") and completion_tokens > request["max_tokens"]:
+                    completion_tokens = request["max_tokens"]
+                    content = content[:completion_tokens * 4]
+                prompt_tokens = len(prompt) // 4 + 1
+                # the message list as sent (roles and order included) is what the prefix has to match
+                cached_tokens = min(fake.prefix_cache.lookup(json.dumps(request.get("messages", []))) // 4, prompt_tokens)
+                body = json.dumps({
+                    "id": f"chatcmpl-bench-{fake.requests}",
+                    "object": "chat.completion",
+                    "created": int(time.time()),
+                    "model": model,
+                    "choices": [{
+                        "index": 0,
+                        "message": {"role": "assistant", "content": content},
+                        "finish_reason": "stop",
+                    }],
+                    "usage": {
+                        "prompt_tokens": prompt_tokens,
+                        "completion_tokens": completion_tokens,
+                        "total_tokens": prompt_tokens + completion_tokens,
+                        "prompt_cache_hit_tokens": cached_tokens,
+                        "prompt_cache_miss_tokens": prompt_tokens - cached_tokens,
+                        "prompt_tokens_details": {"cached_tokens": cached_tokens},
+                    },
+                }).encode("utf-8")
+
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _refuse(self, retry_after: float):
+                if retry_after < 0:
+                    status, message = 503, "Service is too busy, please try again later"
+                else:
+                    status, message = 429, "Rate limit reached for requests"
+                body = json.dumps({"error": {"message": message, "type": "rate_limit_error", "code": status}}).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                if status == 429:
+                    self.send_header("Retry-After", str(math.ceil(retry_after)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def _over_limit(self) -> Optional[float]:
+        # sliding one minute window, called with the lock held: seconds until a slot frees up, or None
+        if self.rate_limit_rpm <= 0:
+            return None
+        now = time.monotonic()
+        while self._accepted and now - self._accepted[0] >= 60:
+            self._accepted.popleft()
+        if len(self._accepted) >= self.rate_limit_rpm:
+            return 60 - (now - self._accepted[0])
+        self._accepted.append(now)
+        return None
+
+    def start(self) -> "FakeLLM":
+        self._thread = threading.Thread(target=self.server.serve_forever, name="fake-llm", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--latency-ms", type=float, default=500.0, help="time every response takes")
+    parser.add_argument("--fast-latency-ms", type=float, help="response time of FAST_MODELS, default: --latency-ms")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="random extra latency, uniform in [0, jitter]")
+    parser.add_argument("--reasoning-tokens", type=int, default=0, help="extra output tokens per job for other models")
+    parser.add_argument("--match-rate", type=float, default=0.3, help="fraction of jobs answered as a match")
+    parser.add_argument("--rate-limit-rpm", type=float, default=0, help="requests a minute before 429s, 0 for none")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests answered with a 503")
+    parser.add_argument("--port", type=int, default=8766)
+    args = parser.parse_args()
+
+    fake = FakeLLM(
+        args.latency_ms,
+        args.jitter_ms,
+        args.match_rate,
+        port=args.port,
+        fast_latency_ms=args.fast_latency_ms,
+        reasoning_tokens=args.reasoning_tokens,
+        rate_limit_rpm=args.rate_limit_rpm,
+        error_rate=args.error_rate,
+    )
+    print(f"Fake LLM at {fake.base_url}")
+    try:
+        fake.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
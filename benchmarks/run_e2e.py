@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+Offline end-to-end benchmark: CV profile -> search -> fetch -> prefilter -> LLM -> results,
+against fake_linkedin.FakeLinkedIn and fake_llm.FakeLLM started in this process.
+
+Reports jobs/minute, the run's METRICS (latency percentiles per stage, tokens, estimated cost)
+and peak RSS, optionally as JSON so runs with different configs (or commits) can be compared.
+
+    python benchmarks/run_e2e.py --jobs 300 --workers 8 --batch-size 4
+    python benchmarks/run_e2e.py --backend http --shards 4 --llm-latency-ms 1500 --json out.json
+    python benchmarks/run_e2e.py --candidates 8  # page requests stay flat, LLM calls grow
+    python benchmarks/run_e2e.py --cascade --min-confidence 0.7  # fast model first, see the escalation rate
+    python benchmarks/run_e2e.py --workers 16 --server-rpm 120 --llm-error-rate 0.05  # 429s and 503s, retried
+    python benchmarks/run_e2e.py --workers 16 --server-rpm 120 --llm-rpm 110  # paced under the quota instead
+    python benchmarks/run_e2e.py --rematch  # then match the stored corpus against a changed CV, offline
+"""
+import argparse
+import dataclasses
+import json
+import os
+import resource
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+sys.path.insert(0, BENCH_DIR)
+
+from config import CASCADE_MIN_CONFIDENCE, EVAL_WORKERS, EVAL_BATCH_SIZE, HTTP_CONCURRENCY, PREFILTER_THRESHOLD
+from fake_linkedin import FakeLinkedIn
+from fake_llm import FakeLLM
+from services.metrics import METRICS
+
+SAMPLE_CV = """
+Alex Bench
+London, United Kingdom
+EDUCATION
+King's College London, BSc Computer Science, 2:1
+EXPERIENCE
+Software Engineering Intern, Acme Analytics - built Python data pipelines on AWS
+SKILLS
+Python, SQL, Java, Docker, AWS, Git, Linux, PyTorch
+"""
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--jobs", type=int, default=200, help="jobs served by the fake LinkedIn")
+    parser.add_argument("--backend", choices=["http", "selenium"], default="http")
+    parser.add_argument("--shards", type=int, default=1)
+    parser.add_argument("--candidates", type=int, default=1, help="CV variants matched against the one crawl")
+    parser.add_argument("--http-concurrency", type=int, default=HTTP_CONCURRENCY)
+    parser.add_argument("--workers", type=int, default=EVAL_WORKERS)
+    parser.add_argument("--batch-size", type=int, default=EVAL_BATCH_SIZE)
+    parser.add_argument("--min-score", type=float, default=PREFILTER_THRESHOLD)
+    parser.add_argument("--keywords", nargs="+", help="search keywords, default: from the CV profile")
+    parser.add_argument("--page-latency-ms", type=float, default=20.0, help="fake LinkedIn response time")
+    parser.add_argument("--llm-latency-ms", type=float, default=300.0, help="fake LLM response time")
+    parser.add_argument("--llm-jitter-ms", type=float, default=100.0)
+    parser.add_argument("--fast-latency-ms", type=float, default=80.0, help="fake LLM response time of the fast model")
+    parser.add_argument(
+        "--reasoning-tokens", type=int, default=300, help="output tokens the fake reasoner spends per job thinking"
+    )
+    parser.add_argument("--cascade", action="store_true", help="fast model first, unsure verdicts escalated")
+    parser.add_argument("--min-confidence", type=float, default=CASCADE_MIN_CONFIDENCE)
+    parser.add_argument("--match-rate", type=float, default=0.3)
+    parser.add_argument("--server-rpm", type=float, default=0, help="fake LLM answers 429 over this many requests a minute")
+    parser.add_argument("--llm-error-rate", type=float, default=0.0, help="fraction of fake LLM requests answered with a 503")
+    parser.add_argument("--llm-rpm", type=float, default=0, help="client side request limit, 0 for none")
+    parser.add_argument("--llm-tpm", type=float, default=0, help="client side token limit, 0 for none")
+    parser.add_argument(
+        "--rematch",
+        action="store_true",
+        help="after the crawl, match the job corpus it stored against a CV with other skills (rematch.py)",
+    )
+    parser.add_argument("--json", help="also write the report to this file")
+    return parser.parse_args()
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is KiB on Linux and bytes on macOS; children covers crawl shards
+    scale = 1 / 1024 / 1024 if sys.platform == "darwin" else 1 / 1024
+    self_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+    children_rss = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss * scale
+    return round(max(self_rss, children_rss), 1)
+
+
+def run(args: argparse.Namespace, workdir: str) -> dict:
+    linkedin = FakeLinkedIn(jobs=args.jobs, latency_ms=args.page_latency_ms).start()
+    llm = FakeLLM(
+        args.llm_latency_ms,
+        args.llm_jitter_ms,
+        args.match_rate,
+        fast_latency_ms=args.fast_latency_ms,
+        reasoning_tokens=args.reasoning_tokens,
+        rate_limit_rpm=args.server_rpm,
+        error_rate=args.llm_error_rate,
+    ).start()
+    os.environ["DEEPSEEK_API_KEY"] = "bench"
+    os.environ["DEEPSEEK_BASE_URL"] = llm.base_url
+
+    # imported after the environment points at the fakes
+    from conversation_interface import CVProfileFiller
+    from nav.backends import HttpBackend, SeleniumBackend
+    from nav.conversation_llm_cv import JobChecker
+    from nav.navigation import LinkedInJobScraper
+    from models.candidate import Candidate
+    from nav.search_plan import plan_shared_queries
+    from services.checkpoint import CrawlCheckpoint
+    from services.job_corpus import JobCorpus
+    from services.relevance import RelevanceFilter
+    from services.llm_client import LLMClient
+    from services.result_sink import candidate_path, open_sink
+    from services.seen_jobs import SeenJobIndex
+    from services.text_processor import SectionProcessor
+    from services.verdict_cache import VerdictCache
+
+    try:
+        sections = SectionProcessor().tokenise(SAMPLE_CV)
+        client = LLMClient(requests_per_minute=args.llm_rpm, tokens_per_minute=args.llm_tpm)
+        cv_profile = CVProfileFiller(client=client).fill_cv_profile(sections)
+        # the fake LLM returns one profile, variants rotate its skills so each candidate scores jobs differently
+        skills = [skill.strip() for skill in cv_profile.skills.split(",")]
+        candidates = []
+        for n in range(args.candidates):
+            profile = dataclasses.replace(
+                cv_profile, name=f"{cv_profile.name} {n}", skills=", ".join(skills[n:] + skills[:n])
+            )
+            results = candidate_path(os.path.join(workdir, "results.csv"), f"candidate_{n}")
+            candidates.append(Candidate(
+                name=f"candidate_{n}",
+                profile=profile,
+                prefilter=RelevanceFilter(profile, threshold=args.min_score),
+                sink=open_sink(results, include_all=True, candidate=profile.fingerprint()),
+            ))
+
+        if args.backend == "selenium":
+            backend = SeleniumBackend("bench", "bench", headless=True, base_url=linkedin.base_url)
+        else:
+            backend = HttpBackend(base_url=linkedin.base_url, concurrency=args.http_concurrency)
+
+        cache = VerdictCache(path=os.path.join(workdir, "verdicts.sqlite3"))
+        jobchecker = JobChecker(cache=cache, cascade=args.cascade, min_confidence=args.min_confidence, client=client)
+        scraper = LinkedInJobScraper(
+            cv_profile,
+            "bench",
+            "bench",
+            jobchecker=jobchecker,
+            eval_workers=args.workers,
+            eval_batch_size=args.batch_size,
+            seen_index=SeenJobIndex(path=os.path.join(workdir, "seen.sqlite3")),
+            backend=backend,
+            shards=args.shards,
+            queries=plan_shared_queries([candidate.profile for candidate in candidates], keywords=args.keywords),
+            checkpoint=CrawlCheckpoint(path=os.path.join(workdir, "checkpoint.json")),
+            metrics_path=os.path.join(workdir, "metrics.json"),
+            candidates=candidates,
+            corpus=JobCorpus(os.path.join(workdir, "job_corpus.sqlite3")),
+        )
+
+        started = time.perf_counter()
+        scraper.run()
+        seconds = time.perf_counter() - started
+        corpus = scraper.corpus.stats()
+
+        rematch = None
+        if args.rematch:
+            rematch = run_rematch(args, workdir, scraper.corpus, cv_profile, cache, client, linkedin)
+        scraper.corpus.close()
+        cache.close()
+    finally:
+        linkedin.stop()
+        llm.stop()
+
+    jobs = sum(stats.new for stats in scraper.query_stats.values())
+    matches = sum(stats.matches for stats in scraper.query_stats.values())
+
+    # every stage of the run, crawl shards included (they send their METRICS back to this process)
+    metrics = METRICS.snapshot()
+
+    return {
+        "config": vars(args),
+        "wall_s": round(seconds, 2),
+        "jobs": jobs,
+        "evaluated": scraper.pipeline.completed,
+        "matches": matches,
+        "jobs_per_min": round(jobs / seconds * 60, 1) if seconds else 0.0,
+        "llm": jobchecker.usage_summary(),
+        "cascade": jobchecker.cascade_summary() if args.cascade else None,
+        "llm_client": client.report(),
+        "llm_cost_usd": round(metrics["counters"].get("llm_cost_usd", 0.0), 4),
+        "counters": metrics["counters"],
+        "stages": metrics["stages"],
+        "peak_rss_mb": peak_rss_mb(),
+        "corpus": corpus,
+        "rematch": rematch,
+        "page_requests": linkedin.requests,
+        "llm_requests": llm.requests,
+        "llm_refused": {"429": llm.rate_limited, "503": llm.errors},
+    }
+
+
+def run_rematch(args: argparse.Namespace, workdir: str, corpus, cv_profile, cache, client, linkedin) -> dict:
+    # the profile's skills reversed, so the prefilter and the LLM see a different CV
+    from models.candidate import Candidate
+    from nav.conversation_llm_cv import JobChecker
+    from nav.rematch import CorpusRematch
+    from services.relevance import RelevanceFilter
+    from services.result_sink import open_sink
+
+    profile = dataclasses.replace(
+        cv_profile, name=f"{cv_profile.name} rematch", skills=", ".join(reversed(cv_profile.skills.split(", ")))
+    )
+    candidate = Candidate(
+        name="rematch",
+        profile=profile,
+        prefilter=RelevanceFilter(profile, threshold=args.min_score),
+        sink=open_sink(os.path.join(workdir, "rematched.csv"), include_all=True, candidate=profile.fingerprint()),
+    )
+    jobchecker = JobChecker(cache=cache, cascade=args.cascade, min_confidence=args.min_confidence, client=client)
+    rematch = CorpusRematch(
+        corpus,
+        [candidate],
+        jobchecker=jobchecker,
+        eval_workers=args.workers,
+        eval_batch_size=args.batch_size,
+        metrics_path=None,
+    )
+    page_requests = linkedin.requests
+    started = time.perf_counter()
+    rematch.run()
+    seconds = time.perf_counter() - started
+    return {
+        "jobs": rematch.listings,
+        "evaluated": rematch.pipeline.completed,
+        "matches": candidate.matches,
+        "wall_s": round(seconds, 2),
+        "llm_calls": jobchecker.usage_summary()["calls"],
+        "page_requests": linkedin.requests - page_requests,
+    }
+
+
+def print_report(report: dict) -> None:
+    print()
+    print(f"jobs:           {report['jobs']} ({report['evaluated']} evaluated, {report['matches']} matches)")
+    print(f"wall time:      {report['wall_s']} s")
+    print(f"throughput:     {report['jobs_per_min']} jobs/min")
+    print(f"LLM:            {report['llm']}, est. ${report['llm_cost_usd']}")
+    if report["cascade"]:
+        print(f"cascade:        {report['cascade']}")
+    print(f"requests:       {report['page_requests']} pages, {report['llm_requests']} LLM")
+    print(f"LLM client:     {report['llm_client']}, refused by the server {report['llm_refused']}")
+    print(f"job corpus:     {report['corpus']}")
+    if report["rematch"]:
+        print(f"rematch:        {report['rematch']}")
+    print(f"peak RSS:       {report['peak_rss_mb']} MB")
+    print(f"{'stage':<28}{'count':>8}{'total s':>10}{'p50 s':>10}{'p95 s':>10}")
+    for label, s in report["stages"].items():
+        print(f"{label:<28}{s['count']:>8}{s['total_s']:>10.2f}{s['p50_s']:>10.3f}{s['p95_s']:>10.3f}")
+
+
+def main() -> None:
+    args = parse_args()
+    with tempfile.TemporaryDirectory(prefix="bench-e2e-") as workdir:
+        # the scraper and sinks write relative paths (e.g. output/), keep them out of the repo
+        cwd = os.getcwd()
+        os.chdir(workdir)
+        try:
+            report = run(args, workdir)
+        finally:
+            os.chdir(cwd)
+
+    print_report(report)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
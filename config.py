@@ -1,8 +1,111 @@
 import logging
+import os
 
 # logging configuration
 LOG_LEVEL = logging.ERROR  # or logging.INFO, etc.
 
 # example of other possible settings
-PDF_MAX_SIZE_MB = 10  # hypothetical limit
+PDF_MAX_SIZE_MB = 10  # larger PDFs are refused before parsing
+# parallel PDF text extraction, pages are spread over a process pool
+PDF_WORKERS = max(1, min(4, os.cpu_count() or 1))
+PDF_PARALLEL_MIN_PAGES = 40  # starting the pool costs ~0.5 s, about what 4 workers save on 30-40 text pages
 DEFAULT_OUTPUT_DIR = "output/"
+
+# OpenAI-compatible endpoint for JobChecker and CVProfileFiller, the DEEPSEEK_BASE_URL environment
+# variable overrides it (e.g. to point at the fake endpoint in benchmarks/)
+DEEPSEEK_BASE_URL = "https://api.deepseek.com"
+
+# shared LLM client (services/llm_client.py): client-side quota, retries with backoff and a circuit breaker
+LLM_REQUESTS_PER_MINUTE = 0  # 0 = no limit, set to the account's quota to stay under it
+LLM_TOKENS_PER_MINUTE = 0  # prompt + output tokens, 0 = no limit
+LLM_OUTPUT_TOKENS_ESTIMATE = 1_000  # charged up front for requests without max_tokens, corrected from usage
+LLM_MAX_CONCURRENCY = 16  # ceiling of the in-flight limit, halved on a 429 and grown back on success
+LLM_TIMEOUT = 120  # seconds per request, reasoner calls can take a while
+LLM_MAX_RETRIES = 5  # per request, on 429s, 5xx, timeouts and connection errors
+LLM_BACKOFF_BASE = 1.0  # seconds, doubled every retry (with full jitter) unless the server sends Retry-After
+LLM_BACKOFF_MAX = 60.0
+LLM_BREAKER_FAILURES = 8  # consecutive failed attempts that open the circuit
+LLM_BREAKER_COOLDOWN = 30.0  # seconds requests fail fast before one probe request is let through
+
+# parsed CV profiles (and their sections), keyed on the PDF's content hash + the profile prompt version
+PROFILE_CACHE_PATH = DEFAULT_OUTPUT_DIR + "profile_cache.sqlite3"
+
+# on-disk cache of LLM job verdicts, keyed on the CV profile + job prompt version + job markdown
+VERDICT_CACHE_PATH = DEFAULT_OUTPUT_DIR + "verdict_cache.sqlite3"
+VERDICT_CACHE_TTL_HOURS = 24 * 7  # verdicts older than this are re-checked
+VERDICT_CACHE_MAX_ENTRIES = 50_000  # least recently used entries are evicted past this
+
+# concurrent LLM evaluation stage between the browser and JobChecker
+EVAL_WORKERS = 4  # concurrent LLM calls, raise until the API starts rate limiting
+EVAL_QUEUE_SIZE = 8  # listings the browser may run ahead of the evaluators before it blocks
+
+# local relevance prefilter, listings scoring below the threshold never reach the LLM
+PREFILTER_THRESHOLD = 45.0  # 0-100, set to 0 to send every listing to the LLM
+PREFILTER_TOP_K = 0  # if > 0 only the K best scoring listings per page are evaluated
+
+# batched job prompts, several listings share one copy of the instructions and CV
+EVAL_BATCH_SIZE = 4  # max listings per LLM request, 1 disables batching
+BATCH_TOKEN_BUDGET = 12_000  # estimated prompt tokens per batched request
+
+# job verdict models, with --cascade the fast model answers first and only verdicts it is unsure of
+# (or that don't parse) are escalated to JOB_MODEL
+JOB_MODEL = "deepseek-reasoner"
+CASCADE_FAST_MODEL = "deepseek-chat"
+CASCADE_MIN_CONFIDENCE = 0.8  # fast verdicts with a lower confidence are escalated
+CASCADE_MAX_TOKENS_PER_JOB = 40  # output cap of a fast request, per listing in it
+
+# job text sent to the LLM, boilerplate is stripped then the rest is capped at this many (estimated) tokens
+JOB_TEXT_MAX_TOKENS = 1500
+
+# cross-run index of LinkedIn job ids already processed for a profile, skipped before clicking
+SEEN_INDEX_PATH = DEFAULT_OUTPUT_DIR + "seen_jobs.sqlite3"
+SEEN_JOB_MAX_AGE_DAYS = 14  # older entries expire so reposted jobs get checked again
+
+# local corpus of every extracted listing (zlib compressed), re-evaluated offline by rematch.py
+JOB_CORPUS_PATH = DEFAULT_OUTPUT_DIR + "job_corpus.sqlite3"
+JOB_CORPUS_COMPRESSION_LEVEL = 6  # zlib level, 9 is barely smaller on listing text and slower
+JOB_CORPUS_FLUSH_EVERY = 25  # buffered listings written per transaction
+REMATCH_RESULTS_PATH = "rematched_jobs.csv"  # rematch.py's default output, kept apart from the crawl's results
+
+# browser waits, every wait polls a readiness condition instead of sleeping a fixed time
+WAIT_TIMEOUT = 10  # seconds before a page element is considered missing
+WAIT_POLL_INTERVAL = 0.1  # seconds between readiness checks
+SCROLL_WAIT_TIMEOUT = 3  # seconds to wait for lazy-loaded cards after a scroll
+# politeness delay between cards, scaled from how slowly LinkedIn has been responding
+PACING_FACTOR = 0.5
+PACING_MIN_DELAY = 0.0
+PACING_MAX_DELAY = 1.5
+
+# fetch backends (selenium / http / replay)
+LINKEDIN_BASE_URL = "https://www.linkedin.com/"
+JOBS_PER_PAGE = 25  # LinkedIn's page size for the &start= offset
+HTTP_CONCURRENCY = 4  # pooled keep-alive connections / parallel detail fetches for the http backend
+HTTP_TIMEOUT = 15  # seconds
+# Chrome version the chromedriver was last installed for and its path, the driver is only looked up again after a Chrome update
+CHROMEDRIVER_STAMP_PATH = DEFAULT_OUTPUT_DIR + "chromedriver.json"
+
+# sharded crawl, results pages are split across this many processes each with its own session
+CRAWL_SHARDS = 1  # 1 crawls in-process with the scraper's own backend
+SHARD_QUEUE_SIZE = 2  # crawled pages each shard may have waiting for the evaluators
+SHARD_PAGE_ATTEMPTS = 3  # a results page that fails is handed out again (to any shard) up to this many times
+
+# search planner, queries are every keywords x location combination
+SEARCH_EXTRA_KEYWORDS: list = []  # title variants searched on top of the CV's disciplines
+SEARCH_EXTRA_LOCATIONS: list = []  # locations searched on top of the CV's location
+MAX_SEARCH_QUERIES = 12
+
+# crawl checkpoint written during a run, resumed with --resume
+CHECKPOINT_PATH = DEFAULT_OUTPUT_DIR + "crawl_checkpoint.json"
+
+# result sinks, verdicts are buffered and written in batches
+RESULTS_PATH = "matched_jobs.csv"  # .csv, .jsonl or .sqlite3 picks the format
+RESULT_FLUSH_EVERY = 25  # buffered results written per batch
+
+# run metrics, stage timers and counters exported during the run and summarised at the end
+METRICS_PATH = DEFAULT_OUTPUT_DIR + "metrics.prom"  # .prom for the Prometheus text format, anything else is JSON
+METRICS_EXPORT_INTERVAL = 15  # seconds between exports while the crawl runs
+# estimated LLM cost, USD per 1M (cache-hit input, cache-miss input, output) tokens, list prices
+LLM_PRICES = {
+    "deepseek-chat": (0.07, 0.27, 1.10),
+    "deepseek-reasoner": (0.14, 0.55, 2.19),
+}
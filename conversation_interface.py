@@ -4,11 +4,12 @@ from typing import List
 
 from scripts.profile_prompt import build_cv_prompt
 from models.cv_profile import CVProfile
-import getpass
-import os
 import re
-from openai import OpenAI
-from dotenv import find_dotenv, load_dotenv
+import time
+from typing import Optional
+
+from services.llm_client import LLMClient, shared_client
+from services.metrics import METRICS, usage_tokens
 
 
 logger = logging.getLogger(__name__)
@@ -17,19 +18,11 @@ logger = logging.getLogger(__name__)
 class CVProfileFiller:
     #uses a LangChain LLM to fill out CVProfile from sectioned CV text
 
-    def __init__(self, api_key: str = "", temperature: float = 0.0):
-
-        load_dotenv(find_dotenv())
-
-        # Get the API key from the environment
-        # Deepseek reasoner is 98x cheaper than OpenAi reasoner - omit base_url to use o1 OpenAi api
-        self.api_key = os.getenv("DEEPSEEK_API_KEY")
-        if self.api_key is None:
-            self.api_key = getpass.getpass("Enter your DEEPSEEK API key: ")
+    def __init__(self, temperature: float = 0.0, client: Optional[LLMClient] = None):
         self.temperature = temperature
 
-        # create single client
-        self.client = OpenAI(api_key=self.api_key, base_url="https://api.deepseek.com")
+        # the API key, rate limits and retries live in the LLMClient shared with JobChecker
+        self.llm = client or shared_client()
 
     def fill_cv_profile(self, sections: List[dict]) -> CVProfile:
         #build a prompt from the CV sections, get the llm response as json and parse into cvprofile class
@@ -38,13 +31,21 @@ class CVProfileFiller:
         prompt = build_cv_prompt(sections)
         messages = prompt.format_messages()
 
-        res = self.client.chat.completions.create(
-            model="deepseek-chat",
-            messages=[
-                {"role": "user", "content": m.content} for m in messages
-            ],
+        started = time.perf_counter()
+        res = self.llm.complete(
+            "deepseek-chat",
+            [{"role": "user", "content": m.content} for m in messages],
             temperature=0.1,
         )
+        input_tokens, cached_input_tokens, output_tokens = usage_tokens(getattr(res, "usage", None))
+        METRICS.record_llm_usage(
+            "deepseek-chat",
+            input_tokens,
+            output_tokens,
+            time.perf_counter() - started,
+            stage="cv_profile_llm",
+            cached_input_tokens=cached_input_tokens,
+        )
 
         raw_content = res.choices[0].message.content
         result_data = self.__clean_response__(raw_content)
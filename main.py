@@ -1,25 +1,222 @@
 #!/usr/bin/env python3
-import sys
+import argparse
 import logging
 import getpass
+import os
 
-from config import LOG_LEVEL
-from services.pdf_extractor import PDFExtractor
-from services.text_processor import SectionProcessor
-from conversation_interface import CVProfileFiller
-from nav.navigation import LinkedInJobScraper
+from config import (
+    LOG_LEVEL,
+    EVAL_WORKERS,
+    EVAL_BATCH_SIZE,
+    PREFILTER_THRESHOLD,
+    PREFILTER_TOP_K,
+    CASCADE_FAST_MODEL,
+    CASCADE_MIN_CONFIDENCE,
+    JOB_MODEL,
+    JOB_CORPUS_PATH,
+    LLM_REQUESTS_PER_MINUTE,
+    LLM_TOKENS_PER_MINUTE,
+    LINKEDIN_BASE_URL,
+    HTTP_CONCURRENCY,
+    CRAWL_SHARDS,
+    RESULTS_PATH,
+    METRICS_PATH,
+)
+from services.verdict_cache import VerdictCache
+from services.profile_cache import ProfileCache
+from services.seen_jobs import SeenJobIndex
+from services.checkpoint import CrawlCheckpoint
+from services.job_corpus import JobCorpus
+from services.result_sink import candidate_path, open_sink
+from services.llm_client import LLMClient
+from nav.backends import BACKENDS, load_backend
 
-def main() -> None:
-    logging.basicConfig(level=LOG_LEVEL, format="%(asctime)s [%(levelname)s] %(name)s - %(message)s")
+# the PDF/LLM modules (pypdf, nltk, openai, langchain) and the scraping stack (numpy, rapidfuzz, the
+# selected backend) are imported where they are first needed, so --help, argument errors and a run
+# whose CV profiles are all cached start without paying for what they don't use
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Parse a CV and match it against LinkedIn job listings.")
+    parser.add_argument(
+        "pdf_paths",
+        nargs="+",
+        metavar="pdf_path",
+        help="path to the candidate's CV as a PDF; with several CVs the jobs are scraped once and matched against each",
+    )
+    add_matching_args(parser)
+    parser.add_argument(
+        "--recheck-seen",
+        action="store_true",
+        help="process jobs even if an earlier run already handled them for this CV",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="continue the last run's searches and pending evaluations from its checkpoint",
+    )
+    parser.add_argument(
+        "--backend",
+        choices=sorted(BACKENDS),
+        default="selenium",
+        help="how job pages are fetched: a logged-in Chrome (selenium), plain pooled HTTP (http) "
+        "or saved HTML files (replay)",
+    )
+    parser.add_argument(
+        "--base-url",
+        default=LINKEDIN_BASE_URL,
+        help="LinkedIn root URL, point it at a local stand-in server to run offline",
+    )
+    parser.add_argument(
+        "--http-concurrency",
+        type=int,
+        default=HTTP_CONCURRENCY,
+        help=f"parallel job page fetches for the http backend (default: {HTTP_CONCURRENCY})",
+    )
+    parser.add_argument("--replay-dir", help="directory of saved pages for the replay backend")
+    parser.add_argument(
+        "--keywords",
+        nargs="+",
+        help="search keywords / title variants to run, replacing the CV's disciplines (one query per keywords x location)",
+    )
+    parser.add_argument(
+        "--locations",
+        nargs="+",
+        help="locations to search, replacing the CV's location",
+    )
+    parser.add_argument(
+        "--shards",
+        type=int,
+        default=CRAWL_SHARDS,
+        help="crawl results pages with N processes, each with its own (headless) backend session "
+        f"(default: {CRAWL_SHARDS})",
+    )
+    parser.add_argument(
+        "--corpus",
+        default=JOB_CORPUS_PATH,
+        help=f"where every extracted listing is kept for rematch.py (default: {JOB_CORPUS_PATH}, '' keeps nothing)",
+    )
+    return parser.parse_args()
+
+
+def add_matching_args(parser: argparse.ArgumentParser, results_path: str = RESULTS_PATH) -> None:
+    # how jobs are evaluated and where verdicts go, shared with rematch.py
+    stem, extension = os.path.splitext(os.path.basename(results_path))
+    parser.add_argument(
+        "--output",
+        default=results_path,
+        help=f"results file, .csv, .jsonl or .sqlite3 (default: {results_path}); with several CVs "
+        f"every candidate gets their own, named after the PDF (e.g. {stem}_jane_doe{extension})",
+    )
+    parser.add_argument(
+        "--all-verdicts",
+        action="store_true",
+        help="store every evaluated job with its verdict, not only the matches",
+    )
+    parser.add_argument(
+        "--refresh-profile",
+        action="store_true",
+        help="parse the CV again instead of reusing the cached profile of the same PDF",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="ignore cached job verdicts for this run (fresh verdicts are still written back)",
+    )
+    parser.add_argument(
+        "--purge-cache",
+        action="store_true",
+        help="delete every cached job verdict before starting",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=EVAL_WORKERS,
+        help=f"concurrent LLM evaluations, alongside the browser in a crawl (default: {EVAL_WORKERS})",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=EVAL_BATCH_SIZE,
+        help=f"max job listings packed into one LLM request (default: {EVAL_BATCH_SIZE}, 1 disables batching)",
+    )
+    parser.add_argument(
+        "--cascade",
+        action="store_true",
+        help=f"ask {CASCADE_FAST_MODEL} first and only send the jobs it is unsure about to {JOB_MODEL}",
+    )
+    parser.add_argument(
+        "--min-confidence",
+        type=float,
+        default=CASCADE_MIN_CONFIDENCE,
+        help=f"confidence (0-1) a {CASCADE_FAST_MODEL} verdict needs to be kept with --cascade "
+        f"(default: {CASCADE_MIN_CONFIDENCE})",
+    )
+    parser.add_argument(
+        "--llm-rpm",
+        type=float,
+        default=LLM_REQUESTS_PER_MINUTE,
+        help="LLM requests per minute to stay under, shared by every evaluation thread "
+        f"(default: {LLM_REQUESTS_PER_MINUTE}, 0 for no limit)",
+    )
+    parser.add_argument(
+        "--llm-tpm",
+        type=float,
+        default=LLM_TOKENS_PER_MINUTE,
+        help=f"LLM tokens per minute to stay under (default: {LLM_TOKENS_PER_MINUTE}, 0 for no limit)",
+    )
+    parser.add_argument(
+        "--min-score",
+        type=float,
+        default=PREFILTER_THRESHOLD,
+        help=f"local relevance score (0-100) a listing needs before it is sent to the LLM (default: {PREFILTER_THRESHOLD})",
+    )
+    parser.add_argument(
+        "--top-k",
+        type=int,
+        default=PREFILTER_TOP_K,
+        help="only send the K most relevant listings per page to the LLM (default: 0, no limit)",
+    )
+    parser.add_argument(
+        "--metrics",
+        default=METRICS_PATH,
+        help=f"stage timers and counters exported during the run, .prom (Prometheus text format) or .json "
+        f"(default: {METRICS_PATH}, '' disables the file)",
+    )
+
+
+def build_backend(args: argparse.Namespace, username: str, password: str):
+    backend_cls = load_backend(args.backend)
+    if args.backend == "http":
+        return backend_cls(base_url=args.base_url, concurrency=args.http_concurrency)
+    if args.backend == "replay":
+        return backend_cls(args.replay_dir, base_url=args.base_url)
+    return backend_cls(username, password, headless=False, base_url=args.base_url)
+
+
+def load_cv_profile(pdf_path: str, profile_cache: ProfileCache, llm: LLMClient):
+    """
+    :param pdf_path: the candidate's CV
+    :param profile_cache: where the sections and profile of an unchanged PDF are reused from
+    :param llm: client the profile request goes through on a cache miss
+    :return: the CVProfile filled from the CV
+    """
     logger = logging.getLogger(__name__)
 
-    if len(sys.argv) < 2:
-        logger.error("Please provide a path to a PDF file.")
-        sys.exit(1)
+    pdf_sha256 = ProfileCache.hash_pdf(pdf_path)
+    key = ProfileCache.make_key(pdf_sha256)
+    cached = profile_cache.get(key)
+    if cached is not None:
+        sections, cv_profile = cached
+        print(f"[INFO] Reusing the cached profile for {pdf_path} ({len(sections)} sections)")
+        return cv_profile
 
-    pdf_path = sys.argv[1]
     logger.info(f"Starting PDF parse pipeline for: {pdf_path}")
 
+    from services.pdf_extractor import PDFExtractor
+    from services.text_processor import SectionProcessor
+    from conversation_interface import CVProfileFiller
+
     extractor = PDFExtractor(pdf_path)
     extractor.load_pdf()
     metadata = extractor.extract_metadata()
@@ -32,16 +229,96 @@ def main() -> None:
     sections = processor.tokenise(text)
     logger.info(f"Number of sections extracted: {len(sections)}")
 
-    filler = CVProfileFiller()
+    filler = CVProfileFiller(client=llm)
     cv_profile = filler.fill_cv_profile(sections)
-    print(cv_profile)
+    profile_cache.set(key, pdf_sha256, sections, cv_profile)
+    return cv_profile
+
 
-    username = input("Enter your LinkedIn username: ")
-    password = getpass.getpass("Enter your LinkedIn password: ")
+def build_candidates(args: argparse.Namespace, llm: LLMClient) -> list:
+    """
+    :param args: parsed add_matching_args() options plus the pdf_paths
+    :param llm: client the CV profile requests go through
+    :return: a Candidate per distinct CV profile, each with its prefilter and results sink
+    """
+    from models.candidate import Candidate
+    from services.relevance import RelevanceFilter
 
-    scraper = LinkedInJobScraper(cv_profile, username, password, headless=False)
+    profile_cache = ProfileCache(bypass=args.refresh_profile)
+    candidates = []
+    for pdf_path in args.pdf_paths:
+        cv_profile = load_cv_profile(pdf_path, profile_cache, llm)
+        print(cv_profile)
+        name = os.path.splitext(os.path.basename(pdf_path))[0]
+        if any(candidate.name == name for candidate in candidates):
+            # e.g. a/cv.pdf and b/cv.pdf, their results must not share a file
+            name = f"{name}_{len(candidates) + 1}"
+        if any(candidate.key == cv_profile.fingerprint() for candidate in candidates):
+            print(f"[INFO] {pdf_path} has the same profile as an earlier CV, skipping it")
+            continue
+        output = args.output if len(args.pdf_paths) == 1 else candidate_path(args.output, name)
+        candidates.append(
+            Candidate(
+                name=name,
+                profile=cv_profile,
+                prefilter=RelevanceFilter(cv_profile, threshold=args.min_score, top_k=args.top_k),
+                sink=open_sink(output, include_all=args.all_verdicts, candidate=cv_profile.fingerprint()),
+            )
+        )
+    profile_cache.close()
+    return candidates
+
+
+def main() -> None:
+    logging.basicConfig(level=LOG_LEVEL, format="%(asctime)s [%(levelname)s] %(name)s - %(message)s")
+
+    args = parse_args()
+    if args.backend == "replay" and not args.replay_dir:
+        raise SystemExit("--replay-dir is required with --backend replay")
+
+    # one client for the whole run, so the CV and job requests count against the same quota
+    llm = LLMClient(requests_per_minute=args.llm_rpm, tokens_per_minute=args.llm_tpm)
+    candidates = build_candidates(args, llm)
+
+    cache = VerdictCache(bypass=args.no_cache)
+    if args.purge_cache:
+        cache.purge()
+
+    # only the browser backend logs in
+    username = password = ""
+    if args.backend == "selenium":
+        username = input("Enter your LinkedIn username: ")
+        password = getpass.getpass("Enter your LinkedIn password: ")
+
+    from nav.conversation_llm_cv import JobChecker
+    from nav.navigation import LinkedInJobScraper
+    from nav.search_plan import plan_shared_queries
+
+    profiles = [candidate.profile for candidate in candidates]
+    scraper = LinkedInJobScraper(
+        profiles[0],
+        username,
+        password,
+        headless=False,
+        jobchecker=JobChecker(cache=cache, cascade=args.cascade, min_confidence=args.min_confidence, client=llm),
+        eval_workers=args.workers,
+        eval_batch_size=args.batch_size,
+        seen_index=SeenJobIndex(ignore=args.recheck_seen),
+        backend=build_backend(args, username, password),
+        shards=args.shards,
+        queries=plan_shared_queries(profiles, keywords=args.keywords, locations=args.locations),
+        checkpoint=CrawlCheckpoint(resume=args.resume),
+        metrics_path=args.metrics or None,
+        candidates=candidates,
+        corpus=JobCorpus(args.corpus) if args.corpus else None,
+    )
     scraper.run()
 
+    print(f"[INFO] Verdict cache: {cache.stats()}")
+    cache.close()
+    if scraper.corpus is not None:
+        scraper.corpus.close()
+
 if __name__ == "__main__":
     main()
 
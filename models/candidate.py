@@ -0,0 +1,27 @@
+from dataclasses import dataclass, field
+from typing import Set
+
+from models.cv_profile import CVProfile
+from services.relevance import RelevanceFilter
+from services.result_sink import ResultSink
+
+
+@dataclass
+class Candidate:
+    """
+    one CV the scraped jobs are matched against, with its own prefilter and output
+    """
+
+    name: str  # label for logs, e.g. the PDF's file name
+    profile: CVProfile
+    prefilter: RelevanceFilter
+    sink: ResultSink
+    # CVProfile.fingerprint(), keys the candidate's seen jobs and pending checkpoint entries
+    key: str = field(init=False)
+    # job ids processed for this candidate in earlier runs, loaded by the scraper
+    seen: Set[str] = field(default_factory=set)
+    sent_to_llm: int = 0
+    matches: int = 0
+
+    def __post_init__(self):
+        self.key = self.profile.fingerprint()
@@ -1,4 +1,5 @@
-from dataclasses import dataclass
+import hashlib
+from dataclasses import dataclass, fields
 from typing import Optional
 
 
@@ -28,3 +29,16 @@ class CVProfile:
     def __post_init__(self):
         # You can add post-initialization validation or processing here
         pass
+
+    def fingerprint(self) -> str:
+        """
+        sha256 of the normalised profile fields (case and whitespace insensitive),
+        used to key anything derived from the profile such as cached job verdicts.
+        """
+        parts = []
+        for f in fields(self):
+            value = getattr(self, f.name)
+            if isinstance(value, str):
+                value = " ".join(value.lower().split())
+            parts.append(f"{f.name}={value}")
+        return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
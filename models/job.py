@@ -8,6 +8,7 @@ class Job:
     location: str = ""    
     description: str = ""
     link: str = ""
+    job_id: str = ""
 
 
     def formatted_job_information(self) -> str:
@@ -26,3 +27,30 @@ class Job:
         Description
         {self.description or "No description provided."}
         """.strip()
+
+
+@dataclass
+class JobListing:
+    """
+    a scraped listing waiting for an LLM verdict, the card fields are read from the
+    page so only the match verdict has to come from the LLM
+    """
+
+    markdown: str = ""
+    link: str = ""
+    job_id: str = ""
+    role: str = ""
+    company: str = ""
+    location: str = ""
+    description: str = ""
+
+
+@dataclass
+class JobCard:
+    """
+    a job card from a search results page, as returned by a fetch backend
+    """
+
+    job_id: str = ""
+    html: str = ""  # outerHTML of the li[data-occludable-job-id] element
+    href: str = ""
@@ -0,0 +1,39 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class SearchQuery:
+    keywords: str = ""
+    location: str = ""
+
+    def __str__(self) -> str:
+        return f"{self.keywords} @ {self.location}" if self.location else self.keywords
+
+
+@dataclass
+class QueryStats:
+    """
+    What one search query cost and returned in a run.
+    """
+    pages: int = 0
+    cards: int = 0
+    new: int = 0  # cards extracted for the first time by this query
+    duplicates: int = 0  # cards an earlier query of this run already handled
+    known: int = 0  # cards processed in an earlier run
+    sent_to_llm: int = 0
+    matches: int = 0
+    seconds: float = 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "pages": self.pages,
+            "cards": self.cards,
+            "new": self.new,
+            "duplicates": self.duplicates,
+            "known": self.known,
+            "sent_to_llm": self.sent_to_llm,
+            "matches": self.matches,
+            "seconds": round(self.seconds, 1),
+            # what the query is worth per minute of crawling
+            "new_per_min": round(self.new / self.seconds * 60, 1) if self.seconds else 0.0,
+        }
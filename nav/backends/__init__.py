@@ -0,0 +1,34 @@
+import importlib
+from typing import Type
+
+from .base import FetchBackend
+
+# backend name -> (module, class); a backend's module (and what it pulls in, selenium or
+# httpx) is only imported when that backend is used, so e.g. an http run never loads selenium
+_BACKEND_CLASSES = {
+    "selenium": (".selenium_backend", "SeleniumBackend"),
+    "http": (".http_backend", "HttpBackend"),
+    "replay": (".replay_backend", "ReplayBackend"),
+}
+
+BACKENDS = tuple(_BACKEND_CLASSES)
+
+
+def load_backend(name: str) -> Type[FetchBackend]:
+    """
+    :param name: one of BACKENDS
+    :return: the backend class, its module is imported on the first call
+    """
+    module, cls = _BACKEND_CLASSES[name]
+    return getattr(importlib.import_module(module, __name__), cls)
+
+
+def __getattr__(attr: str):
+    # `from nav.backends import HttpBackend` keeps working, the module is imported on access
+    for name, (_, cls) in _BACKEND_CLASSES.items():
+        if cls == attr:
+            return load_backend(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {attr!r}")
+
+
+__all__ = ["BACKENDS", "FetchBackend", "HttpBackend", "ReplayBackend", "SeleniumBackend", "load_backend"]
@@ -0,0 +1,65 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from config import LINKEDIN_BASE_URL
+from models.job import JobCard
+from ..waits import WaitTracker
+
+
+class FetchBackend(ABC):
+    """
+    How LinkedInJobScraper gets search result cards and job descriptions.
+
+    The scraper calls open() once, then for every results page search() followed by
+    iter_card_batches() and fetch_details() on the cards it has not seen before,
+    and close() at the end. Backends only fetch HTML; parsing the card fields and
+    converting to Markdown stays in the scraper so every backend feeds the LLM the same text.
+    """
+
+    name = "base"
+
+    # relative job links on the cards are resolved against this
+    base_url = LINKEDIN_BASE_URL
+
+    # backends that wait on the network or a browser record where that time goes here
+    waits: Optional[WaitTracker] = None
+
+    def open(self) -> None:
+        # start the browser / session and log in if the backend needs to
+        pass
+
+    @abstractmethod
+    def search(self, query: str, location: str, start: int = 0) -> None:
+        """
+        Loads the results page for a query at the given offset.
+        """
+
+    @abstractmethod
+    def iter_card_batches(self, known_ids: Set[str]) -> Iterator[List[JobCard]]:
+        """
+        Yields the cards of the current results page, possibly over several batches
+        (e.g. one per scroll round). `known_ids` is the scraper's live set of processed
+        ids, a backend may skip work for them but still yields their ids.
+        """
+
+    @abstractmethod
+    def fetch_details(self, cards: Iterable[JobCard]) -> Iterator[Tuple[JobCard, str]]:
+        """
+        Yields (card, description HTML) for each card in order, "" if the description couldn't be loaded.
+        """
+
+    @abstractmethod
+    def page_has_no_jobs(self) -> bool:
+        """
+        True if the current results page says "No matching jobs found."
+        """
+
+    def close(self) -> None:
+        pass
+
+    def spec(self) -> Dict[str, Any]:
+        """
+        Picklable constructor arguments, load_backend(name)(**spec()) builds an unopened
+        twin of this backend, e.g. with its own session inside a crawl shard process.
+        """
+        raise NotImplementedError(f"The {self.name} backend can't be sharded.")
@@ -0,0 +1,116 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+import httpx
+
+from config import LINKEDIN_BASE_URL, HTTP_CONCURRENCY, HTTP_TIMEOUT
+from models.job import JobCard
+from ..waits import WaitTracker
+from .base import FetchBackend
+from .pages import NO_JOBS_TEXT, job_url, parse_detail_page, parse_search_page, search_url
+
+
+class HttpBackend(FetchBackend):
+    """
+    Browserless backend: results pages and job pages are fetched over one pooled
+    keep-alive httpx session and parsed with lxml, descriptions `concurrency` at a time.
+
+    There is no login step, so against linkedin.com it only sees what the given
+    cookies (e.g. {"li_at": ...}) allow. Point `base_url` at a local stand-in
+    server to run the whole pipeline offline.
+    """
+
+    name = "http"
+
+    HEADERS = {
+        "User-Agent": (
+            "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+            "(KHTML, like Gecko) Chrome/131.0 Safari/537.36"
+        ),
+        "Accept": "text/html,application/xhtml+xml",
+        "Accept-Language": "en-GB,en;q=0.9",
+    }
+
+    def __init__(
+        self,
+        base_url: str = LINKEDIN_BASE_URL,
+        concurrency: int = HTTP_CONCURRENCY,
+        timeout: float = HTTP_TIMEOUT,
+        cookies: Optional[Dict[str, str]] = None,
+    ):
+        self.base_url = base_url if base_url.endswith("/") else base_url + "/"
+        self.concurrency = max(1, concurrency)
+        self.timeout = timeout
+        self.cookies = cookies or {}
+        self.waits = WaitTracker()
+
+        self.client: Optional[httpx.Client] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._page_html = ""
+
+    def open(self) -> None:
+        limits = httpx.Limits(
+            max_connections=self.concurrency,
+            max_keepalive_connections=self.concurrency,
+        )
+        self.client = httpx.Client(
+            headers=self.HEADERS,
+            cookies=self.cookies,
+            timeout=self.timeout,
+            limits=limits,
+            follow_redirects=True,
+        )
+        self._executor = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="job-fetch")
+
+    def spec(self) -> Dict[str, Any]:
+        return {
+            "base_url": self.base_url,
+            "concurrency": self.concurrency,
+            "timeout": self.timeout,
+            "cookies": dict(self.cookies),
+        }
+
+    def _get(self, url: str) -> str:
+        if not self.client:
+            raise ValueError("HTTP session is not open.")
+        response = self.client.get(url)
+        response.raise_for_status()
+        return response.text
+
+    def search(self, query: str, location: str, start: int = 0) -> None:
+        with self.waits.track("search_page"):
+            self._page_html = self._get(search_url(self.base_url, query, location, start))
+        print("JOB SEARCH NAV SUCCESSFUL")
+
+    def iter_card_batches(self, known_ids: Set[str]) -> Iterator[List[JobCard]]:
+        # a static results page has every card up front, there is nothing to scroll
+        yield parse_search_page(self._page_html, self.base_url)
+
+    def fetch_details(self, cards: Iterable[JobCard]) -> Iterator[Tuple[JobCard, str]]:
+        cards = list(cards)
+        if not cards:
+            return
+
+        # executor.map keeps card order while up to `concurrency` requests are in flight
+        for card, desc_html in zip(cards, self._executor.map(self._fetch_description, cards)):
+            yield card, desc_html
+
+    def _fetch_description(self, card: JobCard) -> str:
+        try:
+            with self.waits.track("job_page"):
+                page_html = self._get(job_url(self.base_url, card.job_id))
+            return parse_detail_page(page_html)
+        except httpx.HTTPError as e:
+            print(f"Error processing job: {str(e)}")
+            return ""
+
+    def page_has_no_jobs(self) -> bool:
+        return NO_JOBS_TEXT in self._page_html
+
+    def close(self) -> None:
+        if self._executor:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        if self.client:
+            self.client.close()
+            self.client = None
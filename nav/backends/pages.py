@@ -0,0 +1,57 @@
+from typing import List
+from urllib.parse import quote, urljoin
+
+from lxml import html as lxml_html
+
+from models.job import JobCard
+
+CARD_SELECTOR = "li[data-occludable-job-id]"
+NO_JOBS_TEXT = "No matching jobs found."
+
+
+def search_url(base_url: str, query: str, location: str, start: int = 0) -> str:
+    # e.g. jobs/search/?keywords=Computer%20Science&location=London&start=25
+    url = f"{base_url}jobs/search/?keywords={quote(query)}&location={quote(location)}"
+    # Only add start parameter if not zero
+    if start > 0:
+        url += f"&start={start}"
+    return url
+
+
+def job_url(base_url: str, job_id: str) -> str:
+    return f"{base_url}jobs/view/{job_id}/"
+
+
+def parse_search_page(page_html: str, base_url: str) -> List[JobCard]:
+    """
+    Reads every li[data-occludable-job-id] card out of a static results page.
+    """
+    if not page_html.strip():
+        return []
+
+    root = lxml_html.document_fromstring(page_html)
+    cards = []
+    for li in root.xpath("//li[@data-occludable-job-id]"):
+        hrefs = li.xpath(".//a[@href]/@href")
+        cards.append(
+            JobCard(
+                job_id=li.get("data-occludable-job-id", ""),
+                html=lxml_html.tostring(li, encoding="unicode"),
+                href=urljoin(base_url, str(hrefs[0])) if hrefs else "",
+            )
+        )
+    return cards
+
+
+def parse_detail_page(page_html: str) -> str:
+    """
+    Returns the outerHTML of the job page's jobs-description panel, "" if there isn't one.
+    """
+    if not page_html.strip():
+        return ""
+
+    root = lxml_html.document_fromstring(page_html)
+    panels = root.xpath("//*[contains(concat(' ', normalize-space(@class), ' '), ' jobs-description ')]")
+    if not panels:
+        return ""
+    return lxml_html.tostring(panels[0], encoding="unicode")
@@ -0,0 +1,61 @@
+import os
+import re
+from typing import Any, Dict, Iterable, Iterator, List, Set, Tuple
+
+from config import LINKEDIN_BASE_URL
+from models.job import JobCard
+from .base import FetchBackend
+from .pages import NO_JOBS_TEXT, parse_detail_page, parse_search_page
+
+
+def page_slug(text: str) -> str:
+    # "Computer Science" -> "computer-science"
+    return re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")
+
+
+class ReplayBackend(FetchBackend):
+    """
+    Replays saved HTML from disk, for offline runs and benchmarks.
+
+    Layout of `directory`:
+      search_<keywords>_<location>_<start>.html  results page for one query (slugged, see page_slug)
+      search_<start>.html                        fallback used for any query
+      job_<job_id>.html                          job page containing the jobs-description panel
+    A results page that doesn't exist counts as "No matching jobs found."
+    """
+
+    name = "replay"
+
+    def __init__(self, directory: str, base_url: str = LINKEDIN_BASE_URL):
+        if not os.path.isdir(directory):
+            raise FileNotFoundError(f"Replay directory not found: {directory}")
+        self.directory = directory
+        self.base_url = base_url
+        self._page_html = ""
+
+    def spec(self) -> Dict[str, Any]:
+        return {"directory": self.directory, "base_url": self.base_url}
+
+    def _read(self, filename: str) -> str:
+        path = os.path.join(self.directory, filename)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return f.read()
+        except FileNotFoundError:
+            return ""
+
+    def search(self, query: str, location: str, start: int = 0) -> None:
+        self._page_html = (
+            self._read(f"search_{page_slug(query)}_{page_slug(location)}_{start}.html")
+            or self._read(f"search_{start}.html")
+        )
+
+    def iter_card_batches(self, known_ids: Set[str]) -> Iterator[List[JobCard]]:
+        yield parse_search_page(self._page_html, self.base_url)
+
+    def fetch_details(self, cards: Iterable[JobCard]) -> Iterator[Tuple[JobCard, str]]:
+        for card in cards:
+            yield card, parse_detail_page(self._read(f"job_{card.job_id}.html"))
+
+    def page_has_no_jobs(self) -> bool:
+        return not self._page_html or NO_JOBS_TEXT in self._page_html
@@ -0,0 +1,344 @@
+import json
+import os
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    TimeoutException,
+    WebDriverException,
+)
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.common.by import By
+
+from config import (
+    CHROMEDRIVER_STAMP_PATH,
+    LINKEDIN_BASE_URL,
+    WAIT_TIMEOUT,
+    WAIT_POLL_INTERVAL,
+    SCROLL_WAIT_TIMEOUT,
+)
+from models.job import JobCard
+from ..waits import AdaptiveDelay, WaitTracker
+from .base import FetchBackend
+from .pages import CARD_SELECTOR, NO_JOBS_TEXT, search_url
+
+
+def chromedriver_path(stamp_path: str = CHROMEDRIVER_STAMP_PATH) -> Optional[str]:
+    """
+    Path of a chromedriver matching the installed Chrome. chromedriver_autoinstaller.install()
+    looks the matching driver version up online on every call, so its result is stamped with
+    the Chrome version and reused until Chrome is updated (or the driver goes missing).
+
+    :param stamp_path: JSON file remembering the Chrome version and driver path
+    :return: the driver's path, None to leave finding one to selenium
+    """
+    import chromedriver_autoinstaller
+
+    chrome_version = chromedriver_autoinstaller.get_chrome_version()
+    try:
+        with open(stamp_path, "r", encoding="utf-8") as f:
+            stamp = json.load(f)
+    except (OSError, ValueError):
+        stamp = {}
+
+    driver_path = stamp.get("driver_path") or ""
+    if chrome_version and stamp.get("chrome_version") == chrome_version and os.access(driver_path, os.X_OK):
+        return driver_path
+
+    driver_path = chromedriver_autoinstaller.install()
+    if chrome_version and driver_path:
+        directory = os.path.dirname(stamp_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # crawl shards may all get here at once, each writes its own file and renames it over the stamp
+        tmp_path = f"{stamp_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"chrome_version": chrome_version, "driver_path": driver_path}, f)
+        os.replace(tmp_path, stamp_path)
+    return driver_path
+
+
+class SeleniumBackend(FetchBackend):
+    """
+    Drives a logged-in Chrome session: the search page is scrolled to load more
+    cards, and each card is clicked to open its description in the details pane.
+    """
+
+    name = "selenium"
+
+    # One async round trip per page: returns [{job_id, html, href}] for every card.
+    # LinkedIn empties off-screen ("occluded") cards, so unknown ones are scrolled into view and
+    # given up to ~0.5s to render; ids in arguments[1] (already processed) are returned without waiting.
+    BULK_CARDS_JS = """
+        const [selector, known] = arguments;
+        const done = arguments[arguments.length - 1];
+        const skip = new Set(known);
+        (async () => {
+            const cards = [];
+            for (const li of document.querySelectorAll(selector)) {
+                const id = li.getAttribute('data-occludable-job-id') || '';
+                if (skip.has(id)) { cards.push({job_id: id, html: '', href: ''}); continue; }
+                if (!li.querySelector('a[href]')) {
+                    li.scrollIntoView({block: 'center'});
+                    for (let i = 0; i < 10 && !li.querySelector('a[href]'); i++) {
+                        await new Promise(resolve => setTimeout(resolve, 50));
+                    }
+                }
+                const anchor = li.querySelector('a[href]');
+                cards.push({job_id: id, html: li.outerHTML, href: anchor ? anchor.href : ''});
+            }
+            done(cards);
+        })();
+    """
+
+    # Scrolls to and clicks a card by job id in a single call, returns false if it is gone
+    CLICK_CARD_JS = """
+        const li = document.querySelector('li[data-occludable-job-id="' + arguments[0] + '"]');
+        if (!li) return false;
+        li.scrollIntoView({block: 'center'});
+        (li.querySelector('.job-card-container--clickable, .job-card-container') || li).click();
+        return true;
+    """
+
+    # Returns the description panel's HTML once the details pane shows the given job id, else null.
+    # The pane links to /jobs/view/<id>; layouts without that link fall back to the currentJobId URL param.
+    DETAIL_READY_JS = """
+        const id = arguments[0];
+        const panel = document.querySelector('.jobs-description');
+        if (!panel) return null;
+        const details = document.querySelector('.jobs-search__job-details, .jobs-details, .job-view-layout') || document;
+        if (!id) return panel.outerHTML;
+        if (details.querySelector('a[href*="/jobs/view/"]')) {
+            return details.querySelector('a[href*="/jobs/view/' + id + '"]') ? panel.outerHTML : null;
+        }
+        return location.href.includes('currentJobId=' + id) ? panel.outerHTML : null;
+    """
+
+    def __init__(
+        self,
+        username: str,
+        password: str,
+        headless: bool = False,
+        base_url: str = LINKEDIN_BASE_URL,
+        waits: Optional[WaitTracker] = None,
+        pacing: Optional[AdaptiveDelay] = None,
+    ):
+        """
+        :param username: LinkedIn username (email)
+        :param password: LinkedIn password
+        :param headless: Whether to run Chrome in headless mode
+        :param base_url: LinkedIn root, can point at a local stand-in
+        :param waits: where time spent waiting on the browser is recorded
+        :param pacing: politeness delay between cards, fed with detail pane load times
+        """
+        self.username = username
+        self.password = password
+        self.headless = headless
+        self.base_url = base_url
+        self.waits = waits or WaitTracker()
+        self.pacing = pacing or AdaptiveDelay()
+
+        # Will be assigned in open()
+        self.driver: Optional[webdriver.Chrome] = None
+
+    def open(self) -> None:
+        self.init_browser()
+        self.login()
+
+    def spec(self) -> Dict[str, Any]:
+        # every shard logs in with the same account in its own browser
+        return {
+            "username": self.username,
+            "password": self.password,
+            "headless": self.headless,
+            "base_url": self.base_url,
+        }
+
+    def init_browser(self) -> None:
+        """
+        Installs (if Chrome changed since the last run) and launches a Chrome driver with specified options.
+        """
+        driver_path = chromedriver_path()
+        chrome_options = Options()
+        if self.headless:
+            chrome_options.add_argument("--headless")
+            chrome_options.add_argument("--no-sandbox")
+            chrome_options.add_argument("--disable-dev-shm-usage")
+
+        service = Service(executable_path=driver_path) if driver_path else Service()
+        self.driver = webdriver.Chrome(service=service, options=chrome_options)
+        self.driver.maximize_window()
+
+    def _wait(self, timeout: float = WAIT_TIMEOUT) -> WebDriverWait:
+        return WebDriverWait(self.driver, timeout, poll_frequency=WAIT_POLL_INTERVAL)
+
+    def login(self) -> None:
+        if not self.driver:
+            raise ValueError("WebDriver is not initialized.")
+
+        self.driver.get(f"{self.base_url}login")
+
+        try:
+            with self.waits.track("login_form"):
+                self._wait().until(EC.presence_of_element_located((By.ID, "username")))
+            email = self.driver.find_element(By.ID, "username")
+            password_field = self.driver.find_element(By.ID, "password")
+            submit_button = self.driver.find_element(
+                By.CSS_SELECTOR, "button[type='submit']"
+            )
+
+            email.send_keys(self.username)
+            password_field.send_keys(self.password)
+            submit_button.click()
+
+            with self.waits.track("login_complete"):
+                self._wait().until(EC.presence_of_element_located((By.CLASS_NAME, "artdeco-card")))
+            print("LOGIN SUCCESSFUL")
+        except (NoSuchElementException, TimeoutException, WebDriverException) as e:
+            print(f"[ERROR] Login failed: {e}")
+            raise
+
+    def search(self, query: str, location: str, start: int = 0) -> None:
+        if not self.driver:
+            raise ValueError("WebDriver is not initialized.")
+
+        self.driver.get(search_url(self.base_url, query, location, start))
+        try:
+            with self.waits.track("search_results"):
+                self._wait().until(
+                    EC.presence_of_element_located(
+                        (By.CSS_SELECTOR, "[class*='jobs-search-results-list']")
+                    )
+                )
+            print("JOB SEARCH NAV SUCCESSFUL")
+        except TimeoutException as e:
+            print(f"[ERROR] Could not load job search results: {e}")
+            raise
+
+    def iter_card_batches(self, known_ids: Set[str]) -> Iterator[List[JobCard]]:
+        if not self.driver:
+            raise ValueError("WebDriver is not initialized.")
+
+        while True:
+            # every card on the page in one WebDriver call instead of ~5 per card
+            with self.waits.track("card_extract"):
+                raw_cards = self.driver.execute_async_script(
+                    self.BULK_CARDS_JS, CARD_SELECTOR, list(known_ids)
+                ) or []
+
+            yield [
+                JobCard(job_id=c.get("job_id") or "", html=c.get("html") or "", href=c.get("href") or "")
+                for c in raw_cards
+            ]
+
+            if not self.scroll_to_page_bottom():
+                break  # No more new content to scroll
+
+    def fetch_details(self, cards: Iterable[JobCard]) -> Iterator[Tuple[JobCard, str]]:
+        for card in cards:
+            try:
+                desc_html = self._open_card(card)
+            except Exception as e:
+                print(f"Error processing job: {str(e)}")
+                continue
+
+            yield card, desc_html
+
+            with self.waits.track("pacing"):
+                self.pacing.sleep()
+
+    def _open_card(self, card: JobCard) -> str:
+        # clicks the card and waits until the description panel shows that job
+        if not self.driver.execute_script(self.CLICK_CARD_JS, card.job_id):
+            raise NoSuchElementException(f"Job card {card.job_id} is no longer on the page")
+
+        started = time.perf_counter()
+        try:
+            desc_html = self._wait().until(
+                lambda driver: driver.execute_script(self.DETAIL_READY_JS, card.job_id)
+            )
+        except TimeoutException:
+            desc_html = ""
+        waited = time.perf_counter() - started
+        self.waits.add("detail_panel", waited)
+        self.pacing.observe(waited)
+        return desc_html
+
+    def page_has_no_jobs(self) -> bool:
+        page_source = self.driver.page_source
+        return NO_JOBS_TEXT in page_source
+
+    def scroll_to_page_bottom(self) -> bool:
+        """
+        Scrolls the window to the bottom of the page to trigger lazy-loaded items
+        and waits until more job cards appear or the page grows.
+
+        :return: True if new content loaded within SCROLL_WAIT_TIMEOUT
+        """
+        if not self.driver:
+            raise ValueError("WebDriver is not initialized.")
+
+        before_cards, before_height = self.driver.execute_script(
+            "window.scrollTo(0, document.body.scrollHeight);"
+            "return [document.querySelectorAll(arguments[0]).length, document.body.scrollHeight];",
+            CARD_SELECTOR,
+        )
+
+        def grew(driver) -> bool:
+            cards, height = driver.execute_script(
+                "return [document.querySelectorAll(arguments[0]).length, document.body.scrollHeight];",
+                CARD_SELECTOR,
+            )
+            return cards > before_cards or height > before_height
+
+        try:
+            with self.waits.track("scroll_load"):
+                self._wait(SCROLL_WAIT_TIMEOUT).until(grew)
+            return True
+        except TimeoutException:
+            return False
+
+    def go_to_next_page(self) -> bool:
+        if not self.driver:
+            raise ValueError("WebDriver is not initialized.")
+
+        try:
+            pagination = self.driver.find_element(By.CLASS_NAME, "artdeco-pagination__pages")
+            next_btn = pagination.find_element(By.XPATH, ".//button[@aria-label='Next page']")
+            if "disabled" in next_btn.get_attribute("class"):
+                return False
+            else:
+                first_card = self.driver.find_elements(By.CSS_SELECTOR, CARD_SELECTOR)[:1]
+                next_btn.click()
+                # Let the page load: the old cards are replaced, then the new list renders
+                with self.waits.track("next_page"):
+                    if first_card:
+                        self._wait().until(EC.staleness_of(first_card[0]))
+                    self._wait().until(
+                        EC.presence_of_element_located((By.CSS_SELECTOR, CARD_SELECTOR))
+                    )
+                print("[INFO] Moved to next page.")
+                return True
+        except NoSuchElementException:
+            print("[INFO] No next page found.")
+            return False
+        except TimeoutException:
+            print("[INFO] Next page took too long to load, stopping.")
+            return False
+
+    def close(self) -> None:
+        """
+        Ensures that the driver is properly quit.
+        """
+        if getattr(self, "driver", None):
+            try:
+                self.driver.quit()
+                print("[INFO] Browser closed.")
+            except Exception as e:
+                print(f"[WARN] Error closing browser: {e}")
+            self.driver = None
@@ -0,0 +1,61 @@
+from typing import Dict
+from urllib.parse import urljoin
+
+from lxml import html as lxml_html
+
+# LinkedIn has renamed these classes a few times, so each field tries the known variants in order
+ROLE_CLASSES = ["job-card-list__title", "job-card-container__link", "base-search-card__title"]
+COMPANY_CLASSES = [
+    "artdeco-entity-lockup__subtitle",
+    "job-card-container__primary-description",
+    "job-card-container__company-name",
+    "base-search-card__subtitle",
+]
+LOCATION_CLASSES = [
+    "job-card-container__metadata-item",
+    "artdeco-entity-lockup__caption",
+    "job-search-card__location",
+]
+
+
+def _first_text(root, classes) -> str:
+    for cls in classes:
+        nodes = root.xpath(f".//*[contains(concat(' ', normalize-space(@class), ' '), ' {cls}')]")
+        for node in nodes:
+            # titles render the name in <strong> next to a visually hidden duplicate
+            strong = node.xpath(".//strong")
+            text = strong[0].text_content() if strong else node.text_content()
+            text = " ".join(text.split())
+            if text:
+                return text
+    return ""
+
+
+def parse_card_fields(card_html: str, base_url: str = "https://www.linkedin.com/") -> Dict[str, str]:
+    """
+    Reads the fields LinkedIn already renders on a search result card, so the LLM
+    doesn't have to generate them.
+
+    :param card_html: outerHTML of an li[data-occludable-job-id] card
+    :param base_url: used to absolutise relative job links
+    :return: dict with job_id, role, company, location and link (empty strings when not found)
+    """
+    fields = {"job_id": "", "role": "", "company": "", "location": "", "link": ""}
+    if not card_html or not card_html.strip():
+        return fields
+
+    root = lxml_html.fragment_fromstring(card_html, create_parent="div")
+
+    job_ids = root.xpath(".//@data-occludable-job-id | .//@data-job-id")
+    if job_ids:
+        fields["job_id"] = str(job_ids[0]).strip()
+
+    fields["role"] = _first_text(root, ROLE_CLASSES)
+    fields["company"] = _first_text(root, COMPANY_CLASSES)
+    fields["location"] = _first_text(root, LOCATION_CLASSES)
+
+    hrefs = root.xpath(".//a[@href]/@href")
+    if hrefs:
+        fields["link"] = urljoin(base_url, str(hrefs[0]))
+
+    return fields
@@ -1,52 +1,321 @@
 import json
-from .job_prompt import check_job_with_cv
-from openai import OpenAI
-from dotenv import load_dotenv, find_dotenv
+from .job_prompt import JobPrompt
 
-import getpass
-import os
 import re
+import threading
+import time
+from typing import Dict, List, Optional
+
+from config import (
+    BATCH_TOKEN_BUDGET,
+    CASCADE_FAST_MODEL,
+    CASCADE_MAX_TOKENS_PER_JOB,
+    CASCADE_MIN_CONFIDENCE,
+    JOB_MODEL,
+)
+from services.job_text import estimate_tokens
+from services.llm_client import LLMClient, shared_client
+from services.metrics import METRICS, llm_cost, usage_tokens
+from services.verdict_cache import VerdictCache
 
 class JobChecker:
-    def __init__(self, temperature: float = 0.0):
-        """
-        Initialize the JobChecker with an API key and optional temperature, api_key is loaded from env variables. 
-        export DEEPSEEK_API_KEY=your_api_key on linux, set DEEPSEEK_API_KEY=your_api_key on windows
-        or enter maurually when prompted
+    def __init__(
+        self,
+        temperature: float = 0.0,
+        cache: Optional[VerdictCache] = None,
+        cascade: bool = False,
+        min_confidence: float = CASCADE_MIN_CONFIDENCE,
+        model: str = JOB_MODEL,
+        fast_model: str = CASCADE_FAST_MODEL,
+        client: Optional[LLMClient] = None,
+    ):
         """
-        # Load environment variables from a .env file one directory up
-        load_dotenv(find_dotenv())
+        Initialize the JobChecker with an optional temperature, the API key is loaded by LLMClient.
 
-        # Get the API key from the environment
-        # Deepseek reasoner is 98x cheaper than OpenAi reasoner - omit base_url to use o1 OpenAi api
-        self.api_key = os.getenv("DEEPSEEK_API_KEY")
-        if self.api_key is None:
-            self.api_key = getpass.getpass("Enter your DEEPSEEK API key: ")
+        :param cache: optional VerdictCache consulted before calling the LLM, repeat listings are answered from disk
+        :param cascade: ask `fast_model` first and only escalate verdicts below `min_confidence` to `model`
+        :param min_confidence: confidence (0-1) a fast verdict needs to be kept
+        :param model: the model every listing goes to without the cascade
+        :param fast_model: the cheaper, quicker first tier of the cascade
+        :param client: LLMClient the requests go through, the process-wide one if omitted
+        """
         self.temperature = temperature
+        # rate limits, retries and the circuit breaker are shared with every other LLM caller
+        self.llm = client or shared_client()
+
+        self.cache = cache
+
+        self.model = model
+        self.fast_model = fast_model
+        self.cascade = cascade
+        self.min_confidence = min_confidence
+        # listings the fast model decided, escalated to `model`, and escalated ones whose match flipped
+        self.fast_accepted = 0
+        self.escalated = 0
+        self.overturned = 0
+
+        # CVProfile.fingerprint() -> its JobPrompt, built on the first evaluation for the profile
+        self._prompts: Dict[str, JobPrompt] = {}
+        self._prompts_lock = threading.Lock()
 
-        # create single client
-        self.client = OpenAI(api_key=self.api_key, base_url="https://api.deepseek.com")
+        # token usage and latency of every LLM call, appended from the evaluation threads
+        self.usage_log: List[Dict[str, float]] = []
+        self._usage_lock = threading.Lock()
 
+    def _prompt(self, cv_profile) -> JobPrompt:
+        key = cv_profile.fingerprint()
+        with self._prompts_lock:
+            prompt = self._prompts.get(key)
+            if prompt is None:
+                prompt = self._prompts[key] = JobPrompt(cv_profile)
+            return prompt
 
     def check_job(self, cv_profile, joblisting):
-        
-        propmt = check_job_with_cv(cv_profile, joblisting)
-
-        messages = propmt.format_messages()
-        systemcontent, usercontent = messages[0].content, messages[1].content        
-        
-        response = self.client.chat.completions.create(
-            model="deepseek-reasoner",
-            messages=[
-                {"role": "user", "content": systemcontent + usercontent},
-            ]
-        )
-        
-        raw_content = response.choices[0].message.content
+        return self.check_jobs(cv_profile, [joblisting])[0]
+
+    def check_jobs(self, cv_profile, listings: List[str], token_budget: int = BATCH_TOKEN_BUDGET) -> List[Optional[dict]]:
+        """
+        Batched version of check_job, returns one verdict (or None) per listing in the same order.
+
+        Uncached listings are packed into as few requests as fit in `token_budget`, so the
+        instructions and CV block are only sent once per batch. Listings missing from a
+        batch response (or the whole batch, if it fails to parse) fall back to single requests.
+        With the cascade the fast model sees every uncached listing first, only the ones it
+        is unsure of go through the batches of `model`.
+        """
+        results: List[Optional[dict]] = [None] * len(listings)
+        pending = []
+
+        # verdicts are cached per model: `model`'s answer every run, the fast model's only with the cascade
+        cached_models = [self.model, self.fast_model] if self.cascade else [self.model]
+        for i, listing in enumerate(listings):
+            if self.cache is not None:
+                cached = self.cache.get_first([self.cache.make_key(cv_profile, listing, model) for model in cached_models])
+                if cached is not None:
+                    results[i] = cached
+                    continue
+            pending.append(i)
+
+        uncached = list(pending)
+        fast_verdicts: Dict[int, dict] = {}
+        if self.cascade:
+            pending = self._fast_pass(cv_profile, listings, pending, token_budget, results, fast_verdicts)
+        # answered by `model`, the rest of `uncached` by the fast model
+        escalated = set(pending)
+
+        for batch in self._pack_batches(cv_profile, listings, pending, token_budget):
+            if len(batch) == 1:
+                verdicts = [self._evaluate(cv_profile, listings[batch[0]], self.model)]
+            else:
+                verdicts = self._evaluate_batch(cv_profile, [listings[i] for i in batch], self.model)
+
+            for i, verdict in zip(batch, verdicts):
+                if verdict is None and len(batch) > 1:
+                    verdict = self._evaluate(cv_profile, listings[i], self.model)
+                results[i] = verdict
+                if i in fast_verdicts and verdict is not None and fast_verdicts[i].get("match") != verdict.get("match"):
+                    with self._usage_lock:
+                        self.overturned += 1
+                    METRICS.inc("cascade_overturned")
+
+        # only cache verdicts that parsed, a bad response should be retried next run
+        if self.cache is not None:
+            for i in uncached:
+                if results[i] is not None:
+                    model = self.model if i in escalated else self.fast_model
+                    self.cache.set(self.cache.make_key(cv_profile, listings[i], model), results[i])
+
+        return results
+
+    def _fast_pass(
+        self,
+        cv_profile,
+        listings: List[str],
+        indices: List[int],
+        token_budget: int,
+        results: List[Optional[dict]],
+        fast_verdicts: Dict[int, dict],
+    ) -> List[int]:
+        """
+        First tier of the cascade: confident fast verdicts go into `results`, the parsed but unsure
+        ones into `fast_verdicts` (to count the ones `model` overturns).
+
+        :return: indices of the listings to escalate to `model`
+        """
+        escalate = []
+        for batch in self._pack_batches(cv_profile, listings, indices, token_budget):
+            max_tokens = CASCADE_MAX_TOKENS_PER_JOB * len(batch)
+            if len(batch) == 1:
+                verdicts = [self._evaluate(cv_profile, listings[batch[0]], self.fast_model, max_tokens)]
+            else:
+                verdicts = self._evaluate_batch(
+                    cv_profile, [listings[i] for i in batch], self.fast_model, max_tokens
+                )
+            for i, verdict in zip(batch, verdicts):
+                if self._is_confident(verdict):
+                    results[i] = verdict
+                    continue
+                if verdict is not None:
+                    fast_verdicts[i] = verdict
+                escalate.append(i)
+
+        with self._usage_lock:
+            self.fast_accepted += len(indices) - len(escalate)
+            self.escalated += len(escalate)
+        METRICS.inc("cascade_fast_accepted", len(indices) - len(escalate))
+        METRICS.inc("cascade_escalated", len(escalate))
+        return escalate
+
+    def _is_confident(self, verdict: Optional[dict]) -> bool:
+        if not isinstance(verdict, dict) or verdict.get("match") not in ("True", "False"):
+            return False
+        try:
+            return float(verdict.get("confidence")) >= self.min_confidence
+        except (TypeError, ValueError):
+            return False
+
+    def _pack_batches(self, cv_profile, listings: List[str], indices: List[int], token_budget: int) -> List[List[int]]:
+        # greedily fills batches up to the budget, a listing too big for any batch goes on its own
+        if not indices:
+            return []
+        overhead = self._prompt(cv_profile).batch_overhead
+        batches: List[List[int]] = []
+        current: List[int] = []
+        used = overhead
+
+        for i in indices:
+            cost = estimate_tokens(listings[i]) + 8  # + the "### JOB <id>" header
+            if current and used + cost > token_budget:
+                batches.append(current)
+                current, used = [], overhead
+            current.append(i)
+            used += cost
+
+        if current:
+            batches.append(current)
+        return batches
+
+    def _complete(self, messages: List[Dict[str, str]], model: str, listings: int, max_tokens: Optional[int]) -> str:
+        kwargs = {"max_tokens": max_tokens} if max_tokens else {}
+        started = time.perf_counter()
+        response = self.llm.complete(model, messages, **kwargs)
+        self._record_usage(response, model, listings=listings, seconds=time.perf_counter() - started)
+        return response.choices[0].message.content or ""
+
+    def _evaluate(self, cv_profile, joblisting, model: str, max_tokens: Optional[int] = None) -> Optional[dict]:
+        messages = self._prompt(cv_profile).single(joblisting)
+        raw_content = self._complete(messages, model, 1, max_tokens)
+        return self.__clean_response__(raw_content)
+
+    def _evaluate_batch(
+        self, cv_profile, joblistings: List[str], model: str, max_tokens: Optional[int] = None
+    ) -> List[Optional[dict]]:
+        # one request for several listings, verdicts are mapped back through the "id" field
+        messages = self._prompt(cv_profile).batch(joblistings)
+        raw_content = self._complete(messages, model, len(joblistings), max_tokens)
         result_data = self.__clean_response__(raw_content)
-    
-        # print(result_data)
-        return result_data
+
+        verdicts: List[Optional[dict]] = [None] * len(joblistings)
+        if not isinstance(result_data, list):
+            print(f"Batch response from {model} was not a JSON array")
+            return verdicts
+
+        for position, item in enumerate(result_data):
+            if not isinstance(item, dict):
+                continue
+            try:
+                index = int(item.pop("id", position))
+            except (TypeError, ValueError):
+                index = position
+            if 0 <= index < len(verdicts) and verdicts[index] is None:
+                verdicts[index] = item
+
+        return verdicts
+
+    def _record_usage(self, response, model: str, listings: int, seconds: float = 0.0) -> None:
+        input_tokens, cached_input_tokens, output_tokens = usage_tokens(getattr(response, "usage", None))
+        entry = {
+            "model": model,
+            "listings": listings,
+            "seconds": seconds,
+            "input_tokens": input_tokens,
+            "cached_input_tokens": cached_input_tokens,
+            "output_tokens": output_tokens,
+            "cost_usd": llm_cost(model, input_tokens, cached_input_tokens, output_tokens),
+        }
+        with self._usage_lock:
+            self.usage_log.append(entry)
+        METRICS.record_llm_usage(
+            model,
+            input_tokens,
+            output_tokens,
+            seconds,
+            # the fast tier gets its own latency percentiles
+            stage="llm_call_fast" if self.cascade and model == self.fast_model else "llm_call",
+            cached_input_tokens=cached_input_tokens,
+        )
+        METRICS.inc("llm_listings", listings)
+
+    def usage_summary(self) -> Dict[str, float]:
+        # totals over every LLM call made so far
+        with self._usage_lock:
+            calls = len(self.usage_log)
+            input_tokens = sum(e["input_tokens"] for e in self.usage_log)
+            cached_input_tokens = sum(e["cached_input_tokens"] for e in self.usage_log)
+            output_tokens = sum(e["output_tokens"] for e in self.usage_log)
+            listings = sum(e["listings"] for e in self.usage_log)
+        return {
+            "calls": calls,
+            "listings": listings,
+            "input_tokens": input_tokens,
+            # input tokens served from the provider's prefix cache, the rest were processed from scratch
+            "cached_input_tokens": cached_input_tokens,
+            "uncached_input_tokens": input_tokens - cached_input_tokens,
+            "cache_hit_rate": round(cached_input_tokens / input_tokens, 3) if input_tokens else 0.0,
+            "output_tokens": output_tokens,
+            "input_tokens_per_listing": round(input_tokens / listings, 1) if listings else 0.0,
+        }
+
+    def cascade_summary(self) -> Dict[str, Optional[float]]:
+        """
+        How the cascade did: listings the fast model decided and escalated, and the LLM time and
+        cost saved against sending every one of them to `model`. That estimate prices each listing
+        at the average of this run's `model` calls, so it is None until some listing was escalated
+        (and runs high when escalations went out in smaller batches than a plain run would send).
+        Seconds are summed over calls (which overlap), not wall time.
+        """
+        with self._usage_lock:
+            fast = [e for e in self.usage_log if e["model"] == self.fast_model]
+            strong = [e for e in self.usage_log if e["model"] == self.model]
+            accepted, escalated, overturned = self.fast_accepted, self.escalated, self.overturned
+
+        decided = accepted + escalated
+        fast_s = sum(e["seconds"] for e in fast)
+        fast_cost = sum(e["cost_usd"] for e in fast)
+        strong_s = sum(e["seconds"] for e in strong)
+        strong_cost = sum(e["cost_usd"] for e in strong)
+        strong_listings = sum(e["listings"] for e in strong)
+
+        saved_s = saved_cost = None
+        if strong_listings:
+            # what the fast tier's listings would have cost on `model`, minus what they cost instead
+            saved_s = strong_s / strong_listings * accepted - fast_s
+            saved_cost = strong_cost / strong_listings * accepted - fast_cost
+        return {
+            "listings": decided,
+            "fast_accepted": accepted,
+            "escalated": escalated,
+            "escalation_rate": round(escalated / decided, 3) if decided else 0.0,
+            # escalated listings whose verdict the strong model flipped, high means the threshold is useful
+            "overturned": overturned,
+            "min_confidence": self.min_confidence,
+            "fast_llm_s": round(fast_s, 2),
+            "strong_llm_s": round(strong_s, 2),
+            "fast_cost_usd": round(fast_cost, 4),
+            "strong_cost_usd": round(strong_cost, 4),
+            "saved_llm_s": None if saved_s is None else round(saved_s, 2),
+            "saved_cost_usd": None if saved_cost is None else round(saved_cost, 4),
+        }
 
     def __clean_response__(self, raw_content):
         # clean content from response by removing ```json``` tags to allow for json parsing
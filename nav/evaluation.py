@@ -0,0 +1,140 @@
+import logging
+import queue
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+
+from config import EVAL_WORKERS, EVAL_QUEUE_SIZE, EVAL_BATCH_SIZE
+from models.job import JobListing
+from services.metrics import METRICS
+
+logger = logging.getLogger(__name__)
+
+# pushed once per worker on close() so each one exits after draining the queue
+_STOP = object()
+
+
+class EvaluationPipeline:
+    """
+    Producer/consumer stage that decouples the browser from the LLM.
+
+    The scraper submit()s listings into a bounded queue and a pool of worker
+    threads runs them through JobChecker concurrently. Each worker takes whatever
+    is already queued, up to `batch_size` listings, and checks them in one batched
+    request with JobChecker.check_jobs. When the queue is full submit() blocks,
+    so the browser can never run more than `queue_size` listings ahead of the
+    evaluators. `on_result` receives every verdict and is called under a lock,
+    so it can write to the CSV without its own locking.
+
+    Listings can be submitted against different CV profiles (one per candidate).
+    With `profiles` > 1 the queue and each worker's take are scaled by it, and
+    what a worker takes is grouped per profile into batches of up to `batch_size`,
+    so interleaved candidates still share batched requests.
+    """
+
+    def __init__(
+        self,
+        jobchecker,
+        cv_profile,
+        on_result: Callable[[JobListing, Optional[dict], object], None],
+        workers: int = EVAL_WORKERS,
+        queue_size: int = EVAL_QUEUE_SIZE,
+        batch_size: int = EVAL_BATCH_SIZE,
+        profiles: int = 1,
+    ):
+        """
+        :param jobchecker: JobChecker the listings are evaluated with
+        :param cv_profile: profile listings are checked against unless submit() names another one
+        :param on_result: called with (listing, verdict or None, profile) for every evaluated listing
+        :param workers: concurrent evaluations
+        :param queue_size: listings (per profile) submit() may queue before it blocks
+        :param batch_size: max listings of one profile per LLM request
+        :param profiles: number of profiles listings are interleaved across
+        """
+        self.jobchecker = jobchecker
+        self.cv_profile = cv_profile
+        self.on_result = on_result
+        self.workers = max(1, workers)
+        self.batch_size = max(1, batch_size)
+        self.profiles = max(1, profiles)
+
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max(1, queue_size) * self.profiles)
+        self._result_lock = threading.Lock()
+        self._threads: List[threading.Thread] = []
+
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+
+    def start(self) -> None:
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._worker, name=f"job-eval-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def submit(self, listing: JobListing, cv_profile=None) -> None:
+        # blocks while the queue is full, this is the backpressure on the scraper
+        self._queue.put((cv_profile if cv_profile is not None else self.cv_profile, listing))
+        self.submitted += 1
+
+    def close(self) -> None:
+        # waits for every submitted listing to be evaluated, then stops the workers
+        for _ in self._threads:
+            self._queue.put(_STOP)
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+
+    def _next_batch(self) -> List:
+        # blocks for the first listing, then takes whatever else is queued up to batch_size per profile
+        batch = [self._queue.get()]
+        while len(batch) < self.batch_size * self.profiles and batch[-1] is not _STOP:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _worker(self) -> None:
+        while True:
+            batch = self._next_batch()
+            stopping = batch[-1] is _STOP
+
+            # one request never mixes CVs
+            groups: Dict[int, Tuple[object, List[JobListing]]] = {}
+            for item in batch:
+                if item is _STOP:
+                    continue
+                cv_profile, listing = item
+                groups.setdefault(id(cv_profile), (cv_profile, []))[1].append(listing)
+
+            for cv_profile, listings in groups.values():
+                for start in range(0, len(listings), self.batch_size):
+                    self._evaluate(cv_profile, listings[start:start + self.batch_size])
+            if stopping:
+                return
+
+    def _evaluate(self, cv_profile, listings: List[JobListing]) -> None:
+        try:
+            # cache lookups and every LLM request for the batch, see llm_call for the requests alone
+            with METRICS.track("evaluate"):
+                if len(listings) == 1:
+                    outputs = [self.jobchecker.check_job(cv_profile, listings[0].markdown)]
+                else:
+                    outputs = self.jobchecker.check_jobs(
+                        cv_profile, [listing.markdown for listing in listings]
+                    )
+        except Exception as e:
+            print(f"Error evaluating job: {str(e)}")
+            with self._result_lock:
+                self.failed += len(listings)
+            METRICS.inc("jobs_eval_failed", len(listings))
+            return
+        METRICS.inc("jobs_evaluated", len(listings))
+
+        with self._result_lock:
+            for listing, output in zip(listings, outputs):
+                self.completed += 1
+                try:
+                    self.on_result(listing, output, cv_profile)
+                except Exception as e:
+                    logger.error(f"Error handling job verdict: {e}")
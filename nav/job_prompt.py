@@ -1,11 +1,17 @@
-from langchain.prompts import (
-    ChatPromptTemplate,
-    SystemMessagePromptTemplate,
-    HumanMessagePromptTemplate,
-)
-from typing import List
+import hashlib
+from typing import Dict, List
 
-# template that instructs LLM on how to parse CV sections
+from services.job_text import estimate_tokens
+
+# Layout of every job prompt: the system message (SYS_TEMPLATE) and the start of the user message
+# (CV digest + output format) are identical for every request about the same CV, the job listing(s)
+# come last. Providers with prefix (context) caching, DeepSeek included, only process and bill that
+# shared prefix in full on the first request, so nothing that varies per job may come before it.
+
+# bump whenever the prompts below change in meaning, cached job verdicts are keyed on it (and on PROMPT_DIGEST)
+PROMPT_VERSION = 1
+
+# instructions on how to match a candidate to a job, the same for every CV
 
 SYS_TEMPLATE = """
 You are an AI assistant. You are going to be given a Job listing and a candidate's CV.
@@ -38,58 +44,87 @@ skills: (STRING:  skills, technical or not, frameworks used, tools used, languag
 experience: (INT: years of experience from first rate jobs that are relevant)
 s_info: (STRING: extra information, this should be long and considered vital information that may be needed when looking for jobs)
 
-The output must be in valid JSON
+The output must be in valid JSON with these fields only, the role, company and location are already known
 
 "match": "True" or "False" depending on whether the candidate is a good fit for the job
-"role" : "role name" e.g Software Engineer,
-"company" : "company name" e.g Google,
-"location" : "location of the job" e.g London,
-"description" : "description of the job", e.g python software engineering role entry-level
+"confidence": how sure you are of the match verdict, a number from 0 to 1
 """
 
-HUMAN_TEMPLATE = """
-Below are the sections extracted from the candidate's CV
+SINGLE_TEMPLATE = """
+Below is the candidate's profile, extracted from their CV
 
-{sections}
+{cv}
+
+Return the JSON object with the match and confidence fields only. No extra commentary.
+
+"match": "True" or "False" depending on whether the candidate is a good fit for the job
+"confidence": how sure you are of the match verdict, a number from 0 to 1
 
 And here is the job listing:
 
-{job_listing}
+"""
+
+BATCH_TEMPLATE = """
+Below is the candidate's profile, extracted from their CV
+
+{cv}
 
-Please return the JSON object with all required fields. No extra commentary.
+Next come one or more job listings, each starting with a "### JOB <id>" header.
+Judge every listing independently against the candidate. Return a JSON array with exactly one object per listing,
+in the same order, and no extra commentary. Each object must have these fields:
 
+"id": the <id> number from the listing's header
 "match": "True" or "False" depending on whether the candidate is a good fit for the job
-"role" : "role name" e.g Software Engineer,
-"company" : "company name" e.g Google,
-"location" : "location of the job" e.g London,
-"description" : "description of the job", e.g python software engineering role entry-level
+"confidence": how sure you are of the match verdict, a number from 0 to 1
+
+And here are the job listings:
+
 """
 
-# TODO: Change this so everything other than match is scraped from the job listing, will save heavily on output tokens cost.
-def check_job_with_cv(cvprofile, joblisting) -> ChatPromptTemplate:
-
-    system_msg = SystemMessagePromptTemplate.from_template(SYS_TEMPLATE)
-
-    # format CV data in structured way
-    cv_format = f"""
-    name: {cvprofile.name}
-    level: {cvprofile.level}
-    location: {cvprofile.location}
-    discipline: {cvprofile.discipline}
-    secondary_discipline: {cvprofile.secondary_discipline}
-    grade: {cvprofile.grade}
-    school: {cvprofile.school}
-    qual: {cvprofile.qual}
-    skills: {cvprofile.skills}
-    experience: {cvprofile.experience}
-    s_info: {cvprofile.s_info}
-    """
+# hash of the templates above, so an edited prompt misses the verdict cache even without a PROMPT_VERSION bump
+PROMPT_DIGEST = hashlib.sha256(
+    "\0".join((SYS_TEMPLATE, SINGLE_TEMPLATE, BATCH_TEMPLATE)).encode("utf-8")
+).hexdigest()[:16]
+
 
-    user_msg = HumanMessagePromptTemplate.from_template(
-        HUMAN_TEMPLATE, input_variables=["sections", "job_listing"]
-    )
+def cv_digest(cvprofile) -> str:
+    # the profile fields the matching needs as compact "field: value" lines, empty ones left out
+    lines = []
+    for field in (
+        "name", "level", "location", "discipline", "secondary_discipline", "grade",
+        "school", "qual", "skills", "experience", "s_info",
+    ):
+        value = " ".join(str(getattr(cvprofile, field)).split())
+        if value:
+            lines.append(f"{field}: {value}")
+    return "\n".join(lines)
+
+
+# role, company and location are parsed from the job card (nav/card_parser.py), the LLM only returns the verdict
+class JobPrompt:
+    """
+    The job matching messages for one CV, built once per candidate with plain string templates.
+    Each request is the shared prefix (instructions, CV digest, output format) plus the listing(s).
+    """
 
-    return ChatPromptTemplate.from_messages([system_msg, user_msg]).partial(
-        sections=cv_format,
-        job_listing=joblisting
-    )
+    def __init__(self, cvprofile):
+        cv = cv_digest(cvprofile)
+        self._single_prefix = SINGLE_TEMPLATE.format(cv=cv)
+        self._batch_prefix = BATCH_TEMPLATE.format(cv=cv)
+        # estimated tokens of a batch request before any listing is added, for packing batches
+        self.batch_overhead = estimate_tokens(SYS_TEMPLATE + self._batch_prefix)
+
+    def single(self, joblisting: str) -> List[Dict[str, str]]:
+        return self._messages(self._single_prefix + joblisting)
+
+    def batch(self, joblistings: List[str]) -> List[Dict[str, str]]:
+        # same instructions and CV block as single(), sent once for a whole batch of listings
+        job_listings = "\n\n".join(f"### JOB {i}\n{listing}" for i, listing in enumerate(joblistings))
+        return self._messages(self._batch_prefix + job_listings)
+
+    @staticmethod
+    def _messages(user_content: str) -> List[Dict[str, str]]:
+        return [
+            {"role": "system", "content": SYS_TEMPLATE},
+            {"role": "user", "content": user_content},
+        ]
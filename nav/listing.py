@@ -0,0 +1,44 @@
+from models.job import JobCard, JobListing
+from services.html_text import html_to_text
+from services.job_text import trim_job_text
+from services.metrics import METRICS
+from .card_parser import parse_card_fields
+
+
+def build_listing(job_card: JobCard, desc_html: str, base_url: str) -> JobListing:
+    """
+    Reads role, company, location and link straight from the card HTML and
+    converts the card plus its expanded description to token-budgeted text for the LLM.
+
+    Kept free of scraper state so crawl shards can build listings in their own process.
+
+    :param job_card: A card from the fetch backend (job id, outerHTML and link)
+    :param desc_html: outerHTML of the card's jobs-description panel, "" if it didn't load
+    :param base_url: LinkedIn root the card's relative links are resolved against
+    :return: JobListing holding the card fields and the trimmed Markdown
+    """
+    with METRICS.track("card_parse"):
+        fields = parse_card_fields(job_card.html, base_url)
+
+    with METRICS.track("html_to_text"):
+        card_docs = html_to_text(job_card.html)
+        desc_docs = html_to_text(desc_html)
+    with METRICS.track("trim_text"):
+        converted_docs = trim_job_text(f"{card_docs}\n{desc_docs}", company=fields["company"])
+
+    # short plain-text summary for the CSV, previously generated by the LLM
+    description = " ".join(
+        word.strip("*") for word in trim_job_text(desc_docs, max_tokens=0, company=fields["company"]).split()
+        if not set(word) <= set("#*-=_")  # markdown heading / emphasis markers
+    )
+
+    METRICS.inc("jobs_extracted")
+    return JobListing(
+        markdown=converted_docs,
+        link=fields["link"] or job_card.href,
+        job_id=fields["job_id"] or job_card.job_id,
+        role=fields["role"],
+        company=fields["company"],
+        location=fields["location"],
+        description=description[:300],
+    )
@@ -1,61 +1,90 @@
-from re import sub
+import hashlib
 import sys
 sys.path.append("..")
-from models.job import Job
-import time
-
-from typing import List, Optional
-
-from markdownify import markdownify as md
-
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service as ChromeService
-from selenium.webdriver.remote.webelement import WebElement
-from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import (
-    NoSuchElementException,
-    TimeoutException,
-    WebDriverException,
-)
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.common.by import By
-
-import chromedriver_autoinstaller
+from models.candidate import Candidate
+from models.job import Job, JobCard, JobListing
+from models.search import SearchQuery, QueryStats
+from services.relevance import RelevanceFilter
+from services.seen_jobs import SeenJobIndex
+from services.checkpoint import CrawlCheckpoint
+from services.job_corpus import JobCorpus
+from services.result_sink import ResultSink, open_sink
+from services.metrics import METRICS
+
+from typing import Dict, List, Optional
 
 from .conversation_llm_cv import JobChecker
-import csv
+from .evaluation import EvaluationPipeline
+from .listing import build_listing
+from .sharded import ShardedCrawl
+from .search_plan import plan_shared_queries
+from .backends import FetchBackend, load_backend
+from config import (
+    EVAL_WORKERS,
+    EVAL_BATCH_SIZE,
+    JOBS_PER_PAGE,
+    CRAWL_SHARDS,
+    METRICS_PATH,
+    METRICS_EXPORT_INTERVAL,
+)
+import time
 
 
 class LinkedInJobScraper:
     """
-    A LinkedIn job scraper that:
-      - Logs into LinkedIn
-      - Navigates to a job search based on 'discipline' and 'location' from cv_profile
-      - Iterates through job cards on the page
-      - Extracts job information
-      - Checks if the job matches the candidate’s CV
-      - Scrolls through the page repeatedly until no more new job cards are found
-
-    The logic remains the same as your original code, but with added type hints,
-    docstrings, error handling, and minor improvements. Variable names and method
-    signatures are unchanged to maintain your original flow.
+    Crawls LinkedIn job searches once and matches every new job against one or more candidates:
+      - Opens a FetchBackend (a logged-in Selenium browser by default, or plain HTTP / saved pages)
+      - Runs every planned (keywords, location) query, by default built from each candidate's
+        'discipline', 'secondary_discipline' and 'location'; with `shards` above 1 the results
+        pages of a query are crawled by several processes (ShardedCrawl)
+      - Skips cards whose job id every candidate has already processed (SeenJobIndex), extracts
+        the rest and keeps them in the JobCorpus for rematch.py
+      - Passes each candidate's share through its prefilter to an EvaluationPipeline, whose
+        workers check them with the JobChecker while the crawl carries on, and writes the
+        verdicts to the candidate's ResultSink
+      - Saves a CrawlCheckpoint after every page (query offsets, processed ids, evaluations
+        still pending), so an interrupted run continues with --resume
     """
 
-    BASE_URL = "https://www.linkedin.com/"
-
     def __init__(
         self,
         cv_profile,
         username: str,
         password: str,
         headless: bool = False,
+        jobchecker: Optional[JobChecker] = None,
+        eval_workers: int = EVAL_WORKERS,
+        eval_batch_size: int = EVAL_BATCH_SIZE,
+        prefilter: Optional[RelevanceFilter] = None,
+        seen_index: Optional[SeenJobIndex] = None,
+        backend: Optional[FetchBackend] = None,
+        shards: int = CRAWL_SHARDS,
+        queries: Optional[List[SearchQuery]] = None,
+        checkpoint: Optional[CrawlCheckpoint] = None,
+        sink: Optional[ResultSink] = None,
+        metrics_path: Optional[str] = METRICS_PATH,
+        candidates: Optional[List[Candidate]] = None,
+        corpus: Optional[JobCorpus] = None,
     ):
         """
         :param cv_profile: A CVProfile-like object containing candidate data
         :param username: LinkedIn username (email)
         :param password: LinkedIn password
         :param headless: Whether to run Chrome in headless mode
+        :param jobchecker: A preconfigured JobChecker (e.g. with a verdict cache), one is created if omitted
+        :param eval_workers: Number of concurrent LLM evaluations running alongside the browser
+        :param eval_batch_size: Max listings packed into one LLM request, 1 sends every listing on its own
+        :param prefilter: Local relevance scorer deciding which listings reach the LLM, defaults to config thresholds
+        :param seen_index: Cross-run index of processed job ids, known ids are skipped before clicking
+        :param backend: Where cards and descriptions come from, defaults to a logged-in Selenium browser
+        :param shards: Crawl processes, above 1 each runs its own copy of the backend (see ShardedCrawl)
+        :param queries: Searches to run, defaults to plan_shared_queries() over every candidate
+        :param checkpoint: Where progress is saved after every page, resumed from if it was opened with resume=True
+        :param sink: Where verdicts are written, defaults to the matches in matched_jobs.csv
+        :param metrics_path: Where the run's METRICS are exported with every checkpoint (.prom or .json), None disables it
+        :param candidates: Everyone the scraped jobs are matched against, each with its own prefilter and sink;
+            defaults to cv_profile alone with `prefilter` and `sink`
+        :param corpus: Where every extracted listing is kept for rematch.py, None keeps nothing
         """
         self.username = username
         self.password = password
@@ -63,280 +92,358 @@ class LinkedInJobScraper:
         self.cv_profile = cv_profile
 
         # This is your LLM-based job checker
-        self.jobchecker = JobChecker()
-
-        # Will be assigned in init_browser()
-        self.driver: Optional[webdriver.Chrome] = None
-        
-        self.job_counter = 0
-        
-        self.csv_path = "matched_jobs.csv"
+        self.jobchecker = jobchecker or JobChecker()
+        self.seen_index = seen_index or SeenJobIndex()
+        self.checkpoint = checkpoint or CrawlCheckpoint()
+
+        # everyone the jobs are matched against, a single-CV run is one candidate
+        self.candidates = candidates or [
+            Candidate(
+                name=cv_profile.name or "candidate",
+                profile=cv_profile,
+                prefilter=prefilter or RelevanceFilter(cv_profile),
+                # buffered, batches are written every few verdicts and before each checkpoint
+                sink=sink or open_sink(candidate=cv_profile.fingerprint()),
+            )
+        ]
+        self._candidates: Dict[str, Candidate] = {candidate.key: candidate for candidate in self.candidates}
+        # ranking a page for top-k means holding its listings back until the page is done
+        self._rank_pages = any(candidate.prefilter.top_k for candidate in self.candidates)
+
+        # the checkpoint belongs to this exact set of CVs
+        if len(self.candidates) == 1:
+            self._profile_key = self.candidates[0].key
+        else:
+            self._profile_key = hashlib.sha256("\n".join(sorted(self._candidates)).encode("utf-8")).hexdigest()
+
+        # job ids processed in earlier runs for every candidate (loaded in run()) or earlier in this one
+        self._seen_ids: set = set()
+        # every job id met on a results page of the current query, used to detect pages that repeat
+        self._run_ids: set = set()
+
+        self.queries = queries or plan_shared_queries([candidate.profile for candidate in self.candidates])
+        self.query_stats: Dict[SearchQuery, QueryStats] = {query: QueryStats() for query in self.queries}
+        self._current_query = self.queries[0]
+        # job ids handled in this run -> the query that found them first
+        self._query_of: Dict[str, SearchQuery] = {}
+
+        self.backend = backend or load_backend("selenium")(username, password, headless=headless)
+        self.shards = max(1, shards)
+        # Will be assigned in run() when sharded
+        self.crawl: Optional[ShardedCrawl] = None
         
-        self._init_csv()
 
-    def init_browser(self) -> None:
-        """
-        Installs (if necessary) and launches a Chrome driver with specified options.
-        """
-        chromedriver_autoinstaller.install()
-        chrome_options = Options()
-        if self.headless:
-            chrome_options.add_argument("--headless")
-            chrome_options.add_argument("--no-sandbox")
-            chrome_options.add_argument("--disable-dev-shm-usage")
-
-        self.driver = webdriver.Chrome(options=chrome_options)
-        self.driver.maximize_window()
-        
-    def _init_csv(self) -> None:
-        try:
-            with open(self.csv_path, "r", encoding="utf-8") as f:
-                pass
-        except FileNotFoundError:
-            with open(self.csv_path, "w", newline="", encoding="utf-8") as f:
-                writer = csv.writer(f)
-                writer.writerow(["row", "role", "company", "location", "description", "link"])
+        # Will be assigned in run(), evaluates listings off the browser thread
+        self.pipeline: Optional[EvaluationPipeline] = None
+        self.eval_workers = eval_workers
+        self.eval_batch_size = eval_batch_size
+
+        self.metrics_path = metrics_path
+        self.corpus = corpus
 
     # Pseudocode changes in run() to keep it short:
 
     def run(self) -> None:
-        self.init_browser()
+        for candidate in self.candidates:
+            candidate.seen = self.seen_index.load(candidate.key, candidate.prefilter.settings_key())
+        # a card is only skipped before extraction when every candidate has already processed it
+        self._seen_ids = set.intersection(*(candidate.seen for candidate in self.candidates))
+        print(f"[INFO] {len(self._seen_ids)} previously processed jobs will be skipped")
+
+        resumed = self.checkpoint.load(self._profile_key)
+        if resumed:
+            self._seen_ids |= self.checkpoint.processed
+
+        self.pipeline = EvaluationPipeline(
+            self.jobchecker,
+            self.cv_profile,
+            self._handle_verdict,
+            workers=self.eval_workers,
+            batch_size=self.eval_batch_size,
+            profiles=len(self.candidates),
+        )
+        self.pipeline.start()
         try:
-            self.login()
-
-            # We'll loop pages until we see "No matching jobs found."
-            start_offset = 0
-            while True:
-                # Build the page URL with `start` param
-                # e.g. &start=25, &start=50, etc.
-                self.navigate_search(self.cv_profile.discipline, self.cv_profile.location, start=start_offset)
-
-                found_any_jobs = self.parse_job_cards()  # parse them
-
-                # If the page HTML has "No matching jobs found." or parse_job_cards returns no jobs
-                if not found_any_jobs or self._page_has_no_jobs():
-                    print("[INFO] No more jobs, stopping.")
-                    break
+            if resumed:
+                # listings the last run sent to the LLM without getting a verdict back
+                for candidate_key, listing in self.checkpoint.take_pending():
+                    self.pipeline.submit(listing, self._candidates[candidate_key].profile)
+
+            if self.shards > 1:
+                # each shard opens its own session, the scraper's backend is only the template
+                self.crawl = ShardedCrawl(self.backend.name, self.backend.spec(), self.shards)
+            else:
+                self.backend.open()
 
-                # Increase offset by 25 for next page
-                start_offset += 25
+            # one query at a time, ids handled by an earlier query are skipped before extraction
+            for query in self.queries:
+                if self.checkpoint.is_done(query):
+                    print(f"[INFO] Skipping {query}, finished before the checkpoint")
+                    continue
+                print(f"[INFO] Searching {query}")
+                self._current_query = query
+                started = time.perf_counter()
+                try:
+                    if self.crawl is not None:
+                        self._crawl_sharded(query)
+                    else:
+                        self._crawl_query(query)
+                finally:
+                    self.query_stats[query].seconds += time.perf_counter() - started
+                self.checkpoint.finish(query)
+                self._save_checkpoint()
 
         except Exception as e:
             print(f"[ERROR] A top-level error occurred: {e}")
         finally:
-            self.__del__()
-    
-    def _page_has_no_jobs(self) -> bool:
-        page_source = self.driver.page_source
-        return "No matching jobs found." in page_source
-
-
-
-    def login(self) -> None:
-        if not self.driver:
-            raise ValueError("WebDriver is not initialized.")
-
-        self.driver.get(f"{self.BASE_URL}login")
-
-        try:
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.ID, "username"))
-            )
-            email = self.driver.find_element(By.ID, "username")
-            password_field = self.driver.find_element(By.ID, "password")
-            submit_button = self.driver.find_element(
-                By.CSS_SELECTOR, "button[type='submit']"
-            )
-
-            email.send_keys(self.username)
-            password_field.send_keys(self.password)
-            submit_button.click()
-
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.CLASS_NAME, "artdeco-card"))
+            # let the evaluators finish whatever the browser already queued
+            self.pipeline.close()
+            # whatever is still pending failed or never ran, --resume retries it
+            self._save_checkpoint()
+            # buffered sinks write their last batch
+            for candidate in self.candidates:
+                candidate.sink.close()
+            print(
+                f"[INFO] Evaluated {self.pipeline.completed}/{self.pipeline.submitted} jobs "
+                f"({self.pipeline.failed} failed)"
             )
-            print("LOGIN SUCCESSFUL")
-        except (NoSuchElementException, TimeoutException, WebDriverException) as e:
-            print(f"[ERROR] Login failed: {e}")
-            raise
-
-    def __url__space_sub__(self, query: str) -> str:
-        """
-        Replaces spaces in the query with '%20' for URL formatting.
-
-        :param query: A string to be URL-encoded for spaces
-        :return: The same string with spaces replaced by '%20'
-        """
-        return sub(" ", "%20", query)
-
-    def navigate_search(self, query: str, location: str, start:int = 0) -> None:
-        if not self.driver:
-            raise ValueError("WebDriver is not initialized.")
-
-        query = self.__url__space_sub__(query) 
-        location = self.__url__space_sub__(location)
-
-        # Base search URL
-        search_url = f"{self.BASE_URL}jobs/search/?keywords={query}&location={location}"
-        
-        # Only add start parameter if not zero
-        if start > 0:
-            search_url += f"&start={start}"
-
-        self.driver.get(search_url)
-        try:
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located(
-                    (By.CSS_SELECTOR, "[class*='jobs-search-results-list']")
-                )
-            )
-            print("JOB SEARCH NAV SUCCESSFUL")
-        except TimeoutException as e:
-            print(f"[ERROR] Could not load job search results: {e}")
-            raise
+            if self.pipeline.failed:
+                print("[INFO] Failed jobs stay pending in the checkpoint, run again with --resume to retry them")
+            print(f"[INFO] Skipped {self.seen_index.skipped} already processed jobs")
+            if len(self.candidates) == 1:
+                print(f"[INFO] Prefilter: {self.candidates[0].prefilter.report()}")
+            else:
+                for candidate in self.candidates:
+                    print(
+                        f"[INFO] Candidate {candidate.name}: {candidate.sent_to_llm} sent to the LLM, "
+                        f"{candidate.matches} matches, prefilter {candidate.prefilter.report()}"
+                    )
+            for query, stats in self.query_stats.items():
+                print(f"[INFO] Query {query}: {stats.as_dict()}")
+            if self.crawl is not None:
+                print(f"[INFO] Sharded crawl: {self.crawl.report()}")
+            print(f"[INFO] LLM usage: {self.jobchecker.usage_summary()}")
+            print(f"[INFO] LLM client: {self.jobchecker.llm.report()}")
+            if self.corpus is not None:
+                print(f"[INFO] Job corpus: {self.corpus.stats()}")
+            if self.jobchecker.cascade:
+                print(f"[INFO] Model cascade: {self.jobchecker.cascade_summary()}")
+            self.backend.close()
+            if self.metrics_path:
+                METRICS.export(self.metrics_path)
+            print(f"[INFO] Run metrics:\n{METRICS.summary_table()}")
+    
+    def _save_checkpoint(self) -> None:
+        # rows go out before the checkpoint that no longer lists their listings as pending; evaluators
+        # keep resolving listings meanwhile, so the state is taken first and a verdict that lands
+        # after it is only redone on --resume, never dropped
+        state = self.checkpoint.snapshot()
+        for candidate in self.candidates:
+            candidate.sink.flush()
+        if self.corpus is not None:
+            self.corpus.flush()
+        self.checkpoint.save(state)
+        if self.metrics_path:
+            METRICS.maybe_export(self.metrics_path, METRICS_EXPORT_INTERVAL)
+
+    def _crawl_query(self, query: SearchQuery) -> None:
+        # the repeated-page check is per query, other queries legitimately return the same jobs
+        self._run_ids = set()
+
+        # We'll loop pages until we see "No matching jobs found."
+        # (or resume after the last page a checkpoint recorded)
+        start_offset = self.checkpoint.offset(query)
+        while True:
+            # Build the page URL with `start` param
+            # e.g. &start=25, &start=50, etc.
+            with METRICS.track("navigation"):
+                self.backend.search(query.keywords, query.location, start=start_offset)
+            self.query_stats[query].pages += 1
+            METRICS.inc("pages_crawled")
+
+            found_any_jobs = self.parse_job_cards()  # parse them
+
+            # If the page HTML has "No matching jobs found." or parse_job_cards returns no jobs
+            if not found_any_jobs or self.backend.page_has_no_jobs():
+                print("[INFO] No more jobs, stopping.")
+                break
+
+            # Increase offset by 25 for next page
+            start_offset += JOBS_PER_PAGE
+            self.checkpoint.advance(query, start_offset)
+            self._save_checkpoint()
+
+    def _crawl_sharded(self, query: SearchQuery) -> None:
+        stats = self.query_stats[query]
+        for page, listings, known_ids in self.crawl.run(query.keywords, query.location, self._seen_ids):
+            stats.pages += 1
+            # shards skip every id known when they started, from earlier runs and earlier queries alike
+            for job_id in known_ids:
+                if job_id in self._query_of:
+                    stats.duplicates += 1
+                    METRICS.inc("jobs_duplicate")
+                else:
+                    stats.known += 1
+                    self.seen_index.skipped += 1
+                    METRICS.inc("jobs_known")
+            stats.cards += len(known_ids)
+            METRICS.inc("cards_seen", len(known_ids) + len(listings))
+            # shards only know the ids seen when they started, drop what this run already handled
+            fresh = []
+            for listing in listings:
+                if listing.job_id in self._seen_ids:
+                    stats.duplicates += 1
+                    METRICS.inc("jobs_duplicate")
+                    continue
+                if listing.job_id:
+                    self._seen_ids.add(listing.job_id)
+                    self._query_of[listing.job_id] = query
+                fresh.append(listing)
+            stats.cards += len(listings)
+            stats.new += len(fresh)
+            print(f"[INFO] Page {page}: {len(fresh)} new jobs")
+            self._submit_listings(fresh)
+            # shards finish pages out of order, so only ids are checkpointed and a
+            # resumed sharded query starts again from page 0, skipping them
+            self._save_checkpoint()
+
+        print("[INFO] No more jobs, stopping.")
 
     def parse_job_cards(self) -> bool:
-        if not self.driver:
-            raise ValueError("WebDriver is not initialized.")
-
-        processed_jobs = []
-        last_height = self.driver.execute_script("return document.body.scrollHeight")
+        # with top-k enabled a whole round of cards is ranked together before anything is evaluated
+        page_listings: List[JobListing] = []
         
         found_job_list = False  # We'll flip this to True if we see any jobs
 
-        while True:
-            jobs_cards = self.driver.find_elements(By.CSS_SELECTOR, "li[data-occludable-job-id]")
-            if jobs_cards:
+        for jobs_cards in self.backend.iter_card_batches(self._seen_ids):
+            # past the last page some searches serve earlier results again, that counts as no jobs
+            page_ids = {job_card.job_id for job_card in jobs_cards}
+            if page_ids - self._run_ids:
                 found_job_list = True  # We found at least one job in this round
-
+            self._run_ids |= page_ids
+
+            # known ids are skipped before any click or extraction, this also covers
+            # cards already handled in an earlier scroll round of this page
+            stats = self.query_stats[self._current_query]
+            stats.cards += len(jobs_cards)
+            METRICS.inc("cards_seen", len(jobs_cards))
+            new_cards = []
             for job_card in jobs_cards:
-                try:
-                    self.driver.execute_script("arguments[0].scrollIntoView(true);", job_card)
-                    time.sleep(0.5)
-
-                    job_info = self.extract_job_info(job_card)
-                    output = self.jobchecker.check_job(self.cv_profile, job_info)
-
-                    if output and output.get("match") == "True":
-                        print("MATCH FOUND")
-                        link = self._extract_job_link(job_card)
-                        # Save to CSV as before
-                        job = Job(
-                            match=True,
-                            role=output.get("role", ""),
-                            company=output.get("company", ""),
-                            location=output.get("location", ""),
-                            description=output.get("description", ""),
-                            link=link,
-                        )
-                        self._save_job_csv(job)
-
-                    job_card.click()
-                    time.sleep(1)
-                    processed_jobs.append(job_card)
+                if job_card.job_id in self._query_of:
+                    # an earlier query of this run already has it (or an earlier scroll round of this page)
+                    if self._query_of[job_card.job_id] != self._current_query:
+                        stats.duplicates += 1
+                        METRICS.inc("jobs_duplicate")
+                    continue
+                if job_card.job_id in self._seen_ids:
+                    self.seen_index.skipped += 1
+                    stats.known += 1
+                    METRICS.inc("jobs_known")
+                    continue
+                if job_card.job_id:
+                    self._seen_ids.add(job_card.job_id)
+                    self._query_of[job_card.job_id] = self._current_query
+                new_cards.append(job_card)
+            stats.new += len(new_cards)
 
+            for job_card, desc_html in self.backend.fetch_details(new_cards):
+                try:
+                    listing = self.extract_job_info(job_card, desc_html)
+                    if self._rank_pages:
+                        page_listings.append(listing)
+                    else:
+                        self._submit_listings([listing])
                 except Exception as e:
                     print(f"Error processing job: {str(e)}")
                     continue
 
-            self.scroll_to_page_bottom()
-            new_height = self.driver.execute_script("return document.body.scrollHeight")
-            if new_height == last_height:
-                break  # No more new content to scroll
-            last_height = new_height
+            self._submit_listings(page_listings)
+            page_listings = []
 
         return found_job_list
 
     
-    def _save_job_csv(self, job: Job) -> None:
-        self.job_counter += 1
-        with open(self.csv_path, "a", newline="", encoding="utf-8") as f:
-            writer = csv.writer(f)
-            writer.writerow([
-                self.job_counter,
-                job.role,
-                job.company,
-                job.location,
-                job.description,
-                job.link,
-            ])
-
-    def scroll_to_page_bottom(self) -> None:
-        """
-        Scrolls the window to the bottom of the page to trigger lazy-loaded items.
-        """
-        if not self.driver:
-            raise ValueError("WebDriver is not initialized.")
-        self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-        time.sleep(2)
-
-    def extract_job_info(self, job_element: WebElement) -> str:
-        """
-        Extracts the job card HTML and the expanded job description HTML,
-        then converts them to Markdown.
-
-        :param job_element: A Selenium WebElement representing a single job listing
-        :return: Markdown-formatted text containing the job info
-        """
-        card_html = job_element.get_attribute("outerHTML")
-
-        job_element.click()
-        time.sleep(1)
+    def _submit_listings(self, listings: List[JobListing]) -> None:
+        if self.corpus is not None and listings:
+            # kept whatever the verdicts, so the jobs can be matched again offline
+            with METRICS.track("corpus_write"):
+                self.corpus.add_many(
+                    listings, [self._query_of.get(listing.job_id, self._current_query) for listing in listings]
+                )
 
-        # Wait for the job description panel
-        try:
-            desc_panel = WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.CLASS_NAME, "jobs-description"))
+        # every listing was extracted once, each candidate gets the ones it hasn't processed before
+        for candidate in self.candidates:
+            fresh = [listing for listing in listings if listing.job_id not in candidate.seen]
+
+            # only listings that clear the candidate's prefilter cost an LLM call
+            selected = candidate.prefilter.select(fresh)
+            selected_ids = {id(listing) for listing in selected}
+            for listing in fresh:
+                if id(listing) not in selected_ids:
+                    self.seen_index.record(
+                        listing.job_id, candidate.key, SeenJobIndex.FILTERED, candidate.prefilter.settings_key()
+                    )
+                    METRICS.inc("jobs_filtered")
+
+            for listing in selected:
+                self._stats_for(listing).sent_to_llm += 1
+                candidate.sent_to_llm += 1
+                METRICS.inc("jobs_sent_to_llm")
+                # pending first, so no checkpoint has it processed without a way to redo it
+                self.checkpoint.add_pending(listing, candidate.key)
+                # blocks if the evaluators are too far behind
+                self.pipeline.submit(listing, candidate.profile)
+
+        for listing in listings:
+            self.checkpoint.mark_processed(listing.job_id)
+
+    def _stats_for(self, listing: JobListing) -> QueryStats:
+        # credited to the query that first found the job
+        query = self._query_of.get(listing.job_id, self._current_query)
+        return self.query_stats[query]
+
+    def _handle_verdict(self, listing: JobListing, output: Optional[dict], cv_profile) -> None:
+        # called by the evaluation pipeline (serialised) once a listing has been checked for a candidate
+        if output is None:
+            return
+        candidate = self._candidates[cv_profile.fingerprint()]
+
+        match = output.get("match") == "True"
+        verdict = SeenJobIndex.MATCH if match else SeenJobIndex.NO_MATCH
+        self.seen_index.record(listing.job_id, candidate.key, verdict)
+
+        if match:
+            print("MATCH FOUND" if len(self.candidates) == 1 else f"MATCH FOUND for {candidate.name}")
+            self._stats_for(listing).matches += 1
+            candidate.matches += 1
+            METRICS.inc("matches")
+        candidate.sink.write(
+            Job(
+                match=match,
+                role=listing.role,
+                company=listing.company,
+                location=listing.location,
+                description=listing.description,
+                link=listing.link,
+                job_id=listing.job_id,
             )
-            desc_html = desc_panel.get_attribute("outerHTML")
-        except TimeoutException:
-            desc_html = ""
+        )
 
-        full_html = f"{card_html}\n{desc_html}"
-        converted_docs = md(full_html, strip=["a"]) 
-        return converted_docs
-    
-
-    def _extract_job_link(self, job_element: WebElement) -> str:
-        try:
-            anchor = job_element.find_element(By.TAG_NAME, "a")
-            return anchor.get_attribute("href") or ""
-        except NoSuchElementException:
-            return ""
-        
-    def go_to_next_page(self) -> bool:
-        if not self.driver:
-            raise ValueError("WebDriver is not initialized.")
-
-        try:
-            pagination = self.driver.find_element(By.CLASS_NAME, "artdeco-pagination__pages")
-            next_btn = pagination.find_element(By.XPATH, ".//button[@aria-label='Next page']")
-            if "disabled" in next_btn.get_attribute("class"):
-                return False
-            else:
-                next_btn.click()
-                # Let the page load
-                WebDriverWait(self.driver, 10).until(
-                    EC.presence_of_element_located((By.CLASS_NAME, "jobs-search-results-list"))
-                )
-                print("[INFO] Moved to next page.")
-                time.sleep(2)
-                return True
-        except NoSuchElementException:
-            print("[INFO] No next page found.")
-            return False
-        except TimeoutException:
-            print("[INFO] Next page took too long to load, stopping.")
-            return False
+        # resolved once the row is buffered; the sink is flushed before every checkpoint, and
+        # after a crash in between --resume re-evaluates the listing without duplicating its row
+        self.checkpoint.resolve(listing.job_id, candidate.key)
 
+    def extract_job_info(self, job_card: JobCard, desc_html: str) -> JobListing:
+        """
+        :param job_card: A card from the fetch backend (job id, outerHTML and link)
+        :param desc_html: outerHTML of the card's jobs-description panel, "" if it didn't load
+        :return: JobListing holding the card fields and the trimmed Markdown, see build_listing
+        """
+        return build_listing(job_card, desc_html, self.backend.base_url)
 
     def __del__(self) -> None:
         """
-        Ensures that the driver is properly quit when the scraper is deleted.
+        Ensures that the browser / session is properly closed when the scraper is deleted.
         """
-        if getattr(self, "driver", None):
-            try:
-                self.driver.quit()
-                print("[INFO] Browser closed.")
-            except Exception as e:
-                print(f"[WARN] Error closing browser: {e}")
+        if getattr(self, "backend", None):
+            self.backend.close()
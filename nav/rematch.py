@@ -0,0 +1,131 @@
+from typing import Dict, List, Optional
+
+from config import EVAL_BATCH_SIZE, EVAL_WORKERS, JOBS_PER_PAGE, METRICS_PATH
+from models.candidate import Candidate
+from models.job import Job, JobListing
+from services.job_corpus import JobCorpus
+from services.metrics import METRICS
+
+from .conversation_llm_cv import JobChecker
+from .evaluation import EvaluationPipeline
+
+
+class CorpusRematch:
+    """
+    Matches the listings stored in a JobCorpus against every candidate again, without a
+    browser or any request to LinkedIn: the offline counterpart of LinkedInJobScraper, with
+    the same prefilters, evaluation pipeline, JobChecker and result sinks.
+
+    Listings are read in pages of `page_size` in the order they were scraped, so a prefilter's
+    top_k still applies per page of results. Nothing is recorded in the seen index or the crawl
+    checkpoint, a rematch doesn't change what the next crawl skips.
+    """
+
+    def __init__(
+        self,
+        corpus: JobCorpus,
+        candidates: List[Candidate],
+        jobchecker: Optional[JobChecker] = None,
+        eval_workers: int = EVAL_WORKERS,
+        eval_batch_size: int = EVAL_BATCH_SIZE,
+        metrics_path: Optional[str] = METRICS_PATH,
+        page_size: int = JOBS_PER_PAGE,
+    ):
+        """
+        :param corpus: where the listings come from
+        :param candidates: everyone the listings are matched against, each with its own prefilter and sink
+        :param jobchecker: A preconfigured JobChecker (e.g. with a verdict cache), one is created if omitted
+        :param eval_workers: Number of concurrent LLM evaluations
+        :param eval_batch_size: Max listings packed into one LLM request
+        :param metrics_path: Where the run's METRICS are exported at the end (.prom or .json), None disables it
+        :param page_size: listings read from the corpus and prefiltered together
+        """
+        self.corpus = corpus
+        self.candidates = candidates
+        self._candidates: Dict[str, Candidate] = {candidate.key: candidate for candidate in candidates}
+        self.jobchecker = jobchecker or JobChecker()
+        self.eval_workers = eval_workers
+        self.eval_batch_size = eval_batch_size
+        self.metrics_path = metrics_path
+        self.page_size = max(1, page_size)
+
+        self.listings = 0
+        # Will be assigned in run()
+        self.pipeline: Optional[EvaluationPipeline] = None
+
+    def run(self, **filters) -> None:
+        """
+        :param filters: passed on to JobCorpus.listings(), e.g. since or keywords
+        """
+        self.pipeline = EvaluationPipeline(
+            self.jobchecker,
+            self.candidates[0].profile,
+            self._handle_verdict,
+            workers=self.eval_workers,
+            batch_size=self.eval_batch_size,
+            profiles=len(self.candidates),
+        )
+        self.pipeline.start()
+        try:
+            page: List[JobListing] = []
+            for listing in self.corpus.listings(**filters):
+                page.append(listing)
+                if len(page) == self.page_size:
+                    self._submit_listings(page)
+                    page = []
+            self._submit_listings(page)
+        finally:
+            self.pipeline.close()
+            for candidate in self.candidates:
+                candidate.sink.close()
+
+            print(
+                f"[INFO] Rematched {self.listings} stored jobs, evaluated {self.pipeline.completed}/"
+                f"{self.pipeline.submitted} ({self.pipeline.failed} failed)"
+            )
+            for candidate in self.candidates:
+                print(
+                    f"[INFO] Candidate {candidate.name}: {candidate.sent_to_llm} sent to the LLM, "
+                    f"{candidate.matches} matches, prefilter {candidate.prefilter.report()}"
+                )
+            print(f"[INFO] LLM usage: {self.jobchecker.usage_summary()}")
+            print(f"[INFO] LLM client: {self.jobchecker.llm.report()}")
+            if self.jobchecker.cascade:
+                print(f"[INFO] Model cascade: {self.jobchecker.cascade_summary()}")
+            if self.metrics_path:
+                METRICS.export(self.metrics_path)
+            print(f"[INFO] Run metrics:\n{METRICS.summary_table()}")
+
+    def _submit_listings(self, listings: List[JobListing]) -> None:
+        self.listings += len(listings)
+        METRICS.inc("jobs_rematched", len(listings))
+        for candidate in self.candidates:
+            selected = candidate.prefilter.select(listings)
+            METRICS.inc("jobs_filtered", len(listings) - len(selected))
+            for listing in selected:
+                candidate.sent_to_llm += 1
+                METRICS.inc("jobs_sent_to_llm")
+                # blocks if the evaluators are too far behind
+                self.pipeline.submit(listing, candidate.profile)
+
+    def _handle_verdict(self, listing: JobListing, output: Optional[dict], cv_profile) -> None:
+        # called by the evaluation pipeline (serialised) once a listing has been checked for a candidate
+        if output is None:
+            return
+        candidate = self._candidates[cv_profile.fingerprint()]
+
+        match = output.get("match") == "True"
+        if match:
+            candidate.matches += 1
+            METRICS.inc("matches")
+        candidate.sink.write(
+            Job(
+                match=match,
+                role=listing.role,
+                company=listing.company,
+                location=listing.location,
+                description=listing.description,
+                link=listing.link,
+                job_id=listing.job_id,
+            )
+        )
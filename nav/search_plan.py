@@ -0,0 +1,78 @@
+from typing import Iterable, List, Optional
+
+from config import SEARCH_EXTRA_KEYWORDS, SEARCH_EXTRA_LOCATIONS, MAX_SEARCH_QUERIES
+from models.search import SearchQuery
+
+
+def _unique(values: Iterable[str]) -> List[str]:
+    # drops blanks and case/whitespace variants, keeping the first spelling
+    seen = set()
+    unique = []
+    for value in values:
+        value = " ".join((value or "").split())
+        if value and value.lower() not in seen:
+            seen.add(value.lower())
+            unique.append(value)
+    return unique
+
+
+def plan_queries(
+    cv_profile,
+    keywords: Optional[List[str]] = None,
+    locations: Optional[List[str]] = None,
+    max_queries: int = MAX_SEARCH_QUERIES,
+) -> List[SearchQuery]:
+    """
+    Builds the (keywords, location) searches for a run.
+
+    Keywords default to the CV's discipline and secondary discipline plus
+    SEARCH_EXTRA_KEYWORDS, locations to the CV's location plus SEARCH_EXTRA_LOCATIONS.
+    Explicit keywords / locations (e.g. from the command line) replace the defaults.
+    The main discipline in the main location always comes first.
+
+    :param cv_profile: A CVProfile-like object containing candidate data
+    :param keywords: search keywords / title variants to use instead of the profile's
+    :param locations: locations to use instead of the profile's
+    :param max_queries: cap on the number of queries, 0 for no cap
+    :return: deduplicated queries in crawl order
+    """
+    keywords = _unique(
+        keywords or [cv_profile.discipline, cv_profile.secondary_discipline, *SEARCH_EXTRA_KEYWORDS]
+    ) or [""]
+    locations = _unique(locations or [cv_profile.location, *SEARCH_EXTRA_LOCATIONS]) or [""]
+
+    # keyword-major, so every location gets the primary keywords before any variant
+    queries = [SearchQuery(keyword, location) for keyword in keywords for location in locations]
+    if max_queries > 0:
+        queries = queries[:max_queries]
+    return queries
+
+
+def plan_shared_queries(
+    cv_profiles: List,
+    keywords: Optional[List[str]] = None,
+    locations: Optional[List[str]] = None,
+    max_queries: int = MAX_SEARCH_QUERIES,
+) -> List[SearchQuery]:
+    """
+    The queries of several candidates, crawled once for all of them.
+
+    Each profile's plan_queries() are merged round-robin (every candidate's first
+    query, then every second one, ...) with repeats dropped, so candidates in the
+    same discipline and location share their searches.
+
+    :param cv_profiles: CVProfile-like objects of every candidate
+    :param keywords: search keywords / title variants to use instead of the profiles'
+    :param locations: locations to use instead of the profiles'
+    :param max_queries: cap on the number of queries, 0 for no cap
+    :return: deduplicated queries in crawl order
+    """
+    plans = [plan_queries(cv_profile, keywords, locations, max_queries=0) for cv_profile in cv_profiles]
+    queries: List[SearchQuery] = []
+    for rank in range(max((len(plan) for plan in plans), default=0)):
+        for plan in plans:
+            if rank < len(plan) and plan[rank] not in queries:
+                queries.append(plan[rank])
+    if max_queries > 0:
+        queries = queries[:max_queries]
+    return queries
@@ -0,0 +1,273 @@
+import logging
+import multiprocessing as mp
+import queue
+import sys
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+from config import JOBS_PER_PAGE, SHARD_PAGE_ATTEMPTS, SHARD_QUEUE_SIZE
+from models.job import JobListing
+from services.metrics import METRICS
+from .backends import load_backend
+from .listing import build_listing
+
+logger = logging.getLogger(__name__)
+
+# stop_page starts here, i.e. no shard has seen the end of the results yet
+_NO_END = sys.maxsize
+
+
+def _crawl_shard(
+    shard: int,
+    backend_name: str,
+    backend_spec: Dict[str, Any],
+    query: str,
+    location: str,
+    known_ids: Iterable[str],
+    next_page,
+    stop_page,
+    lock,
+    retry,
+    results,
+) -> None:
+    """
+    Body of one shard process: opens its own backend session, then keeps claiming a page to
+    crawl, one that failed earlier (`retry`, shared) before the next unclaimed one, until
+    neither is left below the shared stop_page.
+
+    A page that fails goes back on `retry` with its attempt count, for whichever shard is
+    free next, and this shard reopens its session before carrying on.
+
+    Messages put on `results`:
+      ("page", shard, (page, [JobListing, ...], [known id, ...], metrics))  one per results page crawled,
+                                                          known ids = cards skipped as already seen
+      ("page_failed", shard, (page, message, retried))    a page failed, retried = it went back on `retry`
+      ("error", shard, message)                           the shard gave up early
+      ("done", shard, metrics)                            always last
+
+    metrics is the shard's METRICS.state() recorded since its previous message, for the parent to merge.
+    """
+    backend = load_backend(backend_name)(**backend_spec)
+    # ids this shard already fetched, on top of the ones processed in earlier runs
+    seen = set(known_ids)
+    run_ids: set = set()
+    try:
+        backend.open()
+        while True:
+            # `retry` is a SimpleQueue (puts are synchronous) and only touched under the lock
+            with lock:
+                if not retry.empty():
+                    page, attempt = retry.get()
+                    if page >= stop_page.value:
+                        continue
+                else:
+                    page, attempt = next_page.value, 1
+                    if page >= stop_page.value:
+                        break
+                    next_page.value = page + 1
+
+            try:
+                found_any_jobs = _crawl_page(backend, page, query, location, seen, run_ids, shard, results)
+            except Exception as e:
+                retried = attempt < SHARD_PAGE_ATTEMPTS
+                if retried:
+                    with lock:
+                        retry.put((page, attempt + 1))
+                results.put(("page_failed", shard, (page, str(e), retried)))
+                # the session may be what broke, a failure to reopen it ends the shard
+                backend.close()
+                backend.open()
+                continue
+
+            # pages past this one are empty too, no shard needs to claim them
+            if not found_any_jobs:
+                with lock:
+                    stop_page.value = min(stop_page.value, page)
+    except Exception as e:
+        results.put(("error", shard, str(e)))
+    finally:
+        try:
+            backend.close()
+        finally:
+            results.put(("done", shard, METRICS.state(reset=True)))
+
+
+def _crawl_page(backend, page: int, query: str, location: str, seen: set, run_ids: set, shard: int, results) -> bool:
+    """
+    Crawls one results page and puts its "page" message on `results`. `seen` and `run_ids`
+    only take the page's ids once it made it, a page that fails half way is crawled again
+    from scratch.
+
+    :return: False if the page is past the end of the results
+    """
+    with METRICS.track("navigation"):
+        backend.search(query, location, start=page * JOBS_PER_PAGE)
+    METRICS.inc("pages_crawled")
+
+    # the backend's live view of the processed ids, see FetchBackend.iter_card_batches
+    live = set(seen)
+    page_ids: set = set()
+    known: List[str] = []
+    listings: List[JobListing] = []
+    for job_cards in backend.iter_card_batches(live):
+        page_ids.update(job_card.job_id for job_card in job_cards)
+
+        known.extend(job_card.job_id for job_card in job_cards if job_card.job_id in live)
+        new_cards = [job_card for job_card in job_cards if job_card.job_id not in live]
+        live.update(job_card.job_id for job_card in new_cards if job_card.job_id)
+
+        for job_card, desc_html in backend.fetch_details(new_cards):
+            try:
+                listings.append(build_listing(job_card, desc_html, backend.base_url))
+            except Exception as e:
+                print(f"Error processing job: {str(e)}")
+
+    # past the last page some searches serve earlier results again, that counts as no jobs
+    found_any_jobs = bool(page_ids - run_ids) and not backend.page_has_no_jobs()
+    results.put(("page", shard, (page, listings, known, METRICS.state(reset=True))))
+    seen |= live
+    run_ids |= page_ids
+    return found_any_jobs
+
+
+class ShardedCrawl:
+    """
+    Crawls one search with `shards` processes, each with its own backend session.
+
+    Results pages are handed out from a shared counter, so shards always work on
+    disjoint offsets: the first free shard claims page 0, the next page 1 and so on.
+    The first shard that meets "No matching jobs found." (or a page with nothing new)
+    lowers the shared stop page, so shards stop claiming pages beyond it while the
+    ones still busy on earlier pages finish. Listings are built inside the shards and
+    streamed back per page; run() yields them with duplicate job ids dropped.
+
+    A page that fails is handed out again, to the next free shard, up to SHARD_PAGE_ATTEMPTS
+    times. If the crawl still ends without every page up to the last one (e.g. a page kept
+    failing, or every shard died), run() raises once it has yielded what did arrive, so the
+    scraper doesn't record the query as finished and --resume crawls it again.
+    """
+
+    def __init__(self, backend_name: str, backend_spec: Dict[str, Any], shards: int):
+        """
+        :param backend_name: one of BACKENDS, each shard builds its own instance
+        :param backend_spec: constructor arguments from FetchBackend.spec()
+        :param shards: number of worker processes
+        """
+        self.backend_name = backend_name
+        self.backend_spec = dict(backend_spec)
+        # nobody watches N browser windows, shards always run headless
+        if "headless" in self.backend_spec:
+            self.backend_spec["headless"] = True
+        self.shards = max(1, shards)
+
+        self.pages_crawled = 0
+        self.pages_failed = 0
+        self.duplicates = 0
+        # cards the shards skipped because their id was already known
+        self.skipped = 0
+
+    def run(self, query: str, location: str, known_ids: Iterable[str]) -> Iterator[Tuple[int, List[JobListing], List[str]]]:
+        """
+        Starts the shards and yields (page number, new listings, skipped known ids)
+        as pages come in, in completion order rather than page order.
+
+        :param query: search keywords
+        :param location: search location
+        :param known_ids: job ids to skip, e.g. from the seen-job index
+        """
+        # spawn, the parent already runs evaluator threads that a fork would copy mid-flight
+        ctx = mp.get_context("spawn")
+        next_page = ctx.Value("q", 0, lock=False)
+        stop_page = ctx.Value("q", _NO_END, lock=False)
+        lock = ctx.Lock()
+        # (page, attempt) of the pages to crawl again
+        retry = ctx.SimpleQueue()
+        # bounded, a shard blocks instead of running far ahead of the evaluators
+        results = ctx.Queue(maxsize=self.shards * SHARD_QUEUE_SIZE)
+        known_ids = list(known_ids)
+
+        processes = [
+            ctx.Process(
+                target=_crawl_shard,
+                args=(
+                    shard, self.backend_name, self.backend_spec, query, location,
+                    known_ids, next_page, stop_page, lock, retry, results,
+                ),
+                name=f"crawl-shard-{shard}",
+                daemon=True,
+            )
+            for shard in range(self.shards)
+        ]
+        for process in processes:
+            process.start()
+        print(f"[INFO] Crawling with {self.shards} {self.backend_name} shards")
+
+        delivered: set = set()
+        pages_done: set = set()
+        # pages that failed for good, shards that gave up
+        failures: List[str] = []
+        running = set(range(self.shards))
+        try:
+            while running:
+                try:
+                    kind, shard, payload = results.get(timeout=1)
+                except queue.Empty:
+                    # a shard that died without saying "done" (e.g. killed) must not hang the run
+                    for shard in [shard for shard in running if not processes[shard].is_alive()]:
+                        running.discard(shard)
+                        failures.append(f"shard {shard} exited with {processes[shard].exitcode}")
+                    continue
+
+                if kind == "page":
+                    page, listings, known, metrics = payload
+                    # shard timers and counters end up in this process' METRICS
+                    METRICS.merge(metrics)
+                    self.pages_crawled += 1
+                    pages_done.add(page)
+                    self.skipped += len(known)
+                    fresh = []
+                    for listing in listings:
+                        if listing.job_id in delivered:
+                            self.duplicates += 1
+                            continue
+                        delivered.add(listing.job_id)
+                        fresh.append(listing)
+                    yield page, fresh, known
+                elif kind == "page_failed":
+                    page, message, retried = payload
+                    self.pages_failed += 1
+                    METRICS.inc("pages_failed")
+                    logger.error(
+                        f"Crawl shard {shard} failed on page {page}: {message}"
+                        + (", handing it out again" if retried else "")
+                    )
+                elif kind == "error":
+                    logger.error(f"Crawl shard {shard} failed: {payload}")
+                    failures.append(f"shard {shard}: {payload}")
+                elif kind == "done":
+                    running.discard(shard)
+                    METRICS.merge(payload)
+
+            # every page before the one that ended the results must have made it
+            if stop_page.value == _NO_END:
+                missing = "the end of the results was never reached"
+            else:
+                lost = sorted(set(range(stop_page.value + 1)) - pages_done)
+                missing = f"pages {lost} were not crawled" if lost else ""
+            if missing:
+                raise RuntimeError(
+                    f"Sharded crawl of {query} @ {location} incomplete, {missing}"
+                    + (f" ({'; '.join(failures)})" if failures else "")
+                )
+        finally:
+            for process in processes:
+                process.join(timeout=5)
+                if process.is_alive():
+                    process.terminate()
+
+    def report(self) -> Dict[str, Any]:
+        return {
+            "shards": self.shards,
+            "pages": self.pages_crawled,
+            "pages_failed": self.pages_failed,
+            "duplicates_dropped": self.duplicates,
+        }
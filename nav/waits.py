@@ -0,0 +1,55 @@
+import time
+
+from config import PACING_FACTOR, PACING_MIN_DELAY, PACING_MAX_DELAY
+from services.metrics import METRICS, Timers
+
+
+class WaitTracker(Timers):
+    """
+    Accumulates the time spent waiting on the browser, per kind of wait,
+    so a run can show where a page's seconds go. The most recent `max_samples`
+    waits of each kind are kept for the p50/p95 in report().
+
+    Every wait is also recorded in the run's METRICS as "fetch.<label>".
+    """
+
+    def add(self, label: str, seconds: float) -> None:
+        # the http backend records waits from its fetch threads, both are thread-safe
+        super().add(label, seconds)
+        METRICS.add(f"fetch.{label}", seconds)
+
+
+class AdaptiveDelay:
+    """
+    Politeness delay between actions that follows how fast the site is responding.
+
+    observe() is fed the duration of real readiness waits; the delay is an
+    exponentially weighted average of those, scaled by `factor` and clamped to
+    [min_delay, max_delay]. A fast page costs almost nothing, a throttled one backs off.
+    """
+
+    def __init__(
+        self,
+        factor: float = PACING_FACTOR,
+        min_delay: float = PACING_MIN_DELAY,
+        max_delay: float = PACING_MAX_DELAY,
+        smoothing: float = 0.3,
+    ):
+        self.factor = factor
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.smoothing = smoothing
+        self._average = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self._average += self.smoothing * (seconds - self._average)
+
+    @property
+    def current(self) -> float:
+        return min(self.max_delay, max(self.min_delay, self._average * self.factor))
+
+    def sleep(self) -> float:
+        delay = self.current
+        if delay > 0:
+            time.sleep(delay)
+        return delay
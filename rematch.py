@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+import argparse
+import logging
+import os
+import time
+
+from config import LOG_LEVEL, JOB_CORPUS_PATH, REMATCH_RESULTS_PATH
+from main import add_matching_args, build_candidates
+from services.job_corpus import JobCorpus
+from services.llm_client import LLMClient
+from services.result_sink import run_path
+from services.verdict_cache import VerdictCache
+
+# matches the listings earlier crawls kept in the job corpus (see --corpus in main.py) against a CV
+# again, e.g. after the CV, the job prompt or the prefilter changed, without opening LinkedIn
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Match the jobs stored by earlier crawls against a CV again, without scraping LinkedIn."
+    )
+    parser.add_argument(
+        "pdf_paths",
+        nargs="+",
+        metavar="pdf_path",
+        help="path to the candidate's CV as a PDF; with several CVs the stored jobs are matched against each",
+    )
+    add_matching_args(parser, results_path=REMATCH_RESULTS_PATH)
+    parser.add_argument(
+        "--corpus",
+        default=JOB_CORPUS_PATH,
+        help=f"job corpus written by main.py (default: {JOB_CORPUS_PATH})",
+    )
+    parser.add_argument("--since-days", type=float, help="only jobs scraped in the last N days")
+    parser.add_argument("--keywords", help="only jobs found by a search for these keywords")
+    parser.add_argument("--location", help="only jobs found by a search in this location")
+    parser.add_argument("--job-ids", nargs="+", help="only these LinkedIn job ids")
+    return parser.parse_args()
+
+
+def main() -> None:
+    logging.basicConfig(level=LOG_LEVEL, format="%(asctime)s [%(levelname)s] %(name)s - %(message)s")
+
+    args = parse_args()
+    if not os.path.exists(args.corpus):
+        raise SystemExit(f"No job corpus at {args.corpus}, run main.py first (or point --corpus at one)")
+
+    corpus = JobCorpus(args.corpus)
+    filters = {
+        "since": time.time() - args.since_days * 86400 if args.since_days is not None else None,
+        "keywords": args.keywords,
+        "location": args.location,
+        "job_ids": args.job_ids,
+    }
+    stored = corpus.count(**filters)
+    print(f"[INFO] {stored} stored jobs to rematch, corpus {corpus.stats()}")
+    if not stored:
+        corpus.close()
+        return
+
+    # every rematch gets a results file of its own, named after when it ran, so its verdicts
+    # never mix with (or get dropped as duplicates of) an earlier run's
+    args.output = run_path(args.output)
+    print(f"[INFO] Writing results to {args.output}")
+
+    # one client for the whole run, so the CV and job requests count against the same quota
+    llm = LLMClient(requests_per_minute=args.llm_rpm, tokens_per_minute=args.llm_tpm)
+    candidates = build_candidates(args, llm)
+
+    cache = VerdictCache(bypass=args.no_cache)
+    if args.purge_cache:
+        cache.purge()
+
+    from nav.conversation_llm_cv import JobChecker
+    from nav.rematch import CorpusRematch
+
+    CorpusRematch(
+        corpus,
+        candidates,
+        jobchecker=JobChecker(cache=cache, cascade=args.cascade, min_confidence=args.min_confidence, client=llm),
+        eval_workers=args.workers,
+        eval_batch_size=args.batch_size,
+        metrics_path=args.metrics or None,
+    ).run(**filters)
+
+    print(f"[INFO] Verdict cache: {cache.stats()}")
+    cache.close()
+    corpus.close()
+
+
+if __name__ == "__main__":
+    main()
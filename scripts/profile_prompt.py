@@ -1,9 +1,11 @@
-from langchain.prompts import (
-    ChatPromptTemplate,
-    SystemMessagePromptTemplate,
-    HumanMessagePromptTemplate,
-)
-from typing import List
+from typing import TYPE_CHECKING, List
+
+if TYPE_CHECKING:
+    # langchain takes most of a second to import, it is only loaded once a prompt is built
+    from langchain.prompts import ChatPromptTemplate
+
+# bump whenever the prompt (or what it is fed) changes, cached CV profiles are keyed on it
+PROMPT_VERSION = 1
 
 # template that instructs LLM on how to parse CV sections
 
@@ -47,7 +49,9 @@ Please return the JSON object with all required fields. No extra commentary.
 """
 
 
-def build_cv_prompt(sections: List[dict]) -> ChatPromptTemplate:
+def build_cv_prompt(sections: List[dict]) -> "ChatPromptTemplate":
+    from langchain.prompts import ChatPromptTemplate, HumanMessagePromptTemplate, SystemMessagePromptTemplate
+
     system_msg = SystemMessagePromptTemplate.from_template(SYS_TEMPALTE)
 
     formatted_sections = []
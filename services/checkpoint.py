@@ -0,0 +1,159 @@
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from dataclasses import asdict
+from typing import Dict, List, Optional, Set, Tuple
+
+from config import CHECKPOINT_PATH
+from models.job import JobListing
+from models.search import SearchQuery
+
+logger = logging.getLogger(__name__)
+
+
+def _query_key(query: SearchQuery) -> str:
+    return f"{query.keywords}\t{query.location}"
+
+
+def _pending_key(candidate_key: str, job_id: str) -> str:
+    return f"{candidate_key}\t{job_id}"
+
+
+class CrawlCheckpoint:
+    """
+    JSON snapshot of how far a run got, so a crashed or interrupted run can be resumed.
+
+    It holds the next results offset of every query (and whether the query is finished),
+    the job ids extracted so far and the listings handed to the LLM that have no verdict
+    yet, per candidate they were sent for. Every save() writes a temporary file next to the checkpoint and renames it over
+    the old one, so a crash mid-write leaves the previous snapshot intact.
+
+    Without `resume` load() starts from scratch (and the next save() replaces whatever
+    an earlier run left), so a later run can still resume this one.
+    """
+
+    VERSION = 2
+
+    def __init__(self, path: str = CHECKPOINT_PATH, resume: bool = False):
+        self.path = path
+        self.resume = resume
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # save() is called by the scraper while evaluator threads resolve pending listings
+        self._lock = threading.Lock()
+        self._profile_key = ""
+        self._queries: Dict[str, Dict] = {}
+        self.processed: Set[str] = set()
+        # "<candidate key>\t<job id>" -> (candidate key, listing)
+        self.pending: Dict[str, Tuple[str, JobListing]] = {}
+
+    def load(self, profile_key: str) -> bool:
+        """
+        :param profile_key: CVProfile.fingerprint() (or a key over every candidate's), a checkpoint of other CVs is not resumed
+        :return: True if an earlier run's state was restored
+        """
+        self._profile_key = profile_key
+        if not self.resume:
+            return False
+
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            print("[INFO] No checkpoint to resume, starting from the beginning")
+            return False
+        except (OSError, ValueError) as e:
+            logger.error(f"Unreadable checkpoint {self.path}, starting from the beginning: {e}")
+            return False
+
+        if state.get("version") != self.VERSION or state.get("profile_key") != profile_key:
+            print("[INFO] Checkpoint belongs to another CV, starting from the beginning")
+            return False
+
+        self._queries = state["queries"]
+        self.processed = set(state["processed"])
+        self.pending = {}
+        for entry in state["pending"]:
+            listing = JobListing(**entry["listing"])
+            self.pending[_pending_key(entry["candidate"], listing.job_id)] = (entry["candidate"], listing)
+        print(
+            f"[INFO] Resuming checkpoint from {time.ctime(state['saved_at'])}: "
+            f"{len(self.processed)} jobs processed, {len(self.pending)} evaluations pending"
+        )
+        return True
+
+    def offset(self, query: SearchQuery) -> int:
+        return self._queries.get(_query_key(query), {}).get("offset", 0)
+
+    def is_done(self, query: SearchQuery) -> bool:
+        return self._queries.get(_query_key(query), {}).get("done", False)
+
+    def advance(self, query: SearchQuery, offset: int) -> None:
+        with self._lock:
+            self._queries[_query_key(query)] = {"offset": offset, "done": False}
+
+    def finish(self, query: SearchQuery) -> None:
+        with self._lock:
+            self._queries[_query_key(query)] = {"offset": self.offset(query), "done": True}
+
+    def mark_processed(self, job_id: str) -> None:
+        with self._lock:
+            self.processed.add(job_id)
+
+    def add_pending(self, listing: JobListing, candidate_key: str) -> None:
+        with self._lock:
+            self.pending[_pending_key(candidate_key, listing.job_id)] = (candidate_key, listing)
+
+    def resolve(self, job_id: str, candidate_key: str) -> None:
+        # a verdict was recorded, nothing to redo for this listing and candidate
+        with self._lock:
+            self.pending.pop(_pending_key(candidate_key, job_id), None)
+
+    def take_pending(self) -> List[Tuple[str, JobListing]]:
+        # (candidate key, listing) of every evaluation still waiting for a verdict
+        with self._lock:
+            return list(self.pending.values())
+
+    def snapshot(self) -> Dict:
+        """
+        The state save() writes, as of now. Taken before the result sinks are flushed, a
+        listing resolved in between stays pending in it instead of being lost with its row.
+        """
+        with self._lock:
+            return {
+                "version": self.VERSION,
+                "profile_key": self._profile_key,
+                "saved_at": time.time(),
+                "queries": dict(self._queries),
+                "processed": sorted(self.processed),
+                "pending": [
+                    {"candidate": candidate_key, "listing": asdict(listing)}
+                    for candidate_key, listing in self.pending.values()
+                ],
+            }
+
+    def save(self, state: Optional[Dict] = None) -> None:
+        """
+        :param state: a snapshot() to write, the current state if omitted
+        """
+        if state is None:
+            state = self.snapshot()
+
+        directory = os.path.dirname(self.path) or "."
+        fd, tmp_path = tempfile.mkstemp(prefix=".checkpoint-", suffix=".tmp", dir=directory)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(state, f)
+                f.flush()
+                os.fsync(f.fileno())
+            # atomic on POSIX and Windows, readers see the old or the new snapshot, never half of one
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
@@ -0,0 +1,197 @@
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Dict, Iterator, List, Optional
+
+from config import JOB_CORPUS_COMPRESSION_LEVEL, JOB_CORPUS_FLUSH_EVERY, JOB_CORPUS_PATH
+from models.job import JobListing
+from models.search import SearchQuery
+
+logger = logging.getLogger(__name__)
+
+
+class JobCorpus:
+    """
+    SQLite store of every listing the scraper extracted, so jobs can be matched again
+    (rematch.py) against another CV, prompt or prefilter without going back to LinkedIn.
+
+    The listing text (the Markdown the LLM is given) is stored as a zlib blob, the card
+    fields, the search query that found the job and when it was scraped are plain columns
+    indexed for lookups by job id, date and query. A job scraped again replaces its row.
+    Rows are buffered and written `flush_every` at a time (the scraper also flushes before
+    every checkpoint), so storing a listing doesn't cost a transaction of its own.
+    """
+
+    def __init__(
+        self,
+        path: str = JOB_CORPUS_PATH,
+        level: int = JOB_CORPUS_COMPRESSION_LEVEL,
+        flush_every: int = JOB_CORPUS_FLUSH_EVERY,
+    ):
+        self.path = path
+        self.level = level
+        self.flush_every = max(1, flush_every)
+        self.added = 0
+        self._buffer: List[tuple] = []
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS jobs (
+                job_id TEXT PRIMARY KEY,
+                keywords TEXT NOT NULL COLLATE NOCASE,
+                search_location TEXT NOT NULL COLLATE NOCASE,
+                scraped_at REAL NOT NULL,
+                role TEXT NOT NULL,
+                company TEXT NOT NULL,
+                location TEXT NOT NULL,
+                link TEXT NOT NULL,
+                description TEXT NOT NULL,
+                markdown BLOB NOT NULL,
+                markdown_bytes INTEGER NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_scraped_at ON jobs(scraped_at)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_query ON jobs(keywords, search_location)")
+        self._conn.commit()
+
+    def add_many(self, listings: List[JobListing], queries: List[SearchQuery]) -> None:
+        """
+        :param listings: extracted listings, ones without a job id can't be indexed and are skipped
+        :param queries: the search that found each listing, in the same order
+        """
+        now = time.time()
+        rows = []
+        for listing, query in zip(listings, queries):
+            if not listing.job_id:
+                continue
+            raw = listing.markdown.encode("utf-8")
+            rows.append((
+                listing.job_id,
+                query.keywords,
+                query.location,
+                now,
+                listing.role,
+                listing.company,
+                listing.location,
+                listing.link,
+                listing.description,
+                zlib.compress(raw, self.level),
+                len(raw),
+            ))
+        with self._lock:
+            self._buffer.extend(rows)
+            if len(self._buffer) >= self.flush_every:
+                self._flush_locked()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        if not self._buffer:
+            return
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO jobs (job_id, keywords, search_location, scraped_at, role, company, "
+            "location, link, description, markdown, markdown_bytes) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            self._buffer,
+        )
+        self._conn.commit()
+        self.added += len(self._buffer)
+        self._buffer = []
+
+    def listings(
+        self,
+        since: Optional[float] = None,
+        keywords: Optional[str] = None,
+        location: Optional[str] = None,
+        job_ids: Optional[List[str]] = None,
+    ) -> Iterator[JobListing]:
+        """
+        Stored listings, oldest first, decompressed as they are read.
+
+        :param since: only jobs scraped at or after this unix time
+        :param keywords: only jobs found by a search for these keywords (case-insensitive)
+        :param location: only jobs found by a search in this location (case-insensitive)
+        :param job_ids: only these jobs
+        """
+        where, params = self._filters(since, keywords, location, job_ids)
+        with self._lock:
+            self._flush_locked()
+            rows = self._conn.execute(
+                f"SELECT job_id, role, company, location, link, description, markdown FROM jobs{where} "
+                "ORDER BY scraped_at, rowid",
+                params,
+            ).fetchall()
+        for job_id, role, company, job_location, link, description, blob in rows:
+            try:
+                markdown = zlib.decompress(blob).decode("utf-8")
+            except zlib.error as e:
+                logger.error(f"Skipping corrupt corpus entry {job_id}: {e}")
+                continue
+            yield JobListing(
+                markdown=markdown,
+                link=link,
+                job_id=job_id,
+                role=role,
+                company=company,
+                location=job_location,
+                description=description,
+            )
+
+    def count(
+        self,
+        since: Optional[float] = None,
+        keywords: Optional[str] = None,
+        location: Optional[str] = None,
+        job_ids: Optional[List[str]] = None,
+    ) -> int:
+        where, params = self._filters(since, keywords, location, job_ids)
+        with self._lock:
+            self._flush_locked()
+            return self._conn.execute(f"SELECT COUNT(*) FROM jobs{where}", params).fetchone()[0]
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            self._flush_locked()
+            jobs, raw, stored = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(markdown_bytes), 0), COALESCE(SUM(LENGTH(markdown)), 0) FROM jobs"
+            ).fetchone()
+        return {
+            "jobs": jobs,
+            "added": self.added,
+            "text_mb": round(raw / 1e6, 2),
+            "stored_mb": round(stored / 1e6, 2),
+            "compression_ratio": round(raw / stored, 2) if stored else 0.0,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._flush_locked()
+            self._conn.close()
+
+    @staticmethod
+    def _filters(since, keywords, location, job_ids) -> tuple:
+        clauses, params = [], []
+        if since is not None:
+            clauses.append("scraped_at >= ?")
+            params.append(since)
+        if keywords:
+            clauses.append("keywords = ?")
+            params.append(keywords)
+        if location:
+            clauses.append("search_location = ?")
+            params.append(location)
+        if job_ids:
+            clauses.append(f"job_id IN ({', '.join('?' * len(job_ids))})")
+            params.extend(job_ids)
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
@@ -0,0 +1,83 @@
+import re
+from typing import List, Set
+
+from config import JOB_TEXT_MAX_TOKENS
+
+# section headings whose content never changes a match verdict, matched against the whole heading
+# (fullmatch) so requirements that merely mention e.g. privacy or diversity are kept. "About ..."
+# and "Why join ..." are only boilerplate for the company itself (see company_headings), "About
+# this role" or "Why join the engineering team" introduce the job.
+BOILERPLATE_HEADINGS = re.compile(
+    r"(our |the )?(benefits|perks|(benefits|perks) (and|&) (benefits|perks)|compensation (and|&) benefits|"
+    r"what we offer|what's in it for you|why join( us)?|about (the company|us)|"
+    r"equal (employment )?opportunit(y|ies)( employer| statement)?|"
+    r"diversity(,? equity)? (and|&) inclusion|(dei|eeo|edi)( statement)?|"
+    r"(reasonable )?accommodations?|privacy( notice| policy| statement)?|recruitment fraud( warning)?|how to apply)",
+    re.IGNORECASE,
+)
+
+# standalone paragraphs of legal / EEO text, dropped wherever they appear
+BOILERPLATE_PARAGRAPH = re.compile(
+    r"equal opportunity employer|without regard to (race|age|gender)|"
+    r"reasonable accommodation|protected (veteran|characteristic)|e-verify",
+    re.IGNORECASE,
+)
+
+# markdown headings, bold-only lines and short "Heading:" lines
+HEADING_LINE = re.compile(r"^\s*(#{1,6}\s+.+|\*\*[^*]{2,80}\*\*:?|[A-Z][^.!?]{1,60}:)\s*$")
+
+
+def estimate_tokens(text: str) -> int:
+    # rough token count (~4 characters per token for English), good enough for budgeting prompts
+    return len(text) // 4 + 1
+
+
+def company_headings(company: str) -> Set[str]:
+    # "about <company>" and "why join <company>", lowercased with whitespace collapsed
+    name = " ".join(company.split()).casefold()
+    return {f"about {name}", f"why join {name}"} if name else set()
+
+
+def strip_boilerplate(text: str, company: str = "") -> str:
+    """
+    Drops benefits, EEO, "About the company" and similar sections from job markdown.
+    A boilerplate section runs from its heading to the next heading.
+
+    :param company: the company name from the job card, its "About <company>" section is dropped too
+    """
+    kept: List[str] = []
+    skipping = False
+    about_company = company_headings(company)
+
+    for line in text.splitlines():
+        if HEADING_LINE.match(line):
+            heading = line.strip().strip("#*:?! ")
+            skipping = bool(BOILERPLATE_HEADINGS.fullmatch(heading)) or (
+                " ".join(heading.split()).casefold() in about_company
+            )
+        if skipping:
+            continue
+        if BOILERPLATE_PARAGRAPH.search(line):
+            continue
+        kept.append(line.rstrip())
+
+    # collapse the blank lines left behind by the HTML conversion and the removed sections
+    return re.sub(r"\n{3,}", "\n\n", "\n".join(kept)).strip()
+
+
+def trim_job_text(text: str, max_tokens: int = JOB_TEXT_MAX_TOKENS, company: str = "") -> str:
+    """
+    Strips boilerplate and truncates the job text to roughly `max_tokens`, cutting
+    at a line boundary where possible. max_tokens <= 0 disables truncation.
+
+    :param company: the company name from the job card, see strip_boilerplate
+    """
+    trimmed = strip_boilerplate(text, company)
+    if max_tokens <= 0 or estimate_tokens(trimmed) <= max_tokens:
+        return trimmed
+
+    limit = max_tokens * 4
+    cut = trimmed.rfind("\n", 0, limit)
+    if cut < limit // 2:
+        cut = limit
+    return trimmed[:cut].rstrip() + "\n[...]"
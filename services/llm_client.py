@@ -0,0 +1,352 @@
+import email.utils
+import getpass
+import logging
+import os
+import random
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from dotenv import find_dotenv, load_dotenv
+
+from config import (
+    DEEPSEEK_BASE_URL,
+    LLM_BACKOFF_BASE,
+    LLM_BACKOFF_MAX,
+    LLM_BREAKER_COOLDOWN,
+    LLM_BREAKER_FAILURES,
+    LLM_MAX_CONCURRENCY,
+    LLM_MAX_RETRIES,
+    LLM_OUTPUT_TOKENS_ESTIMATE,
+    LLM_REQUESTS_PER_MINUTE,
+    LLM_TIMEOUT,
+    LLM_TOKENS_PER_MINUTE,
+)
+from services.job_text import estimate_tokens
+from services.metrics import METRICS
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitOpenError(RuntimeError):
+    """
+    Raised instead of sending a request while the circuit breaker is open.
+    """
+
+
+class TokenBucket:
+    """
+    `per_minute` units a minute, refilled continuously, with bursts of up to a tenth of that.
+    A take larger than the burst waits for a full bucket and leaves it in debt, so it can't
+    block forever, and charge() settles estimates against what was actually used.
+    """
+
+    def __init__(self, per_minute: float):
+        self.rate = per_minute / 60
+        self.capacity = max(1.0, per_minute / 10)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def take(self, amount: float) -> float:
+        """
+        :return: seconds waited
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill()
+                needed = min(amount, self.capacity)
+                if self._tokens >= needed:
+                    self._tokens -= amount
+                    return waited
+                wait = (needed - self._tokens) / self.rate
+            time.sleep(wait)
+            waited += wait
+
+    def charge(self, amount: float) -> None:
+        # positive takes more (the estimate was low), negative gives back
+        with self._lock:
+            self._refill()
+            self._tokens = min(self.capacity, self._tokens - amount)
+
+
+class AdaptiveLimit:
+    """
+    In-flight request limit, additive increase / multiplicative decrease: it grows by about
+    one per `limit` successes up to `maximum` and halves on throttling (at most once a second,
+    one burst of 429s is one signal).
+    """
+
+    def __init__(self, maximum: int):
+        self.maximum = max(1, maximum)
+        self.limit = float(self.maximum)
+        self.in_flight = 0
+        self._last_decrease = 0.0
+        self._cond = threading.Condition()
+
+    def acquire(self) -> None:
+        with self._cond:
+            while self.in_flight >= int(self.limit):
+                self._cond.wait()
+            self.in_flight += 1
+
+    def release(self, throttled: bool = False) -> None:
+        with self._cond:
+            self.in_flight -= 1
+            now = time.monotonic()
+            if throttled:
+                if now - self._last_decrease >= 1.0:
+                    self.limit = max(1.0, self.limit / 2)
+                    self._last_decrease = now
+            else:
+                self.limit = min(float(self.maximum), self.limit + 1 / self.limit)
+            self._cond.notify_all()
+
+
+class CircuitBreaker:
+    """
+    Opens after `failures` consecutive failed attempts: for `cooldown` seconds every request
+    fails fast, then a single probe is let through, which closes it again or reopens it.
+    """
+
+    def __init__(self, failures: int, cooldown: float):
+        self.failures = failures
+        self.cooldown = cooldown
+        self.trips = 0
+        self._consecutive = 0
+        self._opened_at: Optional[float] = None
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def before_call(self) -> None:
+        with self._lock:
+            if self._opened_at is None:
+                return
+            remaining = self.cooldown - (time.monotonic() - self._opened_at)
+            if remaining > 0 or self._probing:
+                raise CircuitOpenError(
+                    f"LLM circuit open after {self._consecutive} consecutive failures, "
+                    f"retrying in {max(0.0, remaining):.0f}s"
+                )
+            self._probing = True
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._opened_at is not None:
+                logger.info("LLM circuit closed, requests go out again")
+            self._consecutive = 0
+            self._opened_at = None
+            self._probing = False
+
+    def cancel_probe(self) -> None:
+        # the probe ended without saying anything about the API (e.g. a local error), let another go
+        with self._lock:
+            self._probing = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._consecutive += 1
+            if self._probing or (self._opened_at is None and self._consecutive >= self.failures):
+                if not self._probing:
+                    self.trips += 1
+                    METRICS.inc("llm_breaker_trips")
+                    logger.error(
+                        f"LLM circuit opened after {self._consecutive} consecutive failures, "
+                        f"failing fast for {self.cooldown:.0f}s"
+                    )
+                self._opened_at = time.monotonic()
+                self._probing = False
+
+
+def _retry_after(error) -> Optional[float]:
+    # seconds from the Retry-After (or retry-after-ms) header of a failed response, if any
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    try:
+        if headers.get("retry-after-ms"):
+            return float(headers["retry-after-ms"]) / 1000
+        value = headers.get("retry-after")
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            # an HTTP date
+            return max(0.0, email.utils.parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class LLMClient:
+    """
+    Chat completions through one OpenAI-compatible client, shared by JobChecker and
+    CVProfileFiller so every request counts against the same limits:
+
+      - requests and tokens per minute are metered with token buckets before a request goes out
+      - 429s, 5xx, timeouts and connection errors are retried with jittered exponential backoff,
+        never sooner than the server's Retry-After
+      - the number of requests in flight halves on every 429 and grows back as requests succeed
+      - after LLM_BREAKER_FAILURES failed attempts in a row requests fail fast with CircuitOpenError
+
+    A request that still fails raises, the caller's listings stay pending in the crawl checkpoint.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: float = LLM_REQUESTS_PER_MINUTE,
+        tokens_per_minute: float = LLM_TOKENS_PER_MINUTE,
+        max_concurrency: int = LLM_MAX_CONCURRENCY,
+        max_retries: int = LLM_MAX_RETRIES,
+        timeout: float = LLM_TIMEOUT,
+        breaker_failures: int = LLM_BREAKER_FAILURES,
+        breaker_cooldown: float = LLM_BREAKER_COOLDOWN,
+    ):
+        """
+        The API key is read from DEEPSEEK_API_KEY (a .env file is loaded first) or asked for,
+        export DEEPSEEK_API_KEY=your_api_key on linux, set DEEPSEEK_API_KEY=your_api_key on windows
+
+        :param requests_per_minute: request quota to stay under, 0 for none
+        :param tokens_per_minute: prompt + output token quota to stay under, 0 for none
+        :param max_concurrency: most requests in flight at once
+        :param max_retries: retries of a request after a retryable failure
+        :param timeout: seconds before a request is abandoned (and retried)
+        :param breaker_failures: consecutive failed attempts that open the circuit
+        :param breaker_cooldown: seconds the circuit stays open before a probe
+        """
+        load_dotenv(find_dotenv())
+        # Deepseek reasoner is 98x cheaper than OpenAi reasoner - omit base_url to use o1 OpenAi api
+        self.api_key = os.getenv("DEEPSEEK_API_KEY")
+        if self.api_key is None:
+            self.api_key = getpass.getpass("Enter your DEEPSEEK API key: ")
+        self.base_url = os.getenv("DEEPSEEK_BASE_URL", DEEPSEEK_BASE_URL)
+        self.timeout = timeout
+        self.max_retries = max_retries
+
+        self.requests = TokenBucket(requests_per_minute) if requests_per_minute > 0 else None
+        self.tokens = TokenBucket(tokens_per_minute) if tokens_per_minute > 0 else None
+        self.concurrency = AdaptiveLimit(max_concurrency)
+        self.breaker = CircuitBreaker(breaker_failures, breaker_cooldown)
+
+        self.retries = 0
+        self.throttled = 0
+        self._stats_lock = threading.Lock()
+
+        # created on the first request, see _openai()
+        self._client = None
+        self._client_lock = threading.Lock()
+
+    def _openai(self):
+        # openai takes ~0.5s to import, doing it on the first request keeps it off startup
+        with self._client_lock:
+            if self._client is None:
+                from openai import OpenAI
+
+                # retries are ours, the SDK's own would hide 429s from the limits above
+                self._client = OpenAI(
+                    api_key=self.api_key, base_url=self.base_url, timeout=self.timeout, max_retries=0
+                )
+            return self._client
+
+    def complete(self, model: str, messages: List[Dict[str, str]], **kwargs: Any):
+        """
+        :param model: e.g. deepseek-chat
+        :param messages: chat messages, [{"role": ..., "content": ...}]
+        :param kwargs: passed on to chat.completions.create, e.g. max_tokens or temperature
+        :return: the chat completion
+        """
+        import openai
+
+        budget = sum(estimate_tokens(m["content"]) for m in messages)
+        budget += kwargs.get("max_tokens") or LLM_OUTPUT_TOKENS_ESTIMATE
+
+        attempt = 0
+        while True:
+            self.breaker.before_call()
+            self._acquire(budget)
+            try:
+                response = self._openai().chat.completions.create(model=model, messages=messages, **kwargs)
+            except (openai.APIConnectionError, openai.APIStatusError) as e:
+                # APIConnectionError covers timeouts, status errors worth retrying are 408, 409, 429 and 5xx
+                status = getattr(e, "status_code", None)
+                throttled = status == 429
+                self.concurrency.release(throttled=throttled)
+                if status is not None and status not in (408, 409, 429) and status < 500:
+                    # the API answered, it is up; a bad request won't get better by retrying
+                    self.breaker.record_success()
+                    raise
+                self.breaker.record_failure()
+                METRICS.inc("llm_throttled" if throttled else "llm_errors")
+
+                attempt += 1
+                if attempt > self.max_retries:
+                    raise
+                delay = self._backoff(attempt, _retry_after(e))
+                with self._stats_lock:
+                    self.retries += 1
+                    self.throttled += throttled
+                METRICS.inc("llm_retries")
+                logger.warning(
+                    f"{model} request failed ({status or type(e).__name__}), retry {attempt}/{self.max_retries} "
+                    f"in {delay:.1f}s"
+                )
+                time.sleep(delay)
+                continue
+            except BaseException:
+                self.concurrency.release()
+                self.breaker.cancel_probe()
+                raise
+
+            self.concurrency.release()
+            self.breaker.record_success()
+            if self.tokens is not None:
+                used = getattr(getattr(response, "usage", None), "total_tokens", None)
+                if used is not None:
+                    self.tokens.charge(used - budget)
+            return response
+
+    def _acquire(self, budget: int) -> None:
+        # quota first, then a slot, so waiting on the buckets doesn't hold one
+        started = time.perf_counter()
+        if self.requests is not None:
+            self.requests.take(1)
+        if self.tokens is not None:
+            self.tokens.take(budget)
+        self.concurrency.acquire()
+        METRICS.add("llm_wait", time.perf_counter() - started)
+
+    @staticmethod
+    def _backoff(attempt: int, retry_after: Optional[float]) -> float:
+        # full jitter spreads the retries of concurrent callers, Retry-After is a lower bound
+        delay = random.uniform(0, min(LLM_BACKOFF_MAX, LLM_BACKOFF_BASE * 2 ** (attempt - 1)))
+        if retry_after is not None:
+            delay = retry_after + random.uniform(0, LLM_BACKOFF_BASE)
+        return delay
+
+    def report(self) -> Dict[str, float]:
+        with self._stats_lock:
+            retries, throttled = self.retries, self.throttled
+        return {
+            "retries": retries,
+            "throttled": throttled,
+            "concurrency_limit": round(self.concurrency.limit, 1),
+            "breaker_trips": self.breaker.trips,
+        }
+
+
+_shared: Optional[LLMClient] = None
+_shared_lock = threading.Lock()
+
+
+def shared_client() -> LLMClient:
+    # the process-wide LLMClient with the config defaults, for callers that aren't handed one
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = LLMClient()
+        return _shared
@@ -0,0 +1,231 @@
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from typing import Any, Deque, Dict, Iterator, Tuple
+
+from config import LLM_PRICES
+
+
+def percentile(ordered, q: float) -> float:
+    # nearest-rank percentile of an already sorted sequence, 0.0 when empty
+    if not ordered:
+        return 0.0
+    rank = max(0, min(len(ordered) - 1, int(round(q / 100 * len(ordered))) - 1))
+    return ordered[rank]
+
+
+def usage_tokens(usage) -> Tuple[int, int, int]:
+    """
+    :param usage: the `usage` field of an OpenAI-compatible chat completion, may be None
+    :return: (input, cached input, output) tokens; cached input is DeepSeek's prompt_cache_hit_tokens
+        or OpenAI's prompt_tokens_details.cached_tokens, 0 when the provider reports neither
+    """
+    input_tokens = int(getattr(usage, "prompt_tokens", 0) or 0)
+    output_tokens = int(getattr(usage, "completion_tokens", 0) or 0)
+    cached = getattr(usage, "prompt_cache_hit_tokens", None)
+    if cached is None:
+        cached = getattr(getattr(usage, "prompt_tokens_details", None), "cached_tokens", 0)
+    return input_tokens, min(int(cached or 0), input_tokens), output_tokens
+
+
+def llm_cost(model: str, input_tokens: int, cached_input_tokens: int, output_tokens: int) -> float:
+    # estimated USD from LLM_PRICES, models missing from it count as free
+    hit_price, miss_price, output_price = LLM_PRICES.get(model, (0.0, 0.0, 0.0))
+    return (
+        cached_input_tokens * hit_price
+        + (input_tokens - cached_input_tokens) * miss_price
+        + output_tokens * output_price
+    ) / 1e6
+
+
+class Timers:
+    """
+    Durations per label: total, count and the most recent `max_samples` values,
+    which report() turns into p50/p95. Safe to record into from several threads.
+    """
+
+    def __init__(self, max_samples: int = 10_000):
+        self.max_samples = max_samples
+        self.totals: Dict[str, float] = defaultdict(float)
+        self.counts: Dict[str, int] = defaultdict(int)
+        self.samples: Dict[str, Deque[float]] = defaultdict(lambda: deque(maxlen=max_samples))
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def track(self, label: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(label, time.perf_counter() - start)
+
+    def add(self, label: str, seconds: float) -> None:
+        with self._lock:
+            self.totals[label] += seconds
+            self.counts[label] += 1
+            self.samples[label].append(seconds)
+
+    def report(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            totals = dict(self.totals)
+            counts = dict(self.counts)
+            samples = {label: sorted(values) for label, values in self.samples.items()}
+        return {
+            label: {
+                "count": counts[label],
+                "total_s": round(total, 2),
+                "avg_s": round(total / counts[label], 3),
+                "p50_s": round(percentile(samples[label], 50), 3),
+                "p95_s": round(percentile(samples[label], 95), 3),
+            }
+            for label, total in sorted(totals.items(), key=lambda kv: -kv[1])
+        }
+
+
+class Metrics(Timers):
+    """
+    Run-wide registry of stage timers and counters (jobs, tokens, cost...).
+
+    Modules record into the shared METRICS instance; crawl shards send their state()
+    back to the parent, which merge()s it. export() writes a snapshot as JSON or, for
+    a .prom path, in the Prometheus text format (e.g. for node_exporter's textfile collector).
+    """
+
+    PREFIX = "jobhunter"
+
+    def __init__(self, max_samples: int = 10_000):
+        super().__init__(max_samples)
+        self.counters: Dict[str, float] = defaultdict(float)
+        self.started = time.time()
+        self._last_export = 0.0
+
+    def inc(self, name: str, value: float = 1) -> None:
+        with self._lock:
+            self.counters[name] += value
+
+    def record_llm_usage(
+        self,
+        model: str,
+        input_tokens: int,
+        output_tokens: int,
+        seconds: float,
+        stage: str = "llm_call",
+        cached_input_tokens: int = 0,
+    ) -> None:
+        # cached_input_tokens are the part of input_tokens served from the provider's prefix cache
+        cost = llm_cost(model, input_tokens, cached_input_tokens, output_tokens)
+        self.add(stage, seconds)
+        with self._lock:
+            self.counters["llm_calls"] += 1
+            self.counters["llm_input_tokens"] += input_tokens
+            self.counters["llm_cached_input_tokens"] += cached_input_tokens
+            self.counters["llm_output_tokens"] += output_tokens
+            self.counters["llm_cost_usd"] += cost
+
+    def state(self, reset: bool = False) -> Dict[str, Any]:
+        # picklable raw state, for merging into another process' registry; with reset the
+        # next state() only holds what was recorded since, so it can be sent incrementally
+        with self._lock:
+            state = {
+                "counters": dict(self.counters),
+                "timers": {
+                    label: (self.totals[label], self.counts[label], list(self.samples[label]))
+                    for label in self.totals
+                },
+            }
+            if reset:
+                self.counters.clear()
+                self.totals.clear()
+                self.counts.clear()
+                self.samples.clear()
+            return state
+
+    def merge(self, state: Dict[str, Any]) -> None:
+        with self._lock:
+            for name, value in state["counters"].items():
+                self.counters[name] += value
+            for label, (total, count, samples) in state["timers"].items():
+                self.totals[label] += total
+                self.counts[label] += count
+                self.samples[label].extend(samples)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            counters = {name: round(value, 6) for name, value in sorted(self.counters.items())}
+        return {
+            "started_at": self.started,
+            "elapsed_s": round(time.time() - self.started, 2),
+            "counters": counters,
+            "stages": self.report(),
+        }
+
+    def to_prometheus(self) -> str:
+        snapshot = self.snapshot()
+        lines = [
+            f"# TYPE {self.PREFIX}_elapsed_seconds gauge",
+            f"{self.PREFIX}_elapsed_seconds {snapshot['elapsed_s']}",
+        ]
+        for name, value in snapshot["counters"].items():
+            lines.append(f"# TYPE {self.PREFIX}_{name}_total counter")
+            lines.append(f"{self.PREFIX}_{name}_total {value}")
+
+        metric = f"{self.PREFIX}_stage_seconds"
+        lines.append(f"# TYPE {metric} summary")
+        for stage, s in snapshot["stages"].items():
+            lines.append(f'{metric}{{stage="{stage}",quantile="0.5"}} {s["p50_s"]}')
+            lines.append(f'{metric}{{stage="{stage}",quantile="0.95"}} {s["p95_s"]}')
+            lines.append(f'{metric}_sum{{stage="{stage}"}} {s["total_s"]}')
+            lines.append(f'{metric}_count{{stage="{stage}"}} {s["count"]}')
+        return "\n".join(lines) + "\n"
+
+    def export(self, path: str) -> None:
+        if path.endswith(".prom"):
+            text = self.to_prometheus()
+        else:
+            text = json.dumps(self.snapshot(), indent=2)
+
+        directory = os.path.dirname(path) or "."
+        os.makedirs(directory, exist_ok=True)
+        # collectors polling the file never see a half-written snapshot
+        fd, tmp_path = tempfile.mkstemp(prefix=".metrics-", suffix=".tmp", dir=directory)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+        self._last_export = time.monotonic()
+
+    def maybe_export(self, path: str, interval: float) -> None:
+        # called from hot loops, only writes once `interval` seconds have passed
+        if path and time.monotonic() - self._last_export >= interval:
+            self.export(path)
+
+    def summary_table(self) -> str:
+        snapshot = self.snapshot()
+        elapsed = snapshot["elapsed_s"] or 1.0
+        counters = snapshot["counters"]
+
+        # stages overlap (evaluator threads, fetch pools, shards), so % wall can pass 100%
+        lines = [f"{'stage':<26}{'count':>8}{'total s':>10}{'avg s':>9}{'p50 s':>9}{'p95 s':>9}{'% wall':>8}"]
+        for stage, s in snapshot["stages"].items():
+            lines.append(
+                f"{stage:<26}{s['count']:>8}{s['total_s']:>10.2f}{s['avg_s']:>9.3f}"
+                f"{s['p50_s']:>9.3f}{s['p95_s']:>9.3f}{s['total_s'] / elapsed:>8.0%}"
+            )
+        lines.append("")
+        for name, value in counters.items():
+            lines.append(f"{name:<26}{value:>14,.4f}" if name.endswith("_usd") else f"{name:<26}{value:>14,.0f}")
+        if counters.get("llm_input_tokens"):
+            hit_rate = counters.get("llm_cached_input_tokens", 0) / counters["llm_input_tokens"]
+            lines.append(f"{'llm prompt cache hit':<26}{hit_rate:>14.1%}")
+        # jobs scraped, or read back from the job corpus by rematch.py
+        jobs = counters.get("jobs_extracted", 0) or counters.get("jobs_rematched", 0)
+        lines.append(f"{'run time s':<26}{elapsed:>14,.1f}")
+        lines.append(f"{'jobs / min':<26}{jobs / elapsed * 60:>14,.1f}")
+        return "\n".join(lines)
+
+
+# shared by every module of a run, crawl shards merge theirs in as their pages arrive
+METRICS = Metrics()
@@ -1,19 +1,55 @@
 import logging
+import multiprocessing as mp
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pypdf import PdfReader
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterator, Optional
+
+from config import PDF_MAX_SIZE_MB, PDF_WORKERS, PDF_PARALLEL_MIN_PAGES
 
 logger = logging.getLogger(__name__)
 
+# PdfReader of the worker process, opened once by _init_worker
+_worker_reader: Optional[PdfReader] = None
+
+
+def _init_worker(pdf_path: str) -> None:
+    global _worker_reader
+    _worker_reader = PdfReader(pdf_path)
+
+
+def _extract_page(index: int) -> str:
+    return _worker_reader.pages[index].extract_text() or ""
+
 
 class PDFExtractor:
-    def __init__(self, pdf_path: str):
+    def __init__(
+        self,
+        pdf_path: str,
+        workers: int = PDF_WORKERS,
+        max_size_mb: float = PDF_MAX_SIZE_MB,
+        parallel_min_pages: int = PDF_PARALLEL_MIN_PAGES,
+    ):
+        """
+        :param pdf_path: the PDF to read
+        :param workers: processes extracting pages in parallel, 1 extracts them in this process
+        :param max_size_mb: larger files are refused before they are parsed
+        :param parallel_min_pages: documents with fewer pages are always extracted serially,
+            starting the pool costs more than it saves on a short CV
+        """
         # initialize the PDF path
         self.pdf_path = pdf_path
+        self.workers = max(1, workers)
+        self.max_size_mb = max_size_mb
+        self.parallel_min_pages = parallel_min_pages
         self._pdf_reader: Optional[PdfReader] = None
 
     def load_pdf(self) -> None:
         # load the pdf file from path
         try:
+            size_mb = os.path.getsize(self.pdf_path) / (1024 * 1024)
+            if size_mb > self.max_size_mb:
+                raise ValueError(f"{self.pdf_path} is {size_mb:.1f} MB, the limit is {self.max_size_mb} MB")
             self._pdf_reader = PdfReader(self.pdf_path)
             logger.info(f"Successfully loaded PDF: {self.pdf_path}")
         except FileNotFoundError:
@@ -32,24 +68,46 @@ class PDFExtractor:
         logger.debug(f"Extracted PDF metadata: {pdf_meta}")
 
         return {
-            "author": pdf_meta.author,
-            "subject": pdf_meta.subject,
-            "title": pdf_meta.title,
+            "author": pdf_meta.author if pdf_meta else None,
+            "subject": pdf_meta.subject if pdf_meta else None,
+            "title": pdf_meta.title if pdf_meta else None,
             "number_of_pages": len(self._pdf_reader.pages)
             if self._pdf_reader.pages
             else 0,
         }
 
-    def extract_text(self) -> str:
-        # extract text from the pdf file with parsing from PdfReader class
+    def iter_pages(self) -> Iterator[str]:
+        """
+        Yields the text of every page in page order ("" for pages without text).
+
+        Serial extraction is lazy, one page at a time. With workers > 1 and at least
+        parallel_min_pages pages, pages are extracted by a process pool, each worker
+        opening the file itself; results still come back in page order.
+        """
         if not self._pdf_reader:
             raise ValueError("PDF must be loaded before extracting text.")
 
-        text_pages = []
-        for page in self._pdf_reader.pages:
-            page_text = page.extract_text()
-            if page_text:
-                text_pages.append(page_text)
+        page_count = len(self._pdf_reader.pages)
+        if self.workers == 1 or page_count < self.parallel_min_pages:
+            for page in self._pdf_reader.pages:
+                yield page.extract_text() or ""
+            return
+
+        workers = min(self.workers, page_count)
+        # spawn, like the crawl shards: the scraper may already be running threads
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=mp.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self.pdf_path,),
+        ) as pool:
+            # a few chunks per worker keeps them busy when page costs differ (e.g. scans vs text)
+            chunksize = max(1, page_count // (workers * 4))
+            yield from pool.map(_extract_page, range(page_count), chunksize=chunksize)
+
+    def extract_text(self) -> str:
+        # extract text from the pdf file with parsing from PdfReader class
+        text_pages = [page_text for page_text in self.iter_pages() if page_text]
 
         full_text = "\n".join(text_pages)
         logger.debug("Successfully extracted text from PDF.")
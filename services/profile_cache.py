@@ -0,0 +1,90 @@
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import time
+from dataclasses import asdict
+from typing import List, Optional, Tuple
+
+from config import PROFILE_CACHE_PATH
+from models.cv_profile import CVProfile
+from scripts.profile_prompt import PROMPT_VERSION
+
+logger = logging.getLogger(__name__)
+
+
+class ProfileCache:
+    """
+    SQLite backed cache of parsed CVs: the sections from SectionProcessor and the
+    CVProfile the LLM filled from them.
+
+    Entries are content addressed, keyed on the sha256 of the PDF bytes plus
+    PROMPT_VERSION, so a renamed file still hits and an edited CV or a new prompt
+    misses. Entries never go stale and are not evicted. With `bypass` set lookups
+    always miss but the fresh profile is still written.
+    """
+
+    def __init__(self, path: str = PROFILE_CACHE_PATH, bypass: bool = False):
+        self.path = path
+        self.bypass = bypass
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(path)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS profiles (
+                key TEXT PRIMARY KEY,
+                pdf_sha256 TEXT NOT NULL,
+                prompt_version INTEGER NOT NULL,
+                sections TEXT NOT NULL,
+                profile TEXT NOT NULL,
+                created_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def hash_pdf(pdf_path: str) -> str:
+        digest = hashlib.sha256()
+        with open(pdf_path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    @staticmethod
+    def make_key(pdf_sha256: str) -> str:
+        return f"{pdf_sha256}:v{PROMPT_VERSION}"
+
+    def get(self, key: str) -> Optional[Tuple[List[dict], CVProfile]]:
+        """
+        :return: (sections, profile) stored under key, None on a miss
+        """
+        if self.bypass:
+            return None
+
+        row = self._conn.execute("SELECT sections, profile FROM profiles WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+
+        try:
+            return json.loads(row[0]), CVProfile(**json.loads(row[1]))
+        except (TypeError, ValueError) as e:
+            # e.g. written before a CVProfile field was renamed, parse the CV again
+            logger.error(f"Ignoring unreadable cached profile {key}: {e}")
+            return None
+
+    def set(self, key: str, pdf_sha256: str, sections: List[dict], profile: CVProfile) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO profiles (key, pdf_sha256, prompt_version, sections, profile, created_at) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (key, pdf_sha256, PROMPT_VERSION, json.dumps(sections), json.dumps(asdict(profile)), time.time()),
+        )
+        self._conn.commit()
+
+    def close(self) -> None:
+        self._conn.close()
@@ -0,0 +1,163 @@
+import logging
+import re
+from typing import Dict, List
+
+import numpy as np
+from rapidfuzz import fuzz, process, utils
+
+from config import PREFILTER_THRESHOLD, PREFILTER_TOP_K
+
+logger = logging.getLogger(__name__)
+
+
+class RelevanceFilter:
+    """
+    Cheap local scoring stage that runs before JobChecker.
+
+    Every listing is scored 0-100 against the candidate's discipline, secondary
+    discipline, skills and level with rapidfuzz's token_set_ratio, which gives 100
+    when all of a term's tokens appear in the listing. A page of listings is scored
+    in one vectorised process.cdist call. Only listings at or above `threshold`
+    (and, if `top_k` is set, only the best K of those) are passed on to the LLM.
+    """
+
+    # how much each part of the profile contributes to the final score
+    DISCIPLINE_WEIGHT = 0.5
+    SKILLS_WEIGHT = 0.35
+    LEVEL_WEIGHT = 0.15
+
+    # skills are averaged over the best N so a long skills list doesn't dilute the score
+    TOP_SKILLS = 5
+
+    # listings rarely say "entry", so levels are matched through the words recruiters use
+    LEVEL_SYNONYMS = {
+        "intern": ["intern", "internship", "placement", "student"],
+        "entry": ["entry level", "graduate", "junior", "associate", "trainee"],
+        "junior": ["junior", "graduate", "entry level", "associate"],
+        "mid-level": ["mid level", "intermediate", "experienced"],
+        "senior": ["senior", "lead", "principal", "staff"],
+    }
+
+    def __init__(
+        self,
+        cv_profile,
+        threshold: float = PREFILTER_THRESHOLD,
+        top_k: int = PREFILTER_TOP_K,
+    ):
+        self.threshold = threshold
+        self.top_k = top_k
+
+        self.discipline_terms = [
+            t for t in (cv_profile.discipline, cv_profile.secondary_discipline) if t and t.strip()
+        ]
+        self.skill_terms = self._split_skills(str(cv_profile.skills or ""))
+        self.level_terms = self._level_terms(str(cv_profile.level or ""))
+
+        self.scores: List[float] = []
+        self.passed = 0
+        self.skipped = 0
+
+    def score_many(self, job_texts: List[str]) -> np.ndarray:
+        # scores every job text against every profile term in one cdist call per term group
+        if not job_texts:
+            return np.zeros(0)
+
+        total = np.zeros(len(job_texts))
+        weight_used = 0.0
+
+        if self.discipline_terms:
+            matrix = self._cdist(self.discipline_terms, job_texts)
+            total += self.DISCIPLINE_WEIGHT * matrix.max(axis=0)
+            weight_used += self.DISCIPLINE_WEIGHT
+
+        if self.skill_terms:
+            matrix = self._cdist(self.skill_terms, job_texts)
+            best = np.sort(matrix, axis=0)[-self.TOP_SKILLS:]
+            total += self.SKILLS_WEIGHT * best.mean(axis=0)
+            weight_used += self.SKILLS_WEIGHT
+
+        if self.level_terms:
+            matrix = self._cdist(self.level_terms, job_texts)
+            total += self.LEVEL_WEIGHT * matrix.max(axis=0)
+            weight_used += self.LEVEL_WEIGHT
+
+        # an empty profile can't rule anything out
+        if weight_used == 0:
+            return np.full(len(job_texts), 100.0)
+
+        return total / weight_used
+
+    def select(self, listings: list) -> list:
+        """
+        Scores a page (or a single) listing and returns the ones worth an LLM call,
+        in their original order. Listings only need a `markdown` attribute.
+        """
+        if not listings:
+            return []
+
+        scores = self.score_many([listing.markdown for listing in listings])
+        keep = [i for i, score in enumerate(scores) if score >= self.threshold]
+
+        if self.top_k and len(keep) > self.top_k:
+            keep = sorted(keep, key=lambda i: scores[i], reverse=True)[: self.top_k]
+            keep.sort()
+
+        self.scores.extend(float(s) for s in scores)
+        self.passed += len(keep)
+        self.skipped += len(listings) - len(keep)
+        logger.debug(f"Prefilter kept {len(keep)}/{len(listings)} listings, scores: {scores.round(1).tolist()}")
+
+        return [listings[i] for i in keep]
+
+    def settings_key(self) -> str:
+        # what decides which listings pass besides the CV, a job rejected under other settings may pass now
+        return f"threshold={self.threshold:g};top_k={self.top_k}"
+
+    def report(self) -> Dict[str, float]:
+        # counts plus the score distribution, used to tune the threshold
+        stats: Dict[str, float] = {
+            "scored": len(self.scores),
+            "passed": self.passed,
+            "skipped_llm_calls": self.skipped,
+            "threshold": self.threshold,
+        }
+        if self.scores:
+            p10, p25, p50, p75, p90 = np.percentile(self.scores, [10, 25, 50, 75, 90])
+            stats.update(
+                min=round(min(self.scores), 1),
+                p10=round(p10, 1),
+                p25=round(p25, 1),
+                median=round(p50, 1),
+                p75=round(p75, 1),
+                p90=round(p90, 1),
+                max=round(max(self.scores), 1),
+            )
+        return stats
+
+    def _cdist(self, terms: List[str], job_texts: List[str]) -> np.ndarray:
+        return process.cdist(
+            terms,
+            job_texts,
+            scorer=fuzz.token_set_ratio,
+            processor=utils.default_process,
+            workers=-1,
+        )
+
+    def _split_skills(self, skills: str) -> List[str]:
+        # "Python (Django, Flask), C, Git" -> ["python", "django", "flask", "c", "git"]
+        parts = re.split(r"[,;/()\n]+", skills)
+        seen = []
+        for part in parts:
+            term = part.strip().lower()
+            if len(term) > 1 and term not in seen:
+                seen.append(term)
+        return seen
+
+    def _level_terms(self, level: str) -> List[str]:
+        level = level.strip().lower()
+        if not level:
+            return []
+        for key, synonyms in self.LEVEL_SYNONYMS.items():
+            if key in level:
+                return synonyms
+        return [level]
@@ -0,0 +1,366 @@
+import csv
+import json
+import logging
+import os
+import re
+import sqlite3
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Set, Tuple
+from urllib.parse import urlsplit
+
+from config import RESULTS_PATH, RESULT_FLUSH_EVERY
+from models.job import Job
+from services.metrics import METRICS
+
+logger = logging.getLogger(__name__)
+
+JOB_VIEW_ID = re.compile(r"/jobs/view/(\d+)")
+
+
+def result_key(job_id: str, link: str) -> str:
+    """
+    What identifies a job in the results: its id, else the id in a /jobs/view/<id>/ link,
+    else the link without its query string. Card links carry per-search tracking params
+    (refId, trk), so the same job found again has a different link.
+    """
+    if job_id:
+        return job_id
+    match = JOB_VIEW_ID.search(link)
+    if match:
+        return match.group(1)
+    parts = urlsplit(link)
+    return f"{parts.scheme}://{parts.netloc}{parts.path}" if parts.netloc else parts.path
+
+
+class ResultSink(ABC):
+    """
+    Where evaluated jobs end up.
+
+    write() only appends to an in-memory buffer; every `flush_every` jobs (and on
+    flush() / close()) the buffer goes out in one batch through _write_batch().
+    By default only matches are kept, with `include_all` every verdict is stored
+    with its match flag. Rows are per candidate (CVProfile.fingerprint()) and job
+    (result_key()): a job already stored with the same verdict is never written twice,
+    so a resumed run can re-evaluate it without duplicating its row, while a verdict
+    that changed (e.g. a rematch after a CV or prompt change) replaces the old one, and
+    a match that no longer is drops out of a matches-only output.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        include_all: bool = False,
+        flush_every: int = RESULT_FLUSH_EVERY,
+        candidate: str = "",
+    ):
+        self.path = path
+        self.include_all = include_all
+        self.flush_every = max(1, flush_every)
+        self.candidate = candidate
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # verdicts arrive from the evaluator threads, checkpoints flush from the scraper
+        self._lock = threading.Lock()
+        self._buffer: List[Job] = []
+        # (candidate, result_key()) -> match flag of the job's row in the output
+        self._stored: Dict[Tuple[str, str], bool] = self._load_verdicts()
+        # keys whose stored row the buffered jobs supersede
+        self._replaced: Set[Tuple[str, str]] = set()
+        # number of jobs in the output, continues across runs (the CSV "row" column)
+        self.count = len(self._stored)
+
+    def write(self, job: Job) -> None:
+        key = (self.candidate, result_key(job.job_id, job.link))
+        keep = self._keep(job)
+        with self._lock:
+            stored = self._stored.get(key)
+            if stored is None and not keep:
+                return
+            if stored is not None and stored == job.match:
+                return
+            if stored is not None:
+                self._replaced.add(key)
+            if keep:
+                self._stored[key] = job.match
+            else:
+                # a match that no longer is, _write_batch removes its row
+                del self._stored[key]
+            self._buffer.append(job)
+            if len(self._buffer) >= self.flush_every:
+                self._flush_locked()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        if not self._buffer:
+            return
+        batch, self._buffer = self._buffer, []
+        replaced, self._replaced = self._replaced, set()
+        with METRICS.track("sink_write"):
+            self._write_batch(batch, replaced)
+        self.count = len(self._stored)
+        METRICS.inc("results_written", len(batch))
+
+    def close(self) -> None:
+        self.flush()
+
+    def _keep(self, job: Job) -> bool:
+        # whether the job has a row in the output, rather than being removed from it
+        return job.match or self.include_all
+
+    @abstractmethod
+    def _load_verdicts(self) -> Dict[Tuple[str, str], bool]:
+        """
+        (candidate, result_key()) -> match flag of every job already in the output.
+        """
+
+    @abstractmethod
+    def _write_batch(self, jobs: List[Job], replaced: Set[Tuple[str, str]]) -> None:
+        """
+        Writes the jobs to the output in one go. Jobs whose key is in `replaced` supersede
+        a row already in the output; with `include_all` off a non-match only removes its row.
+        """
+
+
+class CsvSink(ResultSink):
+    """
+    The matched_jobs.csv format, with job id and match columns added when every verdict is stored
+    and the candidate's CV fingerprint last. New jobs are appended; a batch that changes a verdict
+    already in the file rewrites it, so every job keeps a single row.
+    """
+
+    FIELDS = ["row", "role", "company", "location", "description", "link"]
+    ALL_FIELDS = FIELDS + ["job_id", "match"]
+
+    def _header(self) -> List[str]:
+        return (self.ALL_FIELDS if self.include_all else self.FIELDS) + ["candidate"]
+
+    def _load_verdicts(self) -> Dict[Tuple[str, str], bool]:
+        header = self._header()
+        try:
+            with open(self.path, "r", newline="", encoding="utf-8") as f:
+                reader = csv.DictReader(f)
+                fieldnames = reader.fieldnames
+                rows = list(reader)
+        except FileNotFoundError:
+            with open(self.path, "w", newline="", encoding="utf-8") as f:
+                csv.writer(f).writerow(header)
+            return {}
+
+        if fieldnames and fieldnames != header:
+            if fieldnames != header[:-1]:
+                raise ValueError(
+                    f"{self.path} has columns {fieldnames}, expected {header}; "
+                    "write to another file when switching --all-verdicts"
+                )
+            # written before rows were per candidate, rewritten once with an empty candidate column
+            self._rewrite(rows)
+
+        verdicts = {}
+        for row in rows:
+            key = (row.get("candidate") or "", result_key(row.get("job_id") or "", row.get("link") or ""))
+            if key[1]:
+                verdicts[key] = row.get("match", "True") == "True"
+        return verdicts
+
+    def _row(self, row: int, job: Job) -> list:
+        values = [row, job.role, job.company, job.location, job.description, job.link]
+        if self.include_all:
+            values += [job.job_id, job.match]
+        return values + [self.candidate]
+
+    def _write_batch(self, jobs: List[Job], replaced: Set[Tuple[str, str]]) -> None:
+        if not replaced:
+            with open(self.path, "a", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                for row, job in enumerate(jobs, start=self.count + 1):
+                    writer.writerow(self._row(row, job))
+            return
+
+        with open(self.path, "r", newline="", encoding="utf-8") as f:
+            rows = [
+                row for row in csv.DictReader(f)
+                if (row.get("candidate") or "", result_key(row.get("job_id") or "", row.get("link") or ""))
+                not in replaced
+            ]
+        # the latest verdict of a job counts, earlier ones in the same batch are dropped
+        latest: Dict[Tuple[str, str], Job] = {}
+        for job in jobs:
+            latest[(self.candidate, result_key(job.job_id, job.link))] = job
+        self._rewrite(rows, [job for job in latest.values() if self._keep(job)])
+
+    def _rewrite(self, rows: List[dict], jobs: List[Job] = ()) -> None:
+        # the file is replaced atomically, a crash leaves the old one intact
+        header = self._header()
+        directory = os.path.dirname(self.path) or "."
+        fd, tmp_path = tempfile.mkstemp(prefix=".results-", suffix=".tmp", dir=directory)
+        try:
+            with os.fdopen(fd, "w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                writer.writerow(header)
+                for n, row in enumerate(rows, start=1):
+                    writer.writerow([n] + [row.get(field) or "" for field in header[1:]])
+                for n, job in enumerate(jobs, start=len(rows) + 1):
+                    writer.writerow(self._row(n, job))
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+
+class JsonlSink(ResultSink):
+    """
+    One JSON object per job, every Job field plus the candidate and when it was recorded.
+    A changed verdict is appended as a newer line, the last line of a job is its verdict.
+    """
+
+    def _load_verdicts(self) -> Dict[Tuple[str, str], bool]:
+        verdicts = {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    row = json.loads(line)
+                    key = (row.get("candidate", ""), result_key(row.get("job_id", ""), row.get("link", "")))
+                    if not key[1]:
+                        continue
+                    match = bool(row.get("match"))
+                    if match or self.include_all:
+                        verdicts[key] = match
+                    else:
+                        verdicts.pop(key, None)
+        except FileNotFoundError:
+            pass
+        return verdicts
+
+    def _write_batch(self, jobs: List[Job], replaced: Set[Tuple[str, str]]) -> None:
+        now = time.time()
+        lines = [
+            json.dumps({**vars(job), "candidate": self.candidate, "recorded_at": now}, ensure_ascii=False) + "\n"
+            for job in jobs
+        ]
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.writelines(lines)
+
+
+class SqliteSink(ResultSink):
+    """
+    SQLite table of results in WAL mode, so the file can be queried while a run is writing to it.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        include_all: bool = False,
+        flush_every: int = RESULT_FLUSH_EVERY,
+        candidate: str = "",
+    ):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        # WAL keeps committed batches safe with NORMAL, no fsync per transaction needed
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS results (
+                job_id TEXT NOT NULL,
+                match INTEGER NOT NULL,
+                role TEXT,
+                company TEXT,
+                location TEXT,
+                description TEXT,
+                link TEXT,
+                recorded_at REAL NOT NULL,
+                candidate TEXT NOT NULL DEFAULT ''
+            )
+            """
+        )
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(results)")}
+        if "candidate" not in columns:
+            # results written before rows were per candidate
+            self._conn.execute("ALTER TABLE results ADD COLUMN candidate TEXT NOT NULL DEFAULT ''")
+        self._conn.execute("DROP INDEX IF EXISTS idx_results_job_id")
+        self._conn.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_results_candidate_job ON results(candidate, job_id)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_results_match ON results(match)")
+        self._conn.commit()
+        super().__init__(path, include_all=include_all, flush_every=flush_every, candidate=candidate)
+
+    def _load_verdicts(self) -> Dict[Tuple[str, str], bool]:
+        # job_id holds result_key(), see _write_batch
+        return {
+            (candidate, job_id): bool(match)
+            for candidate, job_id, match in self._conn.execute("SELECT candidate, job_id, match FROM results")
+        }
+
+    def _write_batch(self, jobs: List[Job], replaced: Set[Tuple[str, str]]) -> None:
+        now = time.time()
+        with self._conn:
+            for job in jobs:
+                key = result_key(job.job_id, job.link)
+                if self._keep(job):
+                    # a changed verdict replaces the job's row
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO results (job_id, match, role, company, location, description, "
+                        "link, recorded_at, candidate) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        (key, int(job.match), job.role, job.company, job.location, job.description,
+                         job.link, now, self.candidate),
+                    )
+                else:
+                    self._conn.execute(
+                        "DELETE FROM results WHERE candidate = ? AND job_id = ?", (self.candidate, key)
+                    )
+
+    def close(self) -> None:
+        super().close()
+        self._conn.close()
+
+
+SINKS = {".csv": CsvSink, ".jsonl": JsonlSink, ".sqlite3": SqliteSink, ".db": SqliteSink}
+
+
+def open_sink(path: str = RESULTS_PATH, include_all: bool = False, candidate: str = "") -> ResultSink:
+    """
+    :param path: output file, its extension picks the format (see SINKS)
+    :param include_all: store every evaluated job with its verdict, not just the matches
+    :param candidate: CVProfile.fingerprint() of the CV the verdicts are for, rows are kept per candidate
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in SINKS:
+        raise ValueError(f"Unsupported results file {path}, use one of {', '.join(sorted(SINKS))}")
+    return SINKS[extension](path, include_all=include_all, candidate=candidate)
+
+
+def candidate_path(path: str, name: str) -> str:
+    """
+    Results file of one candidate in a multi-candidate run, e.g. matched_jobs_jane_doe.csv.
+
+    :param path: the shared --output path
+    :param name: the candidate's label
+    """
+    stem, extension = os.path.splitext(path)
+    slug = "_".join("".join(c if c.isalnum() else " " for c in name.lower()).split()) or "candidate"
+    return f"{stem}_{slug}{extension}"
+
+
+def run_path(path: str, started: Optional[float] = None) -> str:
+    """
+    A results file of its own for one run, e.g. rematched_jobs_20260101-120000.csv, so
+    nothing an earlier run wrote is appended to or overwritten.
+
+    :param path: the --output path
+    :param started: unix time of the run, now if omitted
+    """
+    stem, extension = os.path.splitext(path)
+    return f"{stem}_{time.strftime('%Y%m%d-%H%M%S', time.localtime(started))}{extension}"
@@ -0,0 +1,100 @@
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Set
+
+from config import SEEN_INDEX_PATH, SEEN_JOB_MAX_AGE_DAYS
+
+logger = logging.getLogger(__name__)
+
+
+class SeenJobIndex:
+    """
+    SQLite index of LinkedIn job ids (data-occludable-job-id) that have already
+    been processed, with their verdict and when it was recorded.
+
+    Entries are per CV profile fingerprint, so a changed CV still gets its own
+    verdicts, and expire after `max_age_days` so reposted jobs are checked again.
+    Prefilter rejections are stored with the filter's settings and only count as seen
+    while those settings are unchanged, so a lower --min-score reconsiders them.
+    With `ignore` set nothing is reported as seen, but new verdicts are still stored.
+    """
+
+    MATCH = "match"
+    NO_MATCH = "no_match"
+    FILTERED = "filtered"  # rejected by the local prefilter, no LLM call was made
+
+    def __init__(
+        self,
+        path: str = SEEN_INDEX_PATH,
+        max_age_days: float = SEEN_JOB_MAX_AGE_DAYS,
+        ignore: bool = False,
+    ):
+        self.path = path
+        self.max_age_seconds = max_age_days * 86400
+        self.ignore = ignore
+        self.skipped = 0
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS seen_jobs (
+                job_id TEXT NOT NULL,
+                profile_key TEXT NOT NULL,
+                verdict TEXT NOT NULL,
+                seen_at REAL NOT NULL,
+                filter_key TEXT NOT NULL DEFAULT '',
+                PRIMARY KEY (job_id, profile_key)
+            )
+            """
+        )
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(seen_jobs)")}
+        if "filter_key" not in columns:
+            # indexes written before filter_key existed, their FILTERED rows never match a filter again
+            self._conn.execute("ALTER TABLE seen_jobs ADD COLUMN filter_key TEXT NOT NULL DEFAULT ''")
+        self._conn.execute(
+            "DELETE FROM seen_jobs WHERE seen_at < ?", (time.time() - self.max_age_seconds,)
+        )
+        self._conn.commit()
+
+    def load(self, profile_key: str, filter_key: str = "") -> Set[str]:
+        """
+        Every unexpired job id for the profile, loaded once so per-card checks don't touch disk.
+
+        :param filter_key: RelevanceFilter.settings_key() of this run, jobs the prefilter rejected
+            under other settings are left out
+        """
+        if self.ignore:
+            return set()
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT job_id FROM seen_jobs WHERE profile_key = ? AND seen_at >= ? "
+                "AND (verdict != ? OR filter_key = ?)",
+                (profile_key, time.time() - self.max_age_seconds, self.FILTERED, filter_key),
+            ).fetchall()
+        return {row[0] for row in rows}
+
+    def record(self, job_id: str, profile_key: str, verdict: str, filter_key: str = "") -> None:
+        """
+        :param filter_key: with FILTERED, the settings of the prefilter that rejected the job
+        """
+        if not job_id:
+            return
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO seen_jobs (job_id, profile_key, verdict, seen_at, filter_key) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (job_id, profile_key, verdict, time.time(), filter_key),
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
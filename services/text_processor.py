@@ -1,11 +1,10 @@
 import logging
-import nltk
-from nltk.tokenize import sent_tokenize
-from typing import List
+from typing import Dict, List, Set
 from abc import ABC, abstractmethod
 import re
 
-from rapidfuzz import fuzz
+import numpy as np
+from rapidfuzz import fuzz, process
 
 
 logger = logging.getLogger(__name__)
@@ -21,16 +20,38 @@ class Processor(ABC):
 #sentence processor class that parses pdf text into sentences with nltk, rather useless but may still have unseen perks for later
 class SentenceProcessor(Processor):
     def __init__(self):
-        nltk.download("punkt")
-        logger.debug("NLTK punkt tokenizer downloaded (if not already).")
+        # nltk is slow to import and only needed here, the punkt data is looked up locally and
+        # never downloaded during a run: install it once with `python -m nltk.downloader punkt`
+        import nltk
+
+        try:
+            nltk.data.find("tokenizers/punkt")
+        except LookupError:
+            raise RuntimeError(
+                "NLTK punkt tokenizer data not found, install it with: python -m nltk.downloader punkt"
+            ) from None
+        logger.debug("NLTK punkt tokenizer found.")
 
     def tokenise(self, text: str) -> List[str]:
+        from nltk.tokenize import sent_tokenize
+
         sentences = sent_tokenize(text)
         logger.debug(f"Tokenized text into {len(sentences)} sentences.")
         return sentences
 
 
 
+def _compile_headings(headings: List[str]) -> "re.Pattern":
+    # same matches as the plain "(A|B|...)" alternation with IGNORECASE, when run on lowercased text:
+    # alternatives are grouped by first letter so the engine tries one group per position instead
+    # of every heading, their order within a group (which decides the match) is kept
+    groups: Dict[str, List[str]] = {}
+    for heading in headings:
+        heading = heading.lower()
+        groups.setdefault(heading[0], []).append(re.escape(heading[1:]))
+    return re.compile(r"(" + r"|".join(f"{first}(?:{'|'.join(rest)})" for first, rest in groups.items()) + r")")
+
+
 #section processor class that tokenises text based off keywords, since I only want to make one LLM call before running agent
 class SectionProcessor(Processor):
 
@@ -53,7 +74,7 @@ class SectionProcessor(Processor):
         r"PROFESSIONAL SUMMARY",
         r"PERSONAL STATEMENT",
         r"QUALIFICATIONS",
-        r"INTERESTS AND ACTIVITIES"
+        r"INTERESTS AND ACTIVITIES",
         r"INTEREST",
         r"ACTIVITES",
         r"ADDITIONAL INFORMATION",
@@ -73,6 +94,13 @@ class SectionProcessor(Processor):
 
     #regex pattern to match any of the keywords with OR | operator
     heading_pattern = r"(" + r"|".join(SEC_HEADINGS) + r")"
+    # the compiled, faster equivalent used by tokenise, matched against the lowercased text
+    heading_regex = _compile_headings(SEC_HEADINGS)
+
+    # lines with more words than this are never fuzzy matched to a heading
+    MAX_HEADING_WORDS = 5
+    # fuzz.ratio a line needs against a found heading to be treated as one
+    FUZZY_HEADING_SCORE = 80
 
     def __init__(self):
         logger.debug("SectionProcessor initialised.")
@@ -117,45 +145,26 @@ class SectionProcessor(Processor):
         return list(set(recognised_headings))
 
     def _extract_known_headings(self, text: str) -> List[str]:
-        # Find all headings in the text using the regex pattern
-        matches = re.findall(self.heading_pattern, text, flags=re.IGNORECASE)
-        normalise_matches = [m.upper() for m in matches]
-
-        return list(set(normalise_matches))
+        # Find all headings in the text using the precompiled pattern (headings are ASCII, so
+        # lowercasing the text once is cheaper than a case-insensitive match at every position)
+        return list({m.upper() for m in self.heading_regex.findall(text.lower())})
 
     def _split_by_headings(self, text: str, headings: set) -> List[dict]:
-        # We split the text by the given set of headings (intersection).
+        # We split the text into sections at every line that is (almost) exactly one of the headings.
         if not headings:
             return [{"heading": "MISC", "content": text.strip()}]
 
-        # Build a combined regex pattern from the headings set
-        safe_headings = [re.escape(h) for h in headings]
-        combined_pattern = r"(" + r"|".join(safe_headings) + r")"
-
-        # We'll split with a capturing group so we can retain which heading was matched.
-        parts = re.split(combined_pattern, text, flags=re.IGNORECASE)
+        lines = text.splitlines()
+        heading_lines = self._find_heading_lines(lines, headings)
 
         sections = []
 
         current_heading = "MISC"
         current_content = []
 
-        lines = text.splitlines()
-        for line in lines:
-            stripped_line = line.strip()
-            if not stripped_line:
-                # blank line => just accumulate it
-                current_content.append(line)
-                continue
-
-            # Check if the line is (almost) exactly a heading.
-            # We'll do a quick check: uppercase the line, then check if in set
-            # or if it's fuzzy close to a heading in `headings`.
-            line_upper = stripped_line.upper()
-
-            # We can do an exact check or fuzzy. Let's do both:
-            if line_upper in headings:
-                # It's an exact heading line => close the old section
+        for index, line in enumerate(lines):
+            if index in heading_lines:
+                # It's a heading line => close the old section
                 if current_content:
                     sections.append(
                         {
@@ -166,25 +175,10 @@ class SectionProcessor(Processor):
                     current_content = []
 
                 # Update heading
-                current_heading = line_upper
-
+                current_heading = line.strip().upper()
             else:
-                if self._is_line_fuzzy_heading_candidate(stripped_line, headings):
-                    # finalize old section
-                    if current_content:
-                        sections.append(
-                            {
-                                "heading": current_heading,
-                                "content": "\n".join(current_content).strip(),
-                            }
-                        )
-                        current_content = []
-
-                    # update heading
-                    current_heading = stripped_line.upper()
-                else:
-                    # just normal content
-                    current_content.append(line)
+                # just normal content (blank lines included)
+                current_content.append(line)
 
         # end of file => finalize last chunk
         if current_content:
@@ -199,16 +193,35 @@ class SectionProcessor(Processor):
         final_sections = [sec for sec in sections if sec["content"]]
         return final_sections
 
-    def _is_line_fuzzy_heading_candidate(self, line: str, headings: set) -> bool:
-        # Fallback fuzzy match for lines that are near a heading but not exactly spelled the same.
-        words = line.split()
-        # If it's too long, let's assume it's not a heading
-        if len(words) > 5:
-            return False
-
-        # Fuzzy match against each heading in the set
-        for h in headings:
-            score = fuzz.ratio(line.lower(), h.lower())
-            if score > 80:
-                return True
-        return False
+    def _find_heading_lines(self, lines: List[str], headings: set) -> Set[int]:
+        """
+        Indices of the lines that start a section: an exact (case-insensitive) heading, or a
+        short line close to one. All short lines are fuzzy matched against all headings in
+        a single rapidfuzz cdist call instead of one fuzz.ratio call per line and heading.
+        """
+        heading_lines = set()
+        fuzzy_indices = []
+        fuzzy_lines = []
+
+        for index, line in enumerate(lines):
+            stripped_line = line.strip()
+            if not stripped_line:
+                continue
+            if stripped_line.upper() in headings:
+                heading_lines.add(index)
+            elif len(stripped_line.split()) <= self.MAX_HEADING_WORDS:
+                # fallback fuzzy match for lines near a heading but not spelled exactly the same
+                fuzzy_indices.append(index)
+                fuzzy_lines.append(stripped_line.lower())
+
+        if fuzzy_lines:
+            scores = process.cdist(
+                fuzzy_lines,
+                [h.lower() for h in headings],
+                scorer=fuzz.ratio,
+                dtype=np.float64,
+            )
+            close = (scores > self.FUZZY_HEADING_SCORE).any(axis=1)
+            heading_lines.update(index for index, is_close in zip(fuzzy_indices, close) if is_close)
+
+        return heading_lines
@@ -0,0 +1,166 @@
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from config import (
+    VERDICT_CACHE_PATH,
+    VERDICT_CACHE_TTL_HOURS,
+    VERDICT_CACHE_MAX_ENTRIES,
+)
+from nav.job_prompt import PROMPT_DIGEST, PROMPT_VERSION
+
+logger = logging.getLogger(__name__)
+
+
+class VerdictCache:
+    """
+    SQLite backed cache of LLM job verdicts.
+
+    Entries are keyed on the CV profile fingerprint, the job prompt (PROMPT_VERSION and a
+    hash of its templates), the model that gave the verdict and the job markdown, so a new
+    CV or an edited prompt is evaluated afresh (e.g. by rematch.py). They expire
+    after `ttl_hours` and the least recently used ones are evicted once the table
+    grows past `max_entries`. With `bypass` set lookups always miss but fresh
+    verdicts are still written, so a bypassed run refreshes the cache.
+    """
+
+    # evicting needs a COUNT(*) over the table, so only do it every N writes
+    EVICT_EVERY = 64
+
+    def __init__(
+        self,
+        path: str = VERDICT_CACHE_PATH,
+        ttl_hours: float = VERDICT_CACHE_TTL_HOURS,
+        max_entries: int = VERDICT_CACHE_MAX_ENTRIES,
+        bypass: bool = False,
+    ):
+        self.path = path
+        self.ttl_seconds = ttl_hours * 3600
+        self.max_entries = max_entries
+        self.bypass = bypass
+
+        self.hits = 0
+        self.misses = 0
+        self._writes = 0
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # the same cache is shared between evaluation threads, sqlite calls are serialised by the lock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS verdicts (
+                key TEXT PRIMARY KEY,
+                verdict TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_verdicts_accessed ON verdicts(accessed_at)")
+        self._conn.commit()
+        self._evict()
+
+    @staticmethod
+    def make_key(cv_profile, job_listing: str, model: str) -> str:
+        """
+        :param model: the model that gives (or gave) the verdict, one model's verdicts never answer for another
+        """
+        # whitespace in the scraped markdown shifts between page loads, so it is collapsed before hashing
+        normalised_job = " ".join(job_listing.split())
+        digest = hashlib.sha256()
+        digest.update(cv_profile.fingerprint().encode("utf-8"))
+        digest.update(f"\0v{PROMPT_VERSION}:{PROMPT_DIGEST}\0{model}\0".encode("utf-8"))
+        digest.update(normalised_job.encode("utf-8"))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        return self.get_first([key])
+
+    def get_first(self, keys: List[str]) -> Optional[Dict[str, Any]]:
+        """
+        The verdict under the first of `keys` that has a fresh one, counted as one hit or miss.
+        """
+        if self.bypass:
+            with self._lock:
+                self.misses += 1
+            return None
+
+        now = time.time()
+        with self._lock:
+            for key in keys:
+                row = self._conn.execute(
+                    "SELECT verdict, created_at FROM verdicts WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None and now - row[1] <= self.ttl_seconds:
+                    break
+            else:
+                self.misses += 1
+                return None
+
+            self._conn.execute("UPDATE verdicts SET accessed_at = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self.hits += 1
+
+        return json.loads(row[0])
+
+    def set(self, key: str, verdict: Dict[str, Any]) -> None:
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO verdicts (key, verdict, created_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, json.dumps(verdict), now, now),
+            )
+            self._conn.commit()
+            # counters are shared by the evaluation threads, like the connection
+            self._writes += 1
+            if self._writes % self.EVICT_EVERY == 0:
+                self._evict_locked()
+
+    def purge(self) -> None:
+        # drop every cached verdict
+        with self._lock:
+            self._conn.execute("DELETE FROM verdicts")
+            self._conn.commit()
+        logger.info(f"Purged verdict cache: {self.path}")
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            hits, misses = self.hits, self.misses
+        total = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / total if total else 0.0,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _evict(self) -> None:
+        with self._lock:
+            self._evict_locked()
+
+    def _evict_locked(self) -> None:
+        # drop expired entries first, then the least recently used ones above the size bound
+        self._conn.execute(
+            "DELETE FROM verdicts WHERE created_at < ?", (time.time() - self.ttl_seconds,)
+        )
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM verdicts").fetchone()
+        overflow = count - self.max_entries
+        if overflow > 0:
+            self._conn.execute(
+                "DELETE FROM verdicts WHERE key IN "
+                "(SELECT key FROM verdicts ORDER BY accessed_at ASC LIMIT ?)",
+                (overflow,),
+            )
+        self._conn.commit()